@@ -31,6 +31,8 @@ The main concepts with this API are:
 from pkg_resources import get_distribution
 __version__ = get_distribution('google-cloud-bigquery').version
 
+from google.cloud.bigquery.batcher import InsertRowsBatcher
+from google.cloud.bigquery.cache import QueryCache
 from google.cloud.bigquery.client import Client
 from google.cloud.bigquery.dataset import AccessEntry
 from google.cloud.bigquery.dataset import Dataset
@@ -59,6 +61,7 @@ from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
 from google.cloud.bigquery.job import WriteDisposition
+from google.cloud.bigquery.profile import QueryProfile
 from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
@@ -78,6 +81,8 @@ __all__ = [
     # Queries
     'QueryJob',
     'QueryJobConfig',
+    'QueryCache',
+    'QueryProfile',
     'ArrayQueryParameter',
     'ScalarQueryParameter',
     'StructQueryParameter',
@@ -90,6 +95,7 @@ __all__ = [
     'Table',
     'TableReference',
     'Row',
+    'InsertRowsBatcher',
     'CopyJob',
     'CopyJobConfig',
     'ExtractJob',
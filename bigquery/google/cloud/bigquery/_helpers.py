@@ -221,13 +221,124 @@ def _row_tuple_from_json(row, schema):
     return tuple(row_data)
 
 
+# Converters for non-null scalar cells, which skip the ``_not_null`` check.
+_SCALAR_CELLDATA_FROM_JSON = {
+    'INTEGER': int,
+    'INT64': int,
+    'FLOAT': float,
+    'FLOAT64': float,
+    'NUMERIC': decimal.Decimal,
+}
+
+
+def _identity(value):
+    """Return ``value`` unchanged."""
+    return value
+
+
+def _nullable(converter):
+    """Wrap a converter so that it passes through null values."""
+    def convert(value):
+        if value is None:
+            return None
+        return converter(value)
+    return convert
+
+
+def _field_value_decoder(field):
+    """Compile a converter from a JSON cell value to a native value.
+
+    The schema field is inspected once, so that the returned callable does
+    not dispatch on the field type or mode for each cell it converts.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the cell values to convert.
+
+    :rtype: Callable[[object], object]
+    :returns: A function of a single cell's ``'v'`` value.
+    """
+    field_type = field.field_type
+    if field_type == 'RECORD':
+        convert = _record_decoder(field)
+    elif field_type in ('STRING', 'GEOGRAPHY'):
+        convert = _identity
+    elif field_type in _SCALAR_CELLDATA_FROM_JSON:
+        convert = _SCALAR_CELLDATA_FROM_JSON[field_type]
+        if field.mode == 'NULLABLE':
+            convert = _nullable(convert)
+    else:
+        converter = _CELLDATA_FROM_JSON[field_type]
+
+        def convert(value):
+            return converter(value, field)
+
+    if field.mode == 'REPEATED':
+        item_convert = convert
+
+        def convert(value):
+            return [item_convert(item['v']) for item in value]
+
+    return convert
+
+
+def _record_decoder(field):
+    """Compile a converter from a JSON ``RECORD`` value to a dict.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: A ``RECORD`` field.
+
+    :rtype: Callable[[object], dict]
+    :returns: A function of a single record cell's ``'v'`` value.
+    """
+    names = [subfield.name for subfield in field.fields]
+    converters = [_field_value_decoder(subfield) for subfield in field.fields]
+
+    def convert(value):
+        return {
+            name: subfield_convert(cell['v'])
+            for name, subfield_convert, cell
+            in zip(names, converters, value['f'])}
+
+    if field.mode == 'NULLABLE':
+        return _nullable(convert)
+    return convert
+
+
+def _row_tuple_decoder(schema):
+    """Compile a converter from JSON row data to a tuple of native values.
+
+    This is equivalent to calling :func:`_row_tuple_from_json` with
+    ``schema``, but looks up each field's converter only once, rather than
+    once per cell. Compile a decoder per schema and reuse it for every row.
+
+    :type schema: Sequence[:class:`~google.cloud.bigquery.schema.SchemaField`]
+    :param schema: The fields of the rows to convert.
+
+    :rtype: Callable[[dict], tuple]
+    :returns: A function of a single JSON response row.
+    """
+    converters = [_field_value_decoder(field) for field in schema]
+    # String columns need no conversion, so only visit the other columns.
+    indexed_converters = [
+        (index, convert) for index, convert in enumerate(converters)
+        if convert is not _identity]
+
+    def decode(row):
+        values = [cell['v'] for cell in row['f']]
+        for index, convert in indexed_converters:
+            values[index] = convert(values[index])
+        return tuple(values)
+
+    return decode
+
+
 def _rows_from_json(values, schema):
     """Convert JSON row data to rows with appropriate types."""
     from google.cloud.bigquery import Row
 
     field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index)
-            for r in values]
+    decode = _row_tuple_decoder(schema)
+    return [Row(decode(r), field_to_index) for r in values]
 
 
 def _int_to_json(value):
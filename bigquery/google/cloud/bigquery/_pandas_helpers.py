@@ -0,0 +1,212 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helper functions for connecting BigQuery and pandas."""
+
+import os
+
+import six
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+PARQUET_ROW_GROUP_SIZE = 65536
+"""int: Default number of DataFrame rows written per Parquet row group."""
+
+
+def _arrow_schema(dataframe, sample):
+    """Determine the Arrow schema used for every row group of a DataFrame.
+
+    The schema is inferred from a sample of rows, so that the whole
+    DataFrame is not converted at once. Columns which are null throughout
+    the sample take their type from their first non-null value instead.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame being written.
+        sample (pyarrow.Table): The first row group of ``dataframe``.
+
+    Returns:
+        pyarrow.Schema: The schema of the Parquet file.
+    """
+    fields = []
+    for field in sample.schema:
+        if field.type == pyarrow.null() and field.name in dataframe.columns:
+            column = dataframe[field.name]
+            valid_index = column.first_valid_index()
+            if valid_index is not None:
+                valid_rows = dataframe.loc[[valid_index], [field.name]]
+                field = pyarrow.Table.from_pandas(
+                    valid_rows, preserve_index=False).schema[0]
+        fields.append(field)
+    return pyarrow.schema(fields, metadata=sample.schema.metadata)
+
+
+class _ByteSink(object):
+    """Writable file-like object which appends to a ``bytearray``.
+
+    Args:
+        buffer (bytearray): The buffer to write to.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._bytes_written = 0
+        self.closed = False
+
+    def write(self, data):
+        self._buffer.extend(data)
+        self._bytes_written += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._bytes_written
+
+    def flush(self):
+        """No-op."""
+
+    def close(self):
+        self.closed = True
+
+
+class ParquetStream(object):
+    """Readable file-like object producing a DataFrame in Parquet format.
+
+    Row groups are converted and encoded on demand, as the stream is read,
+    so that at most one encoded row group (plus the last chunk read) is held
+    in memory, regardless of the size of the DataFrame.
+
+    Seeking is only supported back to the start of the last chunk read, which
+    is what a resumable upload needs to recover from a failed chunk.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to encode.
+        row_group_size (int):
+            (Optional) Number of rows per row group. Defaults to
+            :data:`PARQUET_ROW_GROUP_SIZE`.
+    """
+
+    def __init__(self, dataframe, row_group_size=PARQUET_ROW_GROUP_SIZE):
+        self._dataframe = dataframe
+        self._row_group_size = row_group_size
+        self._next_row = 0
+        self._schema = None
+        self._writer = None
+        self._finished = False
+        self._buffer = bytearray()
+        # The offset in the stream of the first byte in ``_buffer``.
+        self._buffer_start = 0
+        self._position = 0
+
+    def _write_next_row_group(self):
+        """Encode the next row group, or the file footer after the last."""
+        start = self._next_row
+        stop = start + self._row_group_size
+        rows = self._dataframe.iloc[start:stop]
+        self._next_row = stop
+
+        if self._writer is None:
+            sample = pyarrow.Table.from_pandas(rows)
+            self._schema = _arrow_schema(self._dataframe, sample)
+            self._writer = pyarrow.parquet.ParquetWriter(
+                _ByteSink(self._buffer), self._schema)
+
+        if len(rows) == 0:
+            self._writer.close()
+            self._finished = True
+            return
+
+        table = pyarrow.Table.from_pandas(rows, schema=self._schema)
+        # The pandas metadata describes each slice a little differently, but
+        # the writer requires every row group to match the file's schema.
+        table = table.replace_schema_metadata(self._schema.metadata)
+        self._writer.write_table(table)
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, encoding row groups as needed.
+
+        Args:
+            size (int):
+                (Optional) Maximum number of bytes to read. If negative,
+                read to the end of the stream.
+
+        Returns:
+            bytes: The data read; empty at the end of the stream.
+        """
+        # Only the data from the current position onward can be read again.
+        del self._buffer[:self._position - self._buffer_start]
+        self._buffer_start = self._position
+
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            self._write_next_row_group()
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Return the current position in the stream.
+
+        Returns:
+            int: The number of bytes read so far.
+        """
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position still buffered from the last read.
+
+        Args:
+            offset (int): The position to move to.
+            whence (int): (Optional) Must be :data:`os.SEEK_SET`.
+
+        Returns:
+            int: The new position in the stream.
+
+        Raises:
+            ValueError:
+                If the position is no longer buffered or ``whence`` is not
+                :data:`os.SEEK_SET`.
+        """
+        buffer_end = self._buffer_start + len(self._buffer)
+        if (whence != os.SEEK_SET or
+                not self._buffer_start <= offset <= buffer_end):
+            raise ValueError(
+                'Can only seek to a buffered position between {} and {}, '
+                'got {}.'.format(self._buffer_start, buffer_end, offset))
+        self._position = offset
+        return offset
+
+
+def dataframe_to_parquet_stream(dataframe):
+    """Encode a DataFrame as Parquet, to be read as a stream.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to encode.
+
+    Returns:
+        IO[bytes]:
+            A readable file-like object with the Parquet data. If
+            :mod:`pyarrow` is installed, the data is produced one row group
+            at a time as it is read. Otherwise the whole file is written to
+            memory with :meth:`pandas.DataFrame.to_parquet`.
+    """
+    if pyarrow is None:
+        buffer = six.BytesIO()
+        dataframe.to_parquet(buffer)
+        return buffer
+    return ParquetStream(dataframe)
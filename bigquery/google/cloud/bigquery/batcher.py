@@ -0,0 +1,497 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch rows for the BigQuery streaming insert API."""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import json
+import logging
+import operator
+import threading
+import time
+import uuid
+
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import TableReference
+
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_ROWS = 500
+"""int: Default maximum number of rows per ``insertAll`` request."""
+
+MAX_BYTES = 10 * 1024 * 1024
+"""int: Default maximum size, in bytes, of the rows in a request."""
+
+MAX_LATENCY = 1.0
+"""float: Default maximum time, in seconds, that a row waits to be sent."""
+
+MAX_WORKERS = 4
+"""int: Default maximum number of concurrent ``insertAll`` requests."""
+
+MAX_RETRIES = 3
+"""int: Default maximum number of times a failed row is re-sent."""
+
+RETRY_DELAY = 0.5
+"""float: Default time, in seconds, before failed rows are first re-sent."""
+
+_MAX_RETRY_DELAY = 30.0
+"""Longest time, in seconds, before failed rows are re-sent."""
+
+_RETRYABLE_REASONS = frozenset([
+    'backendError',
+    'internalError',
+    'stopped',
+    'timeout',
+])
+"""Row error reasons which do not indicate a problem with the row data."""
+
+
+_PendingRow = collections.namedtuple(
+    '_PendingRow', ['info', 'size', 'result', 'index', 'attempt'])
+
+
+class _InsertResult(object):
+    """Collect the outcome of the rows passed to one ``insert_rows*`` call.
+
+    Args:
+        num_rows (int): The number of rows passed to the call.
+    """
+
+    def __init__(self, num_rows):
+        self.future = concurrent.futures.Future()
+        self._remaining = num_rows
+        self._errors = []
+        self._lock = threading.Lock()
+        self._claimed = None
+        if not num_rows:
+            self.future.set_result([])
+
+    def _claim(self):
+        """Whether the future can be resolved, i.e. it was not cancelled.
+
+        Once claimed, the future can no longer be cancelled. Must be called
+        with ``_lock`` held.
+        """
+        if self._claimed is None:
+            self._claimed = self.future.set_running_or_notify_cancel()
+        return self._claimed and not self.future.done()
+
+    def row_done(self, index, errors=None):
+        """Record that a row was sent, with or without errors.
+
+        Args:
+            index (int): The index of the row in the call.
+            errors (Sequence[dict]):
+                (Optional) The errors reported for the row.
+        """
+        with self._lock:
+            if errors:
+                self._errors.append({'index': index, 'errors': errors})
+            self._remaining -= 1
+            if self._remaining == 0 and self._claim():
+                self._errors.sort(key=operator.itemgetter('index'))
+                self.future.set_result(self._errors)
+
+    def set_exception(self, exception):
+        """Fail the call because a request for some of its rows failed.
+
+        Args:
+            exception (Exception): The error raised by the request.
+        """
+        with self._lock:
+            if self._claim():
+                self.future.set_exception(exception)
+
+
+class _TableBatch(object):
+    """Rows waiting to be sent to a single table.
+
+    Args:
+        table (google.cloud.bigquery.table.TableReference):
+            The destination table.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.rows = []
+        self.size = 0
+        self.created = time.time()
+
+
+class InsertRowsBatcher(object):
+    """Accumulate rows for streaming inserts and send them in the background.
+
+    Rows are grouped per table and sent with ``tabledata.insertAll`` once a
+    table's pending rows reach ``max_rows`` or ``max_bytes``, or have waited
+    ``max_latency`` seconds. Up to ``max_workers`` requests run concurrently.
+    Rows which fail for transient reasons (reported in ``insertErrors``) are
+    queued again, with their original insert IDs, so that only those rows are
+    re-sent. They are queued after a delay which doubles with each attempt,
+    without holding up a worker.
+
+    Example:
+        >>> from google.cloud import bigquery
+        >>> client = bigquery.Client()
+        >>> table = client.get_table(client.dataset('my_dataset').table('t'))
+        >>> with bigquery.InsertRowsBatcher(client) as batcher:
+        ...     future = batcher.insert_rows(table, [(u'Phred', 32)])
+        >>> future.result()
+        []
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send the requests.
+        max_rows (int):
+            (Optional) Maximum number of rows per request. Defaults to
+            :data:`MAX_ROWS`.
+        max_bytes (int):
+            (Optional) Maximum JSON size of the rows in a request. Defaults to
+            :data:`MAX_BYTES`.
+        max_latency (float):
+            (Optional) Maximum time, in seconds, before pending rows are sent.
+            Defaults to :data:`MAX_LATENCY`. If :data:`None`, rows are only
+            sent when a size limit is reached or on :meth:`flush`.
+        max_workers (int):
+            (Optional) Maximum number of concurrent requests. Defaults to
+            :data:`MAX_WORKERS`.
+        max_retries (int):
+            (Optional) Maximum number of times a row is re-sent after a
+            transient row error. Defaults to :data:`MAX_RETRIES`.
+        retry_delay (float):
+            (Optional) Time, in seconds, before rows are first re-sent after
+            a transient row error. It doubles with each further attempt.
+            Defaults to :data:`RETRY_DELAY`.
+        skip_invalid_rows (bool):
+            (Optional) Insert all valid rows of a request, even if invalid
+            rows exist.
+        ignore_unknown_values (bool):
+            (Optional) Accept rows that contain values that do not match the
+            schema.
+        retry (:class:`google.api_core.retry.Retry`):
+            (Optional) How to retry each ``insertAll`` request.
+    """
+
+    def __init__(self, client, max_rows=MAX_ROWS, max_bytes=MAX_BYTES,
+                 max_latency=MAX_LATENCY, max_workers=MAX_WORKERS,
+                 max_retries=MAX_RETRIES, skip_invalid_rows=None,
+                 ignore_unknown_values=None, retry=DEFAULT_RETRY,
+                 retry_delay=RETRY_DELAY):
+        self._client = client
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._skip_invalid_rows = skip_invalid_rows
+        self._ignore_unknown_values = ignore_unknown_values
+        self._retry = retry
+
+        self._lock = threading.Lock()
+        # These members are shared with the worker and monitor threads;
+        # only access them with the lock held.
+        self._batches = collections.OrderedDict()
+        self._in_flight = set()
+        self._closed = False
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers)
+        self._wakeup = threading.Event()
+        self._thread = None
+        if max_latency is not None:
+            self._thread = threading.Thread(
+                name='Thread-InsertRowsBatcherMonitor', target=self._monitor)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert_rows(self, table, rows, selected_fields=None, row_ids=None):
+        """Queue rows to be inserted into a table.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            rows (Union[Sequence[Tuple], Sequence[dict]]):
+                Row data to be inserted, as for
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+            selected_fields (Sequence[ \
+                :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            ]):
+                The fields to send. Required if ``table`` is a
+                :class:`~google.cloud.bigquery.table.TableReference`.
+            row_ids (Sequence[str]):
+                (Optional) Unique ids, one per row being inserted. If omitted,
+                unique IDs are created.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolves, once every row has been sent, to one mapping per
+                row with insert errors, as returned by
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+
+        Raises:
+            ValueError: if table's schema is not set or the batcher is closed.
+        """
+        from google.cloud.bigquery.client import _rows_to_json
+
+        table = self._table_reference(table)
+        json_rows = _rows_to_json(table, rows, selected_fields)
+        return self.insert_rows_json(table, json_rows, row_ids=row_ids)
+
+    def insert_rows_json(self, table, json_rows, row_ids=None):
+        """Queue rows to be inserted without applying local type conversions.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            json_rows (Sequence[dict]):
+                Row data to be inserted. Keys must match the table schema
+                fields and values must be JSON-compatible representations.
+            row_ids (Sequence[str]):
+                (Optional) Unique ids, one per row being inserted. If omitted,
+                unique IDs are created.
+
+        Returns:
+            concurrent.futures.Future:
+                Resolves, once every row has been sent, to one mapping per
+                row with insert errors, as returned by
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+                The "index" key refers to the position in ``json_rows``.
+
+        Raises:
+            ValueError: if the batcher is closed.
+        """
+        table = self._table_reference(table)
+        result = _InsertResult(len(json_rows))
+        pending = []
+        for index, row in enumerate(json_rows):
+            if row_ids is not None:
+                insert_id = row_ids[index]
+            else:
+                insert_id = str(uuid.uuid4())
+            info = {'json': row, 'insertId': insert_id}
+            pending.append(_PendingRow(
+                info, len(json.dumps(info)), result, index, 0))
+
+        self._add_rows(table, pending)
+        return result.future
+
+    def flush(self):
+        """Send all pending rows and wait for every request to finish.
+
+        Rows re-queued because of transient errors are also sent before this
+        method returns.
+        """
+        while True:
+            with self._lock:
+                ready = list(self._batches.values())
+                self._batches.clear()
+            for batch in ready:
+                self._commit(batch)
+
+            with self._lock:
+                in_flight = list(self._in_flight)
+                if not in_flight and not self._batches:
+                    return
+            concurrent.futures.wait(in_flight)
+
+    def close(self):
+        """Send all pending rows and release the batcher's threads.
+
+        No rows can be inserted after the batcher is closed.
+        """
+        self.flush()
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown()
+
+    def _table_reference(self, table):
+        """Accept a table ID string, as the client methods do."""
+        if isinstance(table, str):
+            table = TableReference.from_string(
+                table, default_project=self._client.project)
+        return table
+
+    def _add_rows(self, table, rows):
+        """Append rows to the table's batch, sending any batch that fills.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+            ]):
+                The destination table.
+            rows (Sequence[_PendingRow]): The rows to add.
+        """
+        ready = []
+        with self._lock:
+            if self._closed:
+                raise ValueError('Cannot insert rows after close().')
+
+            batch = self._batches.get(table.path)
+            for row in rows:
+                if batch is not None and (
+                        len(batch.rows) >= self._max_rows or
+                        batch.size + row.size > self._max_bytes):
+                    ready.append(self._batches.pop(table.path))
+                    batch = None
+                if batch is None:
+                    batch = self._batches[table.path] = _TableBatch(table)
+                batch.rows.append(row)
+                batch.size += row.size
+
+            if batch is not None and (
+                    len(batch.rows) >= self._max_rows or
+                    batch.size >= self._max_bytes):
+                ready.append(self._batches.pop(table.path))
+
+        for batch in ready:
+            self._commit(batch)
+
+    def _commit(self, batch):
+        """Start sending a batch on the worker pool.
+
+        Args:
+            batch (_TableBatch): The rows to send.
+        """
+        future = self._executor.submit(self._send, batch)
+        with self._lock:
+            if not future.done():
+                self._in_flight.add(future)
+        future.add_done_callback(self._request_done)
+
+    def _request_done(self, future):
+        with self._lock:
+            self._in_flight.discard(future)
+
+    def _send(self, batch):
+        """Send a batch and record the outcome of each row.
+
+        Rows with only transient errors are queued again, until they have
+        been retried ``max_retries`` times. They are queued by a timer, so
+        that the worker is free meanwhile; :meth:`flush` waits for the timer
+        as for a request in flight.
+
+        Args:
+            batch (_TableBatch): The rows to send.
+        """
+        data = {'rows': [row.info for row in batch.rows]}
+        if self._skip_invalid_rows is not None:
+            data['skipInvalidRows'] = self._skip_invalid_rows
+        if self._ignore_unknown_values is not None:
+            data['ignoreUnknownValues'] = self._ignore_unknown_values
+
+        try:
+            # We can always retry, because every row has an insert ID.
+            response = self._client._call_api(
+                self._retry,
+                method='POST',
+                path='%s/insertAll' % (batch.table.path,),
+                data=data)
+        except Exception as exc:
+            _LOGGER.exception(
+                'Failed to insert %s rows into %s.',
+                len(batch.rows), batch.table.path)
+            for row in batch.rows:
+                row.result.set_exception(exc)
+            return
+
+        errors = {}
+        for error in response.get('insertErrors', ()):
+            errors[int(error['index'])] = error['errors']
+
+        retry_rows = []
+        for position, row in enumerate(batch.rows):
+            row_errors = errors.get(position)
+            if row_errors is None:
+                row.result.row_done(row.index)
+            elif (row.attempt < self._max_retries and all(
+                    error.get('reason') in _RETRYABLE_REASONS
+                    for error in row_errors)):
+                retry_rows.append(row._replace(attempt=row.attempt + 1))
+            else:
+                row.result.row_done(row.index, row_errors)
+
+        if retry_rows:
+            attempt = max(row.attempt for row in retry_rows)
+            delay = min(
+                self._retry_delay * 2 ** (attempt - 1), _MAX_RETRY_DELAY)
+            _LOGGER.debug(
+                'Re-sending %s rows to %s in %.1fs.',
+                len(retry_rows), batch.table.path, delay)
+            scheduled = concurrent.futures.Future()
+            with self._lock:
+                self._in_flight.add(scheduled)
+            timer = threading.Timer(
+                delay, self._requeue, (batch.table, retry_rows, scheduled))
+            timer.daemon = True
+            timer.start()
+
+    def _requeue(self, table, rows, scheduled):
+        """Queue rows again, once their retry delay has passed.
+
+        Args:
+            table (google.cloud.bigquery.table.TableReference):
+                The destination table.
+            rows (Sequence[_PendingRow]): The rows to re-send.
+            scheduled (concurrent.futures.Future):
+                Stands for the rows in ``_in_flight`` until they are queued.
+        """
+        try:
+            self._add_rows(table, rows)
+        finally:
+            with self._lock:
+                self._in_flight.discard(scheduled)
+            scheduled.set_result(None)
+
+    def _monitor(self):
+        """Send batches whose oldest row has waited ``max_latency``."""
+        # NOTE: This blocks; it runs in the monitor thread.
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                now = time.time()
+                ready = []
+                timeout = self._max_latency
+                for path, batch in list(self._batches.items()):
+                    age = now - batch.created
+                    if age >= self._max_latency:
+                        ready.append(self._batches.pop(path))
+                    else:
+                        timeout = min(timeout, self._max_latency - age)
+
+            for batch in ready:
+                self._commit(batch)
+
+            self._wakeup.wait(timeout)
@@ -0,0 +1,347 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of query results."""
+
+from __future__ import absolute_import
+
+import collections
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import six
+
+
+MAX_ENTRIES = 1000
+"""int: Default maximum number of results held in memory."""
+
+MAX_BYTES = 100 * 1024 * 1024
+"""int: Default maximum size, in bytes, of the results held in memory."""
+
+TTL = 3600.0
+"""float: Default time, in seconds, that a result stays in the cache."""
+
+_QUERY_TOKEN_RE = re.compile(
+    r"""
+    '''.*?''' | \"\"\".*?\"\"\"          # triple-quoted strings
+    | '(?:[^'\\]|\\.)*' | "(?:[^"\\]|\\.)*"  # quoted strings
+    | `(?:[^`\\]|\\.)*`                      # quoted identifiers
+    | (?:--|\#)[^\n]*\n? | /\*.*?\*/         # comments
+    | (?P<space>\s+)
+    """,
+    re.DOTALL | re.VERBOSE)
+
+
+def _normalize_query(query):
+    """Collapse insignificant whitespace in a SQL query.
+
+    Runs of whitespace outside of strings, quoted identifiers and comments
+    are replaced by a single space, so that queries which differ only in
+    their formatting share a cache entry.
+
+    Args:
+        query (str): The SQL query.
+
+    Returns:
+        str: The normalized query.
+    """
+    def replace(match):
+        if match.group('space') is not None:
+            return ' '
+        return match.group(0)
+
+    return _QUERY_TOKEN_RE.sub(replace, query).strip()
+
+
+def _is_cacheable(query_job):
+    """Whether the results of a query job may be cached.
+
+    Queries which write to a destination table, dry runs and queries which
+    opt out of the BigQuery cache with ``use_query_cache=False`` are never
+    cached.
+
+    Args:
+        query_job (google.cloud.bigquery.job.QueryJob): A new query job.
+
+    Returns:
+        bool: True if the job's results may be cached.
+    """
+    return (query_job.destination is None
+            and not query_job.dry_run
+            and query_job.use_query_cache is not False)
+
+
+class QueryCache(object):
+    """Least-recently-used cache of query results.
+
+    Pass an instance as the ``query_cache`` argument of
+    :class:`~google.cloud.bigquery.client.Client` to have
+    :meth:`~google.cloud.bigquery.client.Client.query` reuse the results of
+    an earlier, identical query instead of starting a new job.
+
+    Results are keyed by the query text, with insignificant whitespace
+    removed, and the query's configuration, including its parameters. A
+    cached result is only used if none of the tables referenced by the
+    query have changed since, as shown by their ``etag`` and modification
+    time. Results are only cached for ``SELECT`` statements, and only once
+    all of their rows have been read.
+
+    .. note::
+
+       Queries using non-deterministic functions, such as
+       ``CURRENT_TIMESTAMP()``, return the cached result until it expires.
+
+    Args:
+        max_entries (int):
+            (Optional) Maximum number of results held in memory. Defaults
+            to :data:`MAX_ENTRIES`.
+        max_bytes (int):
+            (Optional) Maximum size, in bytes, of the JSON row data held in
+            memory. Larger results are not cached. Defaults to
+            :data:`MAX_BYTES`.
+        ttl (float):
+            (Optional) Time, in seconds, after which a result is discarded,
+            even if the tables it references are unchanged. Defaults to
+            :data:`TTL`.
+        directory (str):
+            (Optional) Directory in which results are also stored as JSON
+            files, so that they can be shared between processes and survive
+            a restart. Results evicted from memory are reloaded from here.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES, ttl=TTL,
+                 directory=None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._directory = directory
+        self._entries = collections.OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self):
+        """int: Maximum size, in bytes, of the results held in memory."""
+        return self._max_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, query_job):
+        """Compute the cache key of a query job.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob): A new query job.
+
+        Returns:
+            str: A digest of the query, its configuration and location.
+        """
+        configuration = query_job._configuration.to_api_repr()
+        # Labels do not change the result of the query.
+        configuration.pop('labels', None)
+        configuration.get('query', {}).pop('query', None)
+        identity = {
+            'project': query_job.project,
+            'location': query_job.location,
+            'query': _normalize_query(query_job.query),
+            'configuration': configuration,
+        }
+        encoded = json.dumps(identity, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key):
+        """Look up a cached result.
+
+        Args:
+            key (str): The key returned by :meth:`key`.
+
+        Returns:
+            Optional[dict]:
+                The cached result, or :data:`None` if there is none or it has
+                expired. The result has the keys ``job`` (the job resource),
+                ``schema``, ``rows`` and ``tables`` (the referenced tables'
+                ``tableReference``, ``etag`` and ``lastModifiedTime``).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.pop(key)
+                self._total_bytes -= entry['size']
+
+        if entry is None:
+            entry = self._read(key)
+            if entry is None:
+                return None
+
+        if entry['expires'] <= time.time():
+            self.invalidate(key)
+            return None
+
+        self._remember(key, entry)
+        return entry['result']
+
+    def put(self, key, result):
+        """Add a result to the cache.
+
+        Args:
+            key (str): The key returned by :meth:`key`.
+            result (dict): The result, in the format returned by :meth:`get`.
+        """
+        entry = {
+            'expires': time.time() + self._ttl,
+            'result': result,
+            'size': len(json.dumps(result['rows'])),
+        }
+        if entry['size'] > self._max_bytes:
+            return
+        self.invalidate(key)
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def invalidate(self, key):
+        """Remove a result from the cache.
+
+        Args:
+            key (str): The key returned by :meth:`key`.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry['size']
+
+        if self._directory is not None:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all results from the cache, including those on disk."""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+
+        if self._directory is not None:
+            keys = [
+                name[:-len('.json')] for name in os.listdir(self._directory)
+                if name.endswith('.json')]
+        for key in keys:
+            self.invalidate(key)
+
+    def _remember(self, key, entry):
+        """Add an entry to memory, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = entry
+            self._total_bytes += entry['size']
+            while (len(self._entries) > self._max_entries
+                   or self._total_bytes > self._max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted['size']
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + '.json')
+
+    def _read(self, key):
+        """Read an entry from the directory, if there is one."""
+        if self._directory is None:
+            return None
+        try:
+            with io.open(self._path(key), 'r', encoding='utf-8') as file_obj:
+                return json.load(file_obj)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write(self, key, entry):
+        """Write an entry to the directory, replacing it atomically."""
+        if self._directory is None:
+            return
+        handle, temp_path = tempfile.mkstemp(
+            dir=self._directory, suffix='.tmp')
+        with io.open(handle, 'w', encoding='utf-8') as file_obj:
+            file_obj.write(six.text_type(json.dumps(entry)))
+        os.rename(temp_path, self._path(key))
+
+
+class _QueryResultRecorder(object):
+    """Wrap a row iterator's ``api_request`` to record the rows it fetches.
+
+    Once the last page has been fetched, ``on_complete`` is called with the
+    rows of every page. Recording stops if the rows grow larger than
+    ``max_bytes``, or if pages are fetched out of order, as they are when
+    pages are prefetched.
+
+    Args:
+        api_request (Callable): The row iterator's ``api_request``.
+        max_bytes (int): Maximum size, in bytes, of the JSON row data.
+        on_complete (Callable[[List[dict]], None]):
+            Called with the rows, in the ``tabledata.list`` format.
+    """
+
+    def __init__(self, api_request, max_bytes, on_complete):
+        self._api_request = api_request
+        self._max_bytes = max_bytes
+        self._on_complete = on_complete
+        self._rows = []
+        self._size = 0
+        self._recording = True
+
+    def __call__(self, *args, **kwargs):
+        response = self._api_request(*args, **kwargs)
+        if not self._recording:
+            return response
+
+        query_params = kwargs.get('query_params') or {}
+        if 'startIndex' in query_params:
+            self._recording = False
+            return response
+
+        rows = response.get('rows', ())
+        self._size += len(json.dumps(rows))
+        if self._size > self._max_bytes:
+            self._recording = False
+            self._rows = []
+            return response
+
+        self._rows.extend(rows)
+        if not response.get('pageToken'):
+            self._recording = False
+            self._on_complete(self._rows)
+        return response
+
+
+def _cached_rows_request(result):
+    """Make an ``api_request`` which serves a cached result as one page.
+
+    Args:
+        result (dict): A result returned by :meth:`QueryCache.get`.
+
+    Returns:
+        Callable: A replacement for ``Connection.api_request``.
+    """
+    rows = result['rows']
+
+    def api_request(*args, **kwargs):
+        return {
+            'rows': rows,
+            'totalRows': six.text_type(len(rows)),
+        }
+
+    return api_request
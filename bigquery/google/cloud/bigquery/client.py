@@ -17,9 +17,11 @@
 from __future__ import absolute_import
 
 import collections
+import concurrent.futures
 import functools
 import gzip
 import os
+import time
 import uuid
 
 import six
@@ -29,10 +31,13 @@ from google.resumable_media.requests import MultipartUpload
 from google.resumable_media.requests import ResumableUpload
 
 from google.api_core import page_iterator
+from google.api_core.exceptions import GoogleAPICallError
 import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery import cache
 from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
 from google.cloud.bigquery._helpers import _str_or_none
 from google.cloud.bigquery._http import Connection
@@ -42,6 +47,7 @@ from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery import job
 from google.cloud.bigquery.query import _QueryResults
 from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.schema import _build_schema_resource
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableListItem
 from google.cloud.bigquery.table import TableReference
@@ -62,6 +68,10 @@ _GENERIC_CONTENT_TYPE = u'*/*'
 _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
+_JOB_POLL_INITIAL_DELAY = 1.0
+_JOB_POLL_MAXIMUM_DELAY = 30.0
+_JOB_POLL_MULTIPLIER = 1.5
+_MIN_JOBS_TO_LIST = 3
 
 
 class Project(object):
@@ -113,6 +123,10 @@ class Client(ClientWithProject):
         default_query_job_config (google.cloud.bigquery.job.QueryJobConfig):
             (Optional) Default ``QueryJobConfig``.
             Will be merged into job configs passed into the ``query`` method.
+        query_cache (google.cloud.bigquery.cache.QueryCache):
+            (Optional) Cache of query results. If set, the ``query`` method
+            returns the completed job of an identical earlier query, with its
+            rows, when none of the tables it references have changed.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -126,12 +140,13 @@ class Client(ClientWithProject):
 
     def __init__(
             self, project=None, credentials=None, _http=None,
-            location=None, default_query_job_config=None):
+            location=None, default_query_job_config=None, query_cache=None):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http)
         self._connection = Connection(self)
         self._location = location
         self._default_query_job_config = default_query_job_config
+        self._query_cache = query_cache
 
     @property
     def location(self):
@@ -840,6 +855,179 @@ class Client(ClientWithProject):
             max_results=max_results,
             extra_params=extra_params)
 
+    def as_completed(self, jobs, timeout=None, retry=DEFAULT_RETRY):
+        """Wait for many jobs at once, yielding each job as it completes.
+
+        All outstanding jobs are polled from a single loop in the calling
+        thread, rather than each job polling on its own. Jobs in a project
+        with several outstanding jobs are refreshed together with one
+        ``jobs.list`` request; the rest are refreshed with ``jobs.get``.
+        The delay between polls grows while no job completes and is reset
+        whenever one does.
+
+        See
+        https://cloud.google.com/bigquery/docs/reference/rest/v2/jobs/list
+
+        Args:
+            jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+                The jobs to wait for. Jobs which have not been started yet
+                are started first.
+            timeout (float, optional):
+                How long (in seconds) to wait for all of the jobs.
+            retry (google.api_core.retry.Retry, optional):
+                How to retry the RPCs.
+
+        Yields:
+            google.cloud.bigquery.job._AsyncJob:
+                Each job, once it is done. Call the job's ``result()`` to
+                check whether it succeeded.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the jobs did not all complete in the given timeout.
+        """
+        pending = list(jobs)
+        for pending_job in pending:
+            if pending_job.state is None:
+                pending_job._begin(retry=retry)
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        delay = _JOB_POLL_INITIAL_DELAY
+
+        while True:
+            finished = [
+                pending_job for pending_job in pending
+                if pending_job.state == job._DONE_STATE]
+            pending = [
+                pending_job for pending_job in pending
+                if pending_job.state != job._DONE_STATE]
+            for finished_job in finished:
+                yield finished_job
+            if not pending:
+                return
+
+            if finished:
+                delay = _JOB_POLL_INITIAL_DELAY
+            sleep_for = delay
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise concurrent.futures.TimeoutError(
+                        '{} of the jobs did not complete in {} seconds.'
+                        .format(len(pending), timeout))
+                sleep_for = min(sleep_for, remaining)
+            time.sleep(sleep_for)
+            delay = min(delay * _JOB_POLL_MULTIPLIER, _JOB_POLL_MAXIMUM_DELAY)
+
+            self._refresh_jobs(pending, retry)
+
+    def wait_for_jobs(self, jobs, timeout=None, retry=DEFAULT_RETRY):
+        """Wait for all of the given jobs to complete.
+
+        See :meth:`as_completed` for how the jobs are polled.
+
+        Args:
+            jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+                The jobs to wait for. Jobs which have not been started yet
+                are started first.
+            timeout (float, optional):
+                How long (in seconds) to wait for all of the jobs.
+            retry (google.api_core.retry.Retry, optional):
+                How to retry the RPCs.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs, in the order given, all of them done.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the jobs did not all complete in the given timeout.
+        """
+        jobs = list(jobs)
+        for _ in self.as_completed(jobs, timeout=timeout, retry=retry):
+            pass
+        return jobs
+
+    def _refresh_jobs(self, jobs, retry):
+        """Refresh the state of outstanding jobs, listing them where possible.
+
+        Args:
+            jobs (List[google.cloud.bigquery.job._AsyncJob]):
+                The jobs to refresh.
+            retry (google.api_core.retry.Retry): How to retry the RPCs.
+        """
+        by_project = collections.OrderedDict()
+        for pending_job in jobs:
+            by_project.setdefault(pending_job.project, []).append(pending_job)
+
+        for project, project_jobs in by_project.items():
+            listable = [
+                pending_job for pending_job in project_jobs
+                if pending_job.created is not None]
+            if len(listable) < _MIN_JOBS_TO_LIST:
+                listable = []
+            listed = set(map(id, listable))
+            listed.difference_update(
+                map(id, self._refresh_listed_jobs(project, listable, retry)))
+            for pending_job in project_jobs:
+                if id(pending_job) not in listed:
+                    pending_job.reload(retry=retry)
+
+    def _refresh_listed_jobs(self, project, jobs, retry):
+        """Refresh jobs from a single ``jobs.list`` request.
+
+        Jobs are listed by creation time, so only the window between the
+        oldest and newest job is fetched. Jobs owned by another user do not
+        appear in the listing.
+
+        Args:
+            project (str): Project ID which owns the jobs.
+            jobs (List[google.cloud.bigquery.job._AsyncJob]):
+                Jobs with a known creation time.
+            retry (google.api_core.retry.Retry): How to retry the RPC.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs which were not found in the listing.
+        """
+        if not jobs:
+            return []
+
+        by_id = {}
+        for pending_job in jobs:
+            by_id.setdefault(pending_job.job_id, []).append(pending_job)
+
+        created = [pending_job.created for pending_job in jobs]
+        extra_params = {
+            'projection': 'full',
+            'minCreationTime': _str_or_none(
+                google.cloud._helpers._millis_from_datetime(min(created))),
+            # Round up, as creation times have sub-millisecond precision.
+            'maxCreationTime': _str_or_none(
+                google.cloud._helpers._millis_from_datetime(max(created)) + 1),
+        }
+        iterator = page_iterator.HTTPIterator(
+            client=self,
+            api_request=functools.partial(self._call_api, retry),
+            path='/projects/%s/jobs' % (project,),
+            item_to_value=_item_to_resource,
+            items_key='jobs',
+            extra_params=extra_params)
+
+        for resource in iterator:
+            job_id = resource.get('jobReference', {}).get('jobId')
+            for listed_job in by_id.pop(job_id, ()):
+                if resource.get('state') == job._DONE_STATE:
+                    listed_job._set_properties(resource)
+            if not by_id:
+                break
+
+        return [
+            pending_job for pending_job in jobs
+            if pending_job.job_id in by_id]
+
     def load_table_from_uri(
             self, source_uris, destination,
             job_id=None,
@@ -1042,9 +1230,14 @@ class Client(ClientWithProject):
             ImportError:
                 If a usable parquet engine cannot be found. This method
                 requires :mod:`pyarrow` to be installed.
+
+        .. note::
+
+            With :mod:`pyarrow` installed, the DataFrame is encoded one
+            Parquet row group at a time while it is uploaded, so the encoded
+            data never has to fit in memory all at once.
         """
-        buffer = six.BytesIO()
-        dataframe.to_parquet(buffer)
+        buffer = _pandas_helpers.dataframe_to_parquet_stream(dataframe)
 
         if job_config is None:
             job_config = job.LoadJobConfig()
@@ -1369,10 +1562,88 @@ class Client(ClientWithProject):
         job_ref = job._JobReference(job_id, project=project, location=location)
         query_job = job.QueryJob(
             job_ref, query, client=self, job_config=job_config)
+
+        if self._query_cache is not None and cache._is_cacheable(query_job):
+            cache_key = self._query_cache.key(query_job)
+            cached_job = self._get_cached_query_job(cache_key, retry)
+            if cached_job is not None:
+                return cached_job
+            query_job._query_cache_key = cache_key
+
         query_job._begin(retry=retry)
 
         return query_job
 
+    def _get_cached_query_job(self, cache_key, retry):
+        """Look up a cached query result, checking its tables are unchanged.
+
+        Args:
+            cache_key (str): The key of the query in the cache.
+            retry (google.api_core.retry.Retry): How to retry the RPCs.
+
+        Returns:
+            Optional[google.cloud.bigquery.job.QueryJob]:
+                The completed job of the cached query, which returns the
+                cached rows from ``result()``, or :data:`None`.
+        """
+        result = self._query_cache.get(cache_key)
+        if result is None:
+            return None
+
+        for cached_table in result['tables']:
+            table_ref = TableReference.from_api_repr(
+                cached_table['tableReference'])
+            try:
+                table = self.get_table(table_ref, retry=retry)
+            except GoogleAPICallError:
+                # Deleted, or not readable by the caller: run the query.
+                table = None
+            if table is None or _table_version(table) != cached_table:
+                self._query_cache.invalidate(cache_key)
+                return None
+
+        query_job = job.QueryJob.from_api_repr(result['job'], self)
+        query_job._cached_result = result
+        return query_job
+
+    def _cache_query_result(self, query_job, schema, rows):
+        """Add the result of a completed ``SELECT`` query to the cache.
+
+        The result is not cached if a referenced table has a streaming
+        buffer or was modified after the query started, since the rows may
+        not match the table's current version. It is not cached either if
+        the metadata of a referenced table cannot be read: this runs while
+        the caller reads the last page of rows, which must not fail.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                The completed query job.
+            schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+                The schema of the result.
+            rows (List[dict]): All rows, in the ``tabledata.list`` format.
+        """
+        if query_job.statement_type != 'SELECT':
+            return
+
+        tables = []
+        for table_ref in query_job.referenced_tables:
+            try:
+                table = self.get_table(table_ref)
+            except GoogleAPICallError:
+                return
+            if (table.streaming_buffer is not None
+                    or table.modified is None
+                    or table.modified > query_job.started):
+                return
+            tables.append(_table_version(table))
+
+        self._query_cache.put(query_job._query_cache_key, {
+            'job': query_job._properties,
+            'schema': {'fields': _build_schema_resource(schema)},
+            'rows': rows,
+            'tables': tables,
+        })
+
     def insert_rows(self, table, rows, selected_fields=None, **kwargs):
         """Insert rows into a table via the streaming API.
 
@@ -1418,32 +1689,7 @@ class Client(ClientWithProject):
             table = TableReference.from_string(
                 table, default_project=self.project)
 
-        if selected_fields is not None:
-            schema = selected_fields
-        elif isinstance(table, TableReference):
-            raise ValueError('need selected_fields with TableReference')
-        elif isinstance(table, Table):
-            if len(table.schema) == 0:
-                raise ValueError(_TABLE_HAS_NO_SCHEMA)
-            schema = table.schema
-        else:
-            raise TypeError('table should be Table or TableReference')
-
-        json_rows = []
-
-        for index, row in enumerate(rows):
-            if isinstance(row, dict):
-                row = _row_from_mapping(row, schema)
-            json_row = {}
-
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
-
-            json_rows.append(json_row)
-
+        json_rows = _rows_to_json(table, rows, selected_fields)
         return self.insert_rows_json(table, json_rows, **kwargs)
 
     def insert_rows_json(self, table, json_rows, row_ids=None,
@@ -1560,7 +1806,7 @@ class Client(ClientWithProject):
 
     def list_rows(self, table, selected_fields=None, max_results=None,
                   page_token=None, start_index=None, page_size=None,
-                  retry=DEFAULT_RETRY):
+                  retry=DEFAULT_RETRY, prefetch_pages=None):
         """List the rows of the table.
 
         See
@@ -1601,6 +1847,10 @@ class Client(ClientWithProject):
                 the iterator.
             retry (:class:`google.api_core.retry.Retry`):
                 (Optional) How to retry the RPC.
+            prefetch_pages (int):
+                (Optional) The number of pages to download concurrently while
+                the current page is consumed. This also bounds the number of
+                pages buffered in memory. Ignored when ``page_token`` is set.
 
         Returns:
             google.cloud.bigquery.table.RowIterator:
@@ -1641,10 +1891,64 @@ class Client(ClientWithProject):
             page_token=page_token,
             max_results=max_results,
             page_size=page_size,
-            extra_params=params)
+            extra_params=params,
+            prefetch_pages=prefetch_pages)
         return row_iterator
 
 
+def _rows_to_json(table, rows, selected_fields):
+    """Convert rows to the JSON representation used by ``insertAll``.
+
+    Args:
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+        ]):
+            The destination table for the row data.
+        rows (Union[Sequence[Tuple], Sequence[dict]]):
+            Row data, as passed to
+            :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+        selected_fields (Sequence[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+        ]):
+            The fields of the rows. Required if ``table`` is a
+            :class:`~google.cloud.bigquery.table.TableReference`.
+
+    Returns:
+        List[dict]: One JSON-compatible mapping per row.
+
+    Raises:
+        ValueError: if table's schema is not set
+    """
+    if selected_fields is not None:
+        schema = selected_fields
+    elif isinstance(table, TableReference):
+        raise ValueError('need selected_fields with TableReference')
+    elif isinstance(table, Table):
+        if len(table.schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        schema = table.schema
+    else:
+        raise TypeError('table should be Table or TableReference')
+
+    json_rows = []
+
+    for index, row in enumerate(rows):
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, schema)
+        json_row = {}
+
+        for field, value in zip(schema, row):
+            converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+            if converter is not None:  # STRING doesn't need converting
+                value = converter(value)
+            json_row[field.name] = value
+
+        json_rows.append(json_row)
+
+    return json_rows
+
+
 # pylint: disable=unused-argument
 def _item_to_project(iterator, resource):
     """Convert a JSON project to the native object.
@@ -1692,6 +1996,37 @@ def _item_to_job(iterator, resource):
     return iterator.client.job_from_resource(resource)
 
 
+def _table_version(table):
+    """Identify the version of a table used by a cached query result.
+
+    :type table: :class:`~google.cloud.bigquery.table.Table`
+    :param table: The table, as fetched from the API.
+
+    :rtype: dict
+    :returns: The table's reference, ``etag`` and ``lastModifiedTime``.
+    """
+    return {
+        'tableReference': table.reference.to_api_repr(),
+        'etag': table.etag,
+        'lastModifiedTime': table._properties.get('lastModifiedTime'),
+    }
+
+
+def _item_to_resource(iterator, resource):
+    """Return a JSON resource unchanged.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type resource: dict
+    :param resource: An item from the API response.
+
+    :rtype: dict
+    :returns: The resource.
+    """
+    return resource
+
+
 def _item_to_table(iterator, resource):
     """Convert a JSON table to the native object.
 
@@ -15,6 +15,8 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import itertools
+import re
 
 import six
 
@@ -34,6 +36,20 @@ Column = collections.namedtuple(
         'scale', 'null_ok',
     ])
 
+# Number of result pages downloaded ahead of the rows being fetched. Bounds
+# the rows held in memory to this many pages of ``arraysize`` rows.
+_PREFETCH_PAGES = 2
+
+MAX_STATEMENT_SIZE = 1024 * 1024
+"""int: Default maximum length of a statement built by ``executemany``."""
+
+# BigQuery allows at most 10,000 parameters in a query.
+_MAX_QUERY_PARAMETERS = 10000
+
+_INSERT_VALUES_RE = re.compile(
+    r'^(?P<prefix>\s*INSERT\b.*?\bVALUES\s*)(?P<values>\(.*\))\s*;?\s*$',
+    re.IGNORECASE | re.DOTALL)
+
 
 class Cursor(object):
     """DB-API Cursor to Google BigQuery.
@@ -53,9 +69,17 @@ class Cursor(object):
         self.arraysize = 1
         self._query_data = None
         self._query_job = None
+        self._rows_iter = None
 
     def close(self):
-        """No-op."""
+        """Release the resources of the last query's results, if any."""
+        self._close_rows_iter()
+
+    def _close_rows_iter(self):
+        """Stop downloading the rows of the last query ahead of fetches."""
+        if self._rows_iter is not None:
+            self._rows_iter.close()
+            self._rows_iter = None
 
     def _set_description(self, schema):
         """Set description from schema.
@@ -132,10 +156,6 @@ class Cursor(object):
         :param job_id: (Optional) The job_id to use. If not set, a job ID
             is generated at random.
         """
-        self._query_data = None
-        self._query_job = None
-        client = self.connection._client
-
         # The DB-API uses the pyformat formatting, since the way BigQuery does
         # query parameters was not one of the standard options. Convert both
         # the query and the parameters to the format expected by the client
@@ -143,6 +163,28 @@ class Cursor(object):
         formatted_operation = _format_operation(
             operation, parameters=parameters)
         query_parameters = _helpers.to_query_parameters(parameters)
+        self._execute_query(
+            formatted_operation, query_parameters, job_id=job_id)
+
+    def _execute_query(self, formatted_operation, query_parameters,
+                       job_id=None):
+        """Run a query and wait for it to finish.
+
+        :type formatted_operation: str
+        :param formatted_operation: A query with BigQuery-style parameters.
+
+        :type query_parameters:
+            List[google.cloud.bigquery.query._AbstractQueryParameter]
+        :param query_parameters: The query parameters.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use. If not set, a job ID
+            is generated at random.
+        """
+        self._close_rows_iter()
+        self._query_data = None
+        self._query_job = None
+        client = self.connection._client
 
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
@@ -160,17 +202,46 @@ class Cursor(object):
         self._set_rowcount(query_results)
         self._set_description(query_results.schema)
 
-    def executemany(self, operation, seq_of_parameters):
+    def executemany(self, operation, seq_of_parameters,
+                    max_statement_size=None):
         """Prepare and execute a database operation multiple times.
 
+        An ``INSERT ... VALUES (...)`` statement is run as a few multi-row
+        ``INSERT`` statements, with one row of ``VALUES`` per set of
+        parameters, rather than as one query job per set of parameters.
+        Other statements are executed once per set of parameters.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
+
+        :type max_statement_size: int
+        :param max_statement_size:
+            (Optional) Maximum length of each multi-row ``INSERT`` statement.
+            Defaults to :data:`MAX_STATEMENT_SIZE`.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        match = _INSERT_VALUES_RE.match(operation)
+        # Parameters are only supported in the VALUES clause.
+        if match is None or '%' in match.group('prefix').replace('%%', ''):
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        if max_statement_size is None:
+            max_statement_size = MAX_STATEMENT_SIZE
+
+        rowcount = 0
+        for formatted_operation, values in _coalesce_insert_values(
+                match.group('prefix').replace('%%', '%'),
+                match.group('values'), seq_of_parameters,
+                max_statement_size):
+            self._execute_query(
+                formatted_operation,
+                _helpers.to_query_parameters_list(values))
+            rowcount += self.rowcount
+        self.rowcount = rowcount
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
@@ -189,12 +260,16 @@ class Cursor(object):
             return
 
         if self._query_data is None:
+            # Rows are streamed a page at a time, with a bounded number of
+            # pages downloaded ahead. Each row is only decoded when fetched.
             client = self.connection._client
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize
+                page_size=self.arraysize,
+                prefetch_pages=_PREFETCH_PAGES,
             )
+            self._rows_iter = rows_iter
             self._query_data = iter(rows_iter)
 
     def fetchone(self):
@@ -218,8 +293,9 @@ class Cursor(object):
 
         .. note::
             The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Set the ``arraysize`` attribute before the first fetch to set the
+            number of rows per request. Results are streamed, so only a few
+            pages of ``arraysize`` rows are held in memory at a time.
 
         :type size: int
         :param size:
@@ -235,14 +311,7 @@ class Cursor(object):
             size = self.arraysize
 
         self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        return list(itertools.islice(self._query_data, size))
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -317,6 +386,100 @@ def _format_operation_dict(operation, parameters):
         raise exceptions.ProgrammingError(exc)
 
 
+class _PositionalParameters(object):
+    """Mapping which turns named parameters into positional parameters.
+
+    Formatting an operation with this mapping replaces each
+    ``%(namedparam)s`` with ``?`` and records the value of each parameter,
+    in the order in which they appear.
+
+    :type parameters: Mapping[str, Any]
+    :param parameters: Dictionary of parameter values.
+    """
+
+    def __init__(self, parameters):
+        self._parameters = parameters
+        self.values = []
+
+    def __getitem__(self, name):
+        self.values.append(self._parameters[name])
+        return '?'
+
+
+def _format_values_positional(values, parameters):
+    """Formats a row of ``VALUES`` with positional parameters.
+
+    :type values: str
+    :param values: A row of values, such as ``(%s, %s)``.
+
+    :type parameters: Mapping[str, Any] or Sequence[Any]
+    :param parameters: Parameter values.
+
+    :rtype: Tuple[str, List[Any]]
+    :returns: The formatted row and its parameter values, in order.
+    :raises: :class:`~google.cloud.bigquery.dbapi.ProgrammingError`
+        if a parameter used in the operation is not found in the
+        ``parameters`` argument.
+    """
+    if parameters is None:
+        return values.replace('%%', '%'), []
+
+    if isinstance(parameters, collections.Mapping):
+        positional = _PositionalParameters(parameters)
+        try:
+            return values % positional, positional.values
+        except KeyError as exc:
+            raise exceptions.ProgrammingError(exc)
+
+    return _format_operation_list(values, parameters), list(parameters)
+
+
+def _coalesce_insert_values(prefix, values, seq_of_parameters,
+                            max_statement_size):
+    """Build multi-row ``INSERT`` statements from many sets of parameters.
+
+    :type prefix: str
+    :param prefix: The statement up to and including ``VALUES``.
+
+    :type values: str
+    :param values: The row of values, such as ``(%s, %s)``.
+
+    :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
+    :param seq_of_parameters: Sequence of many sets of parameter values.
+
+    :type max_statement_size: int
+    :param max_statement_size:
+        Maximum length of each statement, unless a single row is longer.
+
+    :rtype: Iterator[Tuple[str, List[Any]]]
+    :returns:
+        Statements with positional parameters, and their parameter values.
+    """
+    rows = []
+    row_values = []
+    size = len(prefix)
+
+    for parameters in seq_of_parameters:
+        row, parameter_values = _format_values_positional(values, parameters)
+        # Rows are joined by ", ".
+        row_size = len(row) + 2 if rows else len(row)
+        if rows and (
+                size + row_size > max_statement_size
+                or len(row_values) + len(parameter_values)
+                > _MAX_QUERY_PARAMETERS):
+            yield prefix + ', '.join(rows), row_values
+            rows = []
+            row_values = []
+            size = len(prefix)
+            row_size = len(row)
+        rows.append(row)
+        row_values.extend(parameter_values)
+        size += row_size
+
+    if rows:
+        yield prefix + ', '.join(rows), row_values
+
+
 def _format_operation(operation, parameters=None):
     """Formats parameters in operation in way BigQuery expects.
 
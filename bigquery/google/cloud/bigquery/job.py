@@ -15,6 +15,7 @@
 """Define API Jobs."""
 
 import copy
+import functools
 import threading
 
 from six.moves import http_client
@@ -22,6 +23,8 @@ from six.moves import http_client
 import google.api_core.future.polling
 from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
+from google.cloud.bigquery.cache import _cached_rows_request
+from google.cloud.bigquery.cache import _QueryResultRecorder
 from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery.external_config import ExternalConfig
 from google.cloud.bigquery.query import _query_param_from_api_repr
@@ -31,8 +34,10 @@ from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.schema import _parse_schema_resource
 from google.cloud.bigquery.table import _EmptyRowIterator
 from google.cloud.bigquery.table import EncryptionConfiguration
+from google.cloud.bigquery.table import RowIterator
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TimePartitioning
@@ -2271,6 +2276,8 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        self._query_cache_key = None
+        self._cached_result = None
 
     @property
     def allow_large_results(self):
@@ -2702,7 +2709,7 @@ class QueryJob(_AsyncJob):
         self._done_timeout = timeout
         super(QueryJob, self)._blocking_poll(timeout=timeout)
 
-    def result(self, timeout=None, retry=DEFAULT_RETRY):
+    def result(self, timeout=None, retry=DEFAULT_RETRY, prefetch_pages=None):
         """Start the job and wait for it to complete and get the result.
 
         :type timeout: float
@@ -2713,6 +2720,12 @@ class QueryJob(_AsyncJob):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the call that retrieves rows.
 
+        :type prefetch_pages: int
+        :param prefetch_pages:
+            (Optional) The number of result pages to download concurrently
+            while the current page is consumed. See
+            :meth:`~google.cloud.bigquery.client.Client.list_rows`.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`~google.cloud.bigquery.table.Row`-s.
@@ -2726,6 +2739,9 @@ class QueryJob(_AsyncJob):
             failed or :class:`concurrent.futures.TimeoutError` if the job did
             not complete in the given timeout.
         """
+        if self._cached_result is not None:
+            return self._cached_row_iterator()
+
         super(QueryJob, self).result(timeout=timeout)
         # Return an iterator instead of returning the job.
         if not self._query_results:
@@ -2743,7 +2759,27 @@ class QueryJob(_AsyncJob):
         schema = self._query_results.schema
         dest_table_ref = self.destination
         dest_table = Table(dest_table_ref, schema=schema)
-        return self._client.list_rows(dest_table, retry=retry)
+        rows = self._client.list_rows(
+            dest_table, retry=retry, prefetch_pages=prefetch_pages)
+
+        if self._query_cache_key is not None:
+            rows.api_request = _QueryResultRecorder(
+                rows.api_request, self._client._query_cache.max_bytes,
+                functools.partial(
+                    self._client._cache_query_result, self, schema))
+        return rows
+
+    def _cached_row_iterator(self):
+        """Iterate over the rows of a result from the client's query cache.
+
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
+        :returns: Iterator over the cached rows, as a single page.
+        """
+        return RowIterator(
+            client=self._client,
+            api_request=_cached_rows_request(self._cached_result),
+            path='%s/data' % (self.destination.path,),
+            schema=_parse_schema_resource(self._cached_result['schema']))
 
     def to_dataframe(self):
         """Return a pandas DataFrame from a QueryJob
@@ -3022,6 +3058,11 @@ class QueryPlanEntry(object):
         return _helpers._int_or_none(
             self._properties.get('shuffleOutputBytesSpilled'))
 
+    @property
+    def slot_ms(self):
+        """Union[int, None]: Slot-milliseconds used by the stage."""
+        return _helpers._int_or_none(self._properties.get('slotMs'))
+
     @property
     def steps(self):
         """List(QueryPlanEntryStep): List of step operations performed by
@@ -0,0 +1,336 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Summarize the execution statistics of query jobs."""
+
+from __future__ import absolute_import
+
+import collections
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+from google.cloud.bigquery import job
+
+
+_NO_PANDAS_ERROR = (
+    'The pandas library is not installed, please install '
+    'pandas to use the to_dataframe() function.'
+)
+
+_STAGE_COLUMNS = (
+    'entry_id',
+    'name',
+    'status',
+    'start',
+    'end',
+    'duration_ms',
+    'slot_ms',
+    'records_read',
+    'records_written',
+    'shuffle_output_bytes',
+    'shuffle_output_bytes_spilled',
+    'compute_ms_avg',
+    'compute_ms_max',
+    'compute_skew',
+    'wait_skew',
+    'read_skew',
+    'write_skew',
+    'on_critical_path',
+)
+
+_JOB_COLUMNS = (
+    'job_id',
+    'user_email',
+    'created',
+    'statement_type',
+    'cache_hit',
+    'total_bytes_processed',
+    'total_bytes_billed',
+    'slot_millis',
+    'elapsed_ms',
+    'num_stages',
+    'critical_path_ms',
+    'bottleneck_stage',
+    'bottleneck_duration_ms',
+    'max_compute_skew',
+    'shuffle_output_bytes',
+    'shuffle_output_bytes_spilled',
+    'peak_active_units',
+)
+
+
+def _skew(avg, max_):
+    """Ratio of the slowest worker's time to the average worker's time.
+
+    Args:
+        avg (Union[int, None]): The average time, in milliseconds.
+        max_ (Union[int, None]): The maximum time, in milliseconds.
+
+    Returns:
+        Union[float, None]:
+            The ratio, or :data:`None` if either time is unknown or the
+            average is zero.
+    """
+    if avg is None or max_ is None or avg == 0:
+        return None
+    return float(max_) / avg
+
+
+def _duration_ms(start, end):
+    """Milliseconds between two datetimes, or :data:`None`."""
+    if start is None or end is None:
+        return None
+    return int(round((end - start).total_seconds() * 1000))
+
+
+def _sum_or_none(values):
+    """Sum the values which are not :data:`None`, or :data:`None`."""
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return sum(values)
+
+
+class StageProfile(object):
+    """Statistics of one stage of a query plan.
+
+    Args:
+        entry (google.cloud.bigquery.job.QueryPlanEntry):
+            The stage in the query plan.
+        on_critical_path (bool):
+            (Optional) Whether the stage is on the critical path of the plan.
+    """
+
+    def __init__(self, entry, on_critical_path=False):
+        self.entry_id = entry.entry_id
+        self.name = entry.name
+        self.status = entry.status
+        self.input_stages = entry.input_stages
+        self.start = entry.start
+        self.end = entry.end
+        self.duration_ms = _duration_ms(entry.start, entry.end)
+        self.slot_ms = entry.slot_ms
+        self.records_read = entry.records_read
+        self.records_written = entry.records_written
+        self.shuffle_output_bytes = entry.shuffle_output_bytes
+        self.shuffle_output_bytes_spilled = entry.shuffle_output_bytes_spilled
+        self.compute_ms_avg = entry.compute_ms_avg
+        self.compute_ms_max = entry.compute_ms_max
+        self.compute_skew = _skew(entry.compute_ms_avg, entry.compute_ms_max)
+        self.wait_skew = _skew(entry.wait_ms_avg, entry.wait_ms_max)
+        self.read_skew = _skew(entry.read_ms_avg, entry.read_ms_max)
+        self.write_skew = _skew(entry.write_ms_avg, entry.write_ms_max)
+        self.on_critical_path = on_critical_path
+
+    def __repr__(self):
+        return (
+            'StageProfile(entry_id={!r}, name={!r}, duration_ms={!r})'.format(
+                self.entry_id, self.name, self.duration_ms))
+
+
+def _critical_path(stages):
+    """Find the chain of stages which determined when the query finished.
+
+    Starting from the stage which ended last, each step goes to the input
+    stage which ended last, as that was the input the stage waited for.
+
+    Args:
+        stages (List[StageProfile]): The stages of a query plan.
+
+    Returns:
+        List[StageProfile]: The critical path, from first to last stage.
+    """
+    by_id = {}
+    for stage in stages:
+        if stage.entry_id is not None and stage.end is not None:
+            by_id[int(stage.entry_id)] = stage
+    if not by_id:
+        return []
+
+    path = []
+    visited = set()
+    stage = max(by_id.values(), key=lambda stage: stage.end)
+    while stage is not None and id(stage) not in visited:
+        visited.add(id(stage))
+        path.append(stage)
+        inputs = [
+            by_id[input_id] for input_id in stage.input_stages
+            if input_id in by_id]
+        stage = max(inputs, key=lambda stage: stage.end) if inputs else None
+    path.reverse()
+    return path
+
+
+class QueryProfile(object):
+    """Summary of the execution statistics of a query job.
+
+    Use :meth:`from_job` to profile a finished
+    :class:`~google.cloud.bigquery.job.QueryJob`, and
+    :func:`jobs_to_dataframe` to compare many jobs.
+
+    Args:
+        query_job (google.cloud.bigquery.job.QueryJob): A finished query job.
+    """
+
+    def __init__(self, query_job):
+        self.job_id = query_job.job_id
+        self.user_email = query_job.user_email
+        self.created = query_job.created
+        self.statement_type = query_job.statement_type
+        self.cache_hit = query_job.cache_hit
+        self.total_bytes_processed = query_job.total_bytes_processed
+        self.total_bytes_billed = query_job.total_bytes_billed
+        self.elapsed_ms = _duration_ms(query_job.started, query_job.ended)
+
+        self.stages = [StageProfile(entry) for entry in query_job.query_plan]
+        self.critical_path = _critical_path(self.stages)
+        for stage in self.critical_path:
+            stage.on_critical_path = True
+
+        timeline = query_job.timeline
+        self.slot_millis = query_job.slot_millis
+        if self.slot_millis is None and timeline:
+            self.slot_millis = timeline[-1].slot_millis
+        self.peak_active_units = max(
+            [sample.active_units for sample in timeline
+             if sample.active_units is not None] or [None])
+
+    @classmethod
+    def from_job(cls, query_job):
+        """Profile a finished query job.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                A finished query job. Use
+                :meth:`~google.cloud.bigquery.client.Client.get_job` or
+                :meth:`~google.cloud.bigquery.client.Client.list_jobs` to
+                fetch past jobs.
+
+        Returns:
+            google.cloud.bigquery.profile.QueryProfile: The job's profile.
+        """
+        return cls(query_job)
+
+    @property
+    def critical_path_ms(self):
+        """Union[int, None]: Milliseconds from the start of the first stage
+        on the critical path to the end of the last."""
+        if not self.critical_path:
+            return None
+        return _duration_ms(
+            self.critical_path[0].start, self.critical_path[-1].end)
+
+    @property
+    def bottleneck(self):
+        """Union[StageProfile, None]: The longest stage on the critical
+        path."""
+        stages = [
+            stage for stage in self.critical_path
+            if stage.duration_ms is not None]
+        if not stages:
+            return None
+        return max(stages, key=lambda stage: stage.duration_ms)
+
+    @property
+    def max_compute_skew(self):
+        """Union[float, None]: Largest ratio of maximum to average compute
+        time of any stage."""
+        skews = [
+            stage.compute_skew for stage in self.stages
+            if stage.compute_skew is not None]
+        return max(skews) if skews else None
+
+    @property
+    def shuffle_output_bytes(self):
+        """Union[int, None]: Bytes written to shuffle by all stages."""
+        return _sum_or_none(
+            stage.shuffle_output_bytes for stage in self.stages)
+
+    @property
+    def shuffle_output_bytes_spilled(self):
+        """Union[int, None]: Shuffle bytes spilled to disk by all stages."""
+        return _sum_or_none(
+            stage.shuffle_output_bytes_spilled for stage in self.stages)
+
+    def to_summary(self):
+        """Summarize the job in a single record.
+
+        Returns:
+            collections.OrderedDict:
+                The job's statistics, with the keys used as column names by
+                :func:`jobs_to_dataframe`.
+        """
+        bottleneck = self.bottleneck
+        summary = collections.OrderedDict()
+        for column in _JOB_COLUMNS:
+            if column == 'num_stages':
+                value = len(self.stages)
+            elif column == 'bottleneck_stage':
+                value = bottleneck.name if bottleneck else None
+            elif column == 'bottleneck_duration_ms':
+                value = bottleneck.duration_ms if bottleneck else None
+            else:
+                value = getattr(self, column)
+            summary[column] = value
+        return summary
+
+    def to_dataframe(self):
+        """Create a pandas DataFrame with one row per stage of the plan.
+
+        Returns:
+            pandas.DataFrame:
+                The statistics of each stage, indexed by stage ID.
+
+        Raises:
+            ValueError: If the :mod:`pandas` library cannot be imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        records = [
+            [getattr(stage, column) for column in _STAGE_COLUMNS]
+            for stage in self.stages]
+        return pandas.DataFrame.from_records(
+            records, columns=_STAGE_COLUMNS, index='entry_id')
+
+
+def jobs_to_dataframe(jobs):
+    """Create a pandas DataFrame with one row per query job.
+
+    Jobs which are not query jobs are skipped, so that the result of
+    :meth:`~google.cloud.bigquery.client.Client.list_jobs` can be passed in
+    directly. Sort the DataFrame by ``slot_millis`` or
+    ``total_bytes_billed`` to find the most expensive queries.
+
+    Args:
+        jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+            Finished jobs.
+
+    Returns:
+        pandas.DataFrame: The summary of each query job, indexed by job ID.
+
+    Raises:
+        ValueError: If the :mod:`pandas` library cannot be imported.
+    """
+    if pandas is None:
+        raise ValueError(_NO_PANDAS_ERROR)
+
+    records = [
+        list(QueryProfile.from_job(query_job).to_summary().values())
+        for query_job in jobs if isinstance(query_job, job.QueryJob)]
+    return pandas.DataFrame.from_records(
+        records, columns=_JOB_COLUMNS, index='job_id')
@@ -16,18 +16,25 @@
 
 from __future__ import absolute_import
 
+import collections
+import concurrent.futures
 import copy
 import datetime
 import operator
 import warnings
 
 import six
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
 try:
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
 
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
@@ -1149,10 +1156,16 @@ class RowIterator(HTTPIterator):
         page_size (int, optional): The number of items to return per page.
         extra_params (Dict[str, object]):
             Extra query string parameters for the API call.
+        prefetch_pages (int, optional):
+            The number of pages to download concurrently, ahead of the page
+            being consumed. At most this many pages are buffered in memory.
+            Pages after the first are addressed by ``startIndex``, so this
+            has no effect when ``page_token`` is set.
     """
 
     def __init__(self, client, api_request, path, schema, page_token=None,
-                 max_results=None, page_size=None, extra_params=None):
+                 max_results=None, page_size=None, extra_params=None,
+                 prefetch_pages=None):
         super(RowIterator, self).__init__(
             client, api_request, path, item_to_value=_item_to_row,
             items_key='rows', page_token=page_token, max_results=max_results,
@@ -1160,8 +1173,144 @@ class RowIterator(HTTPIterator):
             next_token='pageToken')
         self._schema = schema
         self._field_to_index = _helpers._field_to_index_mapping(schema)
+        self._row_decoder = _helpers._row_tuple_decoder(schema)
         self._total_rows = None
         self._page_size = page_size
+        self._prefetch_pages = prefetch_pages
+        self._prefetch_ranges = None
+        self._prefetch_futures = collections.deque()
+        self._prefetch_executor = None
+
+    def _page_iter(self, increment):
+        """Generator of pages, releasing the prefetch threads when done.
+
+        The threads are also released when iteration is abandoned, i.e.
+        when the generator is closed or garbage collected.
+        """
+        try:
+            for page in super(RowIterator, self)._page_iter(increment):
+                yield page
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop downloading pages ahead of the rows being consumed.
+
+        Pending page requests are cancelled and the background threads are
+        released. No rows are returned after the last page already fetched.
+        Does nothing unless pages are prefetched.
+        """
+        executor, self._prefetch_executor = self._prefetch_executor, None
+        if executor is None:
+            return
+        self._prefetch_ranges = iter(())
+        while self._prefetch_futures:
+            self._prefetch_futures.popleft().cancel()
+        executor.shutdown(wait=False)
+
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        When prefetching is enabled, the first page is fetched as usual and
+        the remaining rows are split into ``startIndex`` ranges which are
+        downloaded in the background.
+
+        Returns:
+            Optional[google.api_core.page_iterator.Page]:
+                The next page in the iterator or :data:`None` if there are no
+                pages left.
+        """
+        if self._prefetch_ranges is not None:
+            return self._next_prefetched_page()
+
+        start_page_token = self.next_page_token
+        page = super(RowIterator, self)._next_page()
+        if (page is not None and self._prefetch_pages and
+                start_page_token is None and
+                self.next_page_token is not None and
+                self._total_rows is not None):
+            self._start_prefetch(page.num_items)
+        return page
+
+    def _start_prefetch(self, first_page_rows):
+        """Plan the row ranges following the first page and start fetching.
+
+        Args:
+            first_page_rows (int): The number of rows in the first page.
+        """
+        start = int(self.extra_params.get('startIndex', 0))
+        end = self._total_rows
+        if self.max_results is not None:
+            end = min(end, start + self.max_results)
+        step = self._page_size or first_page_rows
+        if step <= 0:
+            return
+
+        self._prefetch_ranges = (
+            (index, min(index + step, end))
+            for index in six.moves.range(start + first_page_rows, end, step))
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._prefetch_pages)
+        for _ in six.moves.range(self._prefetch_pages):
+            self._submit_prefetch()
+
+    def _submit_prefetch(self):
+        """Start downloading the next planned row range, if any."""
+        row_range = next(self._prefetch_ranges, None)
+        if row_range is not None:
+            self._prefetch_futures.append(self._prefetch_executor.submit(
+                self._get_rows_range_response, *row_range))
+
+    def _next_prefetched_page(self):
+        """Wait for the oldest prefetched range and wrap it in a page.
+
+        Returns:
+            Optional[google.api_core.page_iterator.Page]:
+                The next page in the iterator or :data:`None` if every range
+                has been consumed.
+        """
+        if not self._prefetch_futures:
+            self.close()
+            self.next_page_token = None
+            return None
+
+        response = self._prefetch_futures.popleft().result()
+        self._submit_prefetch()
+        page = Page(self, response['rows'], self.item_to_value)
+        self._page_start(self, page, response)
+        return page
+
+    def _get_rows_range_response(self, start, end):
+        """Fetch the rows from ``start`` up to, not including, ``end``.
+
+        The API may return fewer rows than requested, so this keeps reading
+        until the range is complete.
+
+        Args:
+            start (int): Zero-based index of the first row to fetch.
+            end (int): Zero-based index after the last row to fetch.
+
+        Returns:
+            Dict[str, object]:
+                The parsed JSON response of the last request, with ``rows``
+                holding every row in the range.
+        """
+        rows = []
+        while True:
+            params = dict(self.extra_params)
+            params['startIndex'] = start
+            params['maxResults'] = end - start
+            response = self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+            page_rows = response.get('rows', ())
+            rows.extend(page_rows)
+            start += len(page_rows)
+            if start >= end or not page_rows:
+                break
+        response['rows'] = rows
+        return response
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1204,11 +1353,19 @@ class RowIterator(HTTPIterator):
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
 
-        column_headers = [field.name for field in self.schema]
-        # Use generator, rather than pulling the whole rowset into memory.
-        rows = (row.values() for row in iter(self))
+        column_headers = [field.name for field in self._schema]
+        # Decode each page straight into columns, rather than building a
+        # Row object per row and pulling the whole rowset into memory.
+        frames = []
+        for page in iter(self.pages):
+            columns = _row_iterator_page_columns(self._schema, page._rows)
+            frames.append(pandas.DataFrame(
+                collections.OrderedDict(zip(column_headers, columns)),
+                columns=column_headers))
 
-        return pandas.DataFrame(rows, columns=column_headers)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
 
 
 class _EmptyRowIterator(object):
@@ -1380,9 +1537,8 @@ def _item_to_row(iterator, resource):
 
     .. note::
 
-        This assumes that the ``schema`` attribute has been
-        added to the iterator after being created, which
-        should be done by the caller.
+        This uses the row decoder compiled from the iterator's ``schema``
+        when the iterator was created.
 
     :type iterator: :class:`~google.api_core.page_iterator.Iterator`
     :param iterator: The iterator that is currently in use.
@@ -1393,8 +1549,7 @@ def _item_to_row(iterator, resource):
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(_helpers._row_tuple_from_json(resource, iterator.schema),
-               iterator._field_to_index)
+    return Row(iterator._row_decoder(resource), iterator._field_to_index)
 
 
 # pylint: disable=unused-argument
@@ -1414,4 +1569,78 @@ def _rows_page_start(iterator, page, response):
     if total_rows is not None:
         total_rows = int(total_rows)
     iterator._total_rows = total_rows
+    # Keep the raw rows so that they can be decoded column by column.
+    page._rows = response.get('rows', ())
 # pylint: enable=unused-argument
+
+
+def _float_array_from_json(values):
+    """Convert JSON cell values to a ``float64`` array, ``NaN`` for nulls."""
+    return numpy.array(
+        [numpy.nan if value is None else value for value in values],
+        dtype='float64')
+
+
+def _object_array(values):
+    """Copy ``values`` into a one-dimensional array of Python objects."""
+    array = numpy.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
+
+
+def _column_from_json(values, field):
+    """Convert the JSON cell values of a single column to an array.
+
+    The array's dtype is chosen from the field type, so that numeric and
+    timestamp columns never pass through per-cell Python objects. Columns
+    containing nulls use the same dtypes that pandas would infer for them.
+
+    :type values: list
+    :param values: The ``'v'`` values of one column's cells.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The schema field describing the column.
+
+    :rtype: array-like
+    :returns: A :class:`numpy.ndarray` or, for ``TIMESTAMP`` columns, a
+              :class:`pandas.DatetimeIndex`.
+    """
+    field_type = field.field_type
+    if field.mode == 'REPEATED':
+        convert = _helpers._field_value_decoder(field)
+        return _object_array([convert(value) for value in values])
+
+    has_nulls = None in values
+    if field_type in ('INTEGER', 'INT64') and not has_nulls:
+        return numpy.array(values, dtype='int64')
+    if field_type in ('INTEGER', 'INT64', 'FLOAT', 'FLOAT64'):
+        return _float_array_from_json(values)
+    if field_type == 'TIMESTAMP':
+        # Values are floating-point seconds, to microsecond precision.
+        micros = numpy.round(_float_array_from_json(values) * 1e6)
+        return pandas.to_datetime(micros, unit='us', utc=True)
+    convert = _helpers._field_value_decoder(field)
+    if field_type in ('BOOLEAN', 'BOOL') and not has_nulls:
+        return numpy.array([convert(value) for value in values], dtype='bool')
+    if field_type in ('STRING', 'GEOGRAPHY'):
+        return _object_array(values)
+    return _object_array([convert(value) for value in values])
+
+
+def _row_iterator_page_columns(schema, rows):
+    """Convert the JSON rows of a page to one array per schema field.
+
+    :type schema: Sequence[:class:`~google.cloud.bigquery.schema.SchemaField`]
+    :param schema: The fields of the rows.
+
+    :type rows: list
+    :param rows: The ``rows`` of a ``tabledata.list`` response.
+
+    :rtype: list
+    :returns: One array per field, as returned by :func:`_column_from_json`.
+    """
+    cells = [row['f'] for row in rows]
+    return [
+        _column_from_json([cell[index]['v'] for cell in cells], field)
+        for index, field in enumerate(schema)]
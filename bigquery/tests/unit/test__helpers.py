@@ -536,6 +536,65 @@ class Test_row_tuple_from_json(unittest.TestCase):
             ],))
 
 
+class Test_row_tuple_decoder(Test_row_tuple_from_json):
+
+    def _call_fut(self, row, schema):
+        from google.cloud.bigquery._helpers import _row_tuple_decoder
+
+        return _row_tuple_decoder(schema)(row)
+
+    def test_w_nullable_columns(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        schema = [
+            _Field('NULLABLE', 'int', 'INTEGER'),
+            _Field('NULLABLE', 'str', 'STRING'),
+            _Field('NULLABLE', 'bool', 'BOOLEAN'),
+            _Field('NULLABLE', 'ts', 'TIMESTAMP'),
+            _Field('NULLABLE', 'rec', 'RECORD', fields=[
+                _Field('NULLABLE', 'float', 'FLOAT'),
+            ]),
+        ]
+        null_row = {u'f': [{u'v': None}] * 5}
+        row = {u'f': [
+            {u'v': u'1'},
+            {u'v': u'abc'},
+            {u'v': u'true'},
+            {u'v': u'1.4338368E9'},
+            {u'v': {u'f': [{u'v': None}]}},
+        ]}
+        self.assertEqual(
+            self._call_fut(null_row, schema=schema),
+            (None, None, None, None, None))
+        self.assertEqual(
+            self._call_fut(row, schema=schema),
+            (1, u'abc', True,
+             datetime.datetime(2015, 6, 9, 8, 0, tzinfo=UTC),
+             {u'float': None}))
+
+    def test_w_required_null(self):
+        col = _Field('REQUIRED', 'col', 'INTEGER')
+        row = {u'f': [{u'v': None}]}
+        with self.assertRaises(TypeError):
+            self._call_fut(row, schema=[col])
+
+    def test_reused_for_many_rows(self):
+        from google.cloud.bigquery._helpers import _row_tuple_decoder
+
+        schema = [
+            _Field('REQUIRED', 'name', 'STRING'),
+            _Field('REQUIRED', 'age', 'INTEGER'),
+        ]
+        decode = _row_tuple_decoder(schema)
+        self.assertEqual(
+            decode({u'f': [{u'v': u'Phred'}, {u'v': u'32'}]}),
+            (u'Phred', 32))
+        self.assertEqual(
+            decode({u'f': [{u'v': u'Bharney'}, {u'v': u'33'}]}),
+            (u'Bharney', 33))
+
+
 class Test_rows_from_json(unittest.TestCase):
 
     def _call_fut(self, rows, schema):
@@ -0,0 +1,147 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class TestParquetStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._pandas_helpers import ParquetStream
+
+        return ParquetStream
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _read_parquet(data):
+        return pyarrow.parquet.read_table(io.BytesIO(data)).to_pandas()
+
+    def test_read_all_w_multiple_row_groups(self):
+        dataframe = pandas.DataFrame({
+            'name': ['a', 'b', 'c', 'd', 'e'],
+            'age': [1, 2, 3, 4, 5],
+        })
+        stream = self._make_one(dataframe, row_group_size=2)
+
+        data = stream.read()
+
+        self.assertEqual(stream.tell(), len(data))
+        self.assertEqual(stream.read(), b'')
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(data))
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        result = self._read_parquet(data)
+        self.assertEqual(list(result['name']), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(list(result['age']), [1, 2, 3, 4, 5])
+
+    def test_read_chunks(self):
+        dataframe = pandas.DataFrame({'n': list(range(1000))})
+        stream = self._make_one(dataframe, row_group_size=100)
+
+        chunks = []
+        chunk = stream.read(256)
+        while chunk:
+            self.assertLessEqual(len(chunk), 256)
+            # The encoded data does not accumulate as it is read.
+            self.assertLess(len(stream._buffer), 4096)
+            chunks.append(chunk)
+            chunk = stream.read(256)
+
+        result = self._read_parquet(b''.join(chunks))
+        self.assertEqual(list(result['n']), list(range(1000)))
+
+    def test_column_null_in_first_row_group(self):
+        dataframe = pandas.DataFrame({'name': [None, None, 'c', 'd']})
+        stream = self._make_one(dataframe, row_group_size=2)
+
+        result = self._read_parquet(stream.read())
+
+        self.assertEqual(list(result['name']), [None, None, 'c', 'd'])
+
+    def test_empty_dataframe(self):
+        dataframe = pandas.DataFrame({'name': []})
+        stream = self._make_one(dataframe)
+
+        result = self._read_parquet(stream.read())
+
+        self.assertEqual(len(result), 0)
+
+    def test_seek_to_last_chunk(self):
+        dataframe = pandas.DataFrame({'n': list(range(100))})
+        stream = self._make_one(dataframe, row_group_size=10)
+        first = stream.read(100)
+        second = stream.read(100)
+
+        self.assertEqual(stream.seek(100), 100)
+        self.assertEqual(stream.read(100), second)
+        with self.assertRaises(ValueError):
+            stream.seek(0)
+        self.assertEqual(len(first), 100)
+
+    def test_seek_relative(self):
+        import os
+
+        dataframe = pandas.DataFrame({'n': [1]})
+        stream = self._make_one(dataframe)
+
+        self.assertEqual(stream.seek(0), 0)
+        with self.assertRaises(ValueError):
+            stream.seek(0, os.SEEK_END)
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+class Test_dataframe_to_parquet_stream(unittest.TestCase):
+
+    def _call_fut(self, dataframe):
+        from google.cloud.bigquery._pandas_helpers import (
+            dataframe_to_parquet_stream)
+
+        return dataframe_to_parquet_stream(dataframe)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_w_pyarrow(self):
+        from google.cloud.bigquery._pandas_helpers import ParquetStream
+
+        stream = self._call_fut(pandas.DataFrame({'n': [1]}))
+
+        self.assertIsInstance(stream, ParquetStream)
+
+    @mock.patch('google.cloud.bigquery._pandas_helpers.pyarrow', new=None)
+    def test_wo_pyarrow(self):
+        dataframe = mock.Mock(spec=['to_parquet'])
+
+        def to_parquet(buffer):
+            buffer.write(b'PAR1')
+
+        dataframe.to_parquet.side_effect = to_parquet
+
+        stream = self._call_fut(dataframe)
+
+        self.assertEqual(stream.getvalue(), b'PAR1')
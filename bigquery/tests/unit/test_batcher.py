@@ -0,0 +1,305 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class Test_InsertResult(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(num_rows):
+        from google.cloud.bigquery.batcher import _InsertResult
+
+        return _InsertResult(num_rows)
+
+    def test_row_done_after_cancel(self):
+        result = self._make_one(2)
+        self.assertTrue(result.future.cancel())
+
+        result.row_done(0)
+        result.row_done(1, [{'reason': 'invalid'}])
+
+        self.assertTrue(result.future.cancelled())
+
+    def test_set_exception_after_cancel(self):
+        result = self._make_one(1)
+        self.assertTrue(result.future.cancel())
+
+        result.set_exception(ValueError('boom'))
+
+        self.assertTrue(result.future.cancelled())
+
+
+class TestInsertRowsBatcher(unittest.TestCase):
+    PROJECT = 'prahj-ekt'
+    DS_ID = 'dataset_id'
+    TABLE_ID = 'table_id'
+    PATH = '/projects/prahj-ekt/datasets/dataset_id/tables/table_id/insertAll'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.batcher import InsertRowsBatcher
+
+        return InsertRowsBatcher
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_client(self, *responses):
+        client = mock.Mock(spec=['_call_api', 'project'])
+        client.project = self.PROJECT
+        client._call_api.side_effect = list(responses)
+        return client
+
+    def _make_table_ref(self):
+        from google.cloud.bigquery.dataset import DatasetReference
+
+        return DatasetReference(self.PROJECT, self.DS_ID).table(self.TABLE_ID)
+
+    @staticmethod
+    def _sent_rows(call):
+        return [row['json'] for row in call[1]['data']['rows']]
+
+    def test_ctor_defaults(self):
+        from google.cloud.bigquery import batcher as MUT
+
+        client = self._make_client()
+        batcher = self._make_one(client, max_latency=None)
+
+        self.assertIs(batcher._client, client)
+        self.assertEqual(batcher._max_rows, MUT.MAX_ROWS)
+        self.assertEqual(batcher._max_bytes, MUT.MAX_BYTES)
+        self.assertEqual(batcher._max_retries, MUT.MAX_RETRIES)
+        self.assertEqual(batcher._retry_delay, MUT.RETRY_DELAY)
+        self.assertIsNone(batcher._thread)
+        batcher.close()
+
+    def test_insert_rows_json_flushes_on_max_rows(self):
+        import concurrent.futures
+
+        client = self._make_client({}, {})
+        rows = [{'n': 1}, {'n': 2}, {'n': 3}]
+
+        with self._make_one(client, max_rows=2, max_latency=None) as batcher:
+            future = batcher.insert_rows_json(
+                self._make_table_ref(), rows, row_ids=['a', 'b', 'c'])
+            with batcher._lock:
+                in_flight = list(batcher._in_flight)
+            concurrent.futures.wait(in_flight)
+
+            # Only the full batch is sent before flushing.
+            client._call_api.assert_called_once()
+            call = client._call_api.call_args
+            self.assertEqual(call[1]['method'], 'POST')
+            self.assertEqual(call[1]['path'], self.PATH)
+            self.assertEqual(
+                call[1]['data'],
+                {'rows': [
+                    {'json': {'n': 1}, 'insertId': 'a'},
+                    {'json': {'n': 2}, 'insertId': 'b'},
+                ]})
+            self.assertFalse(future.done())
+
+        self.assertEqual(future.result(), [])
+        self.assertEqual(client._call_api.call_count, 2)
+
+    def test_flush_sends_pending_rows(self):
+        client = self._make_client({}, {})
+        batcher = self._make_one(
+            client, max_rows=2, max_latency=None, skip_invalid_rows=True,
+            ignore_unknown_values=False)
+
+        future = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}, {'n': 2}, {'n': 3}])
+        batcher.flush()
+
+        self.assertEqual(future.result(), [])
+        self.assertEqual(client._call_api.call_count, 2)
+        sent = [
+            self._sent_rows(call) for call in client._call_api.call_args_list]
+        self.assertEqual(
+            sorted(sent, key=len), [[{'n': 3}], [{'n': 1}, {'n': 2}]])
+        data = client._call_api.call_args[1]['data']
+        self.assertTrue(data['skipInvalidRows'])
+        self.assertFalse(data['ignoreUnknownValues'])
+        batcher.close()
+
+    def test_max_bytes_splits_batches(self):
+        client = self._make_client({}, {}, {})
+        batcher = self._make_one(client, max_bytes=60, max_latency=None)
+
+        batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}, {'n': 2}, {'n': 3}],
+            row_ids=['a', 'b', 'c'])
+        batcher.close()
+
+        self.assertEqual(client._call_api.call_count, 3)
+
+    def test_retries_only_failed_rows(self):
+        row_errors = [
+            {'index': 1, 'errors': [{'reason': 'backendError'}]},
+            {'index': 2, 'errors': [{'reason': 'invalid'}]},
+        ]
+        client = self._make_client({'insertErrors': row_errors}, {})
+        batcher = self._make_one(client, max_latency=None, retry_delay=0.0)
+
+        future = batcher.insert_rows_json(
+            self._make_table_ref(), [{'n': 1}, {'n': 2}, {'n': 3}],
+            row_ids=['a', 'b', 'c'])
+        batcher.close()
+
+        self.assertEqual(
+            future.result(),
+            [{'index': 2, 'errors': [{'reason': 'invalid'}]}])
+        self.assertEqual(client._call_api.call_count, 2)
+        retried = client._call_api.call_args[1]['data']['rows']
+        self.assertEqual(retried, [{'json': {'n': 2}, 'insertId': 'b'}])
+
+    def test_retries_exhausted(self):
+        row_errors = [{'index': 0, 'errors': [{'reason': 'stopped'}]}]
+        client = self._make_client(
+            {'insertErrors': row_errors}, {'insertErrors': row_errors})
+        batcher = self._make_one(
+            client, max_latency=None, max_retries=1, retry_delay=0.0)
+
+        future = batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+        batcher.close()
+
+        self.assertEqual(
+            future.result(),
+            [{'index': 0, 'errors': [{'reason': 'stopped'}]}])
+        self.assertEqual(client._call_api.call_count, 2)
+
+    def test_retries_back_off(self):
+        from google.cloud.bigquery import batcher as MUT
+
+        row_errors = [{'index': 0, 'errors': [{'reason': 'timeout'}]}]
+        client = self._make_client(*(
+            [{'insertErrors': row_errors}] * 3 + [{}]))
+        batcher = self._make_one(client, max_latency=None, retry_delay=20.0)
+        timers = []
+
+        def make_timer(interval, function, args):
+            timers.append(interval)
+            timer = mock.Mock(spec=['daemon', 'start'])
+            timer.start.side_effect = lambda: function(*args)
+            return timer
+
+        with mock.patch('threading.Timer', new=make_timer):
+            future = batcher.insert_rows_json(
+                self._make_table_ref(), [{'n': 1}])
+            batcher.close()
+
+        self.assertEqual(future.result(), [])
+        self.assertEqual(client._call_api.call_count, 4)
+        self.assertEqual(
+            timers, [20.0, MUT._MAX_RETRY_DELAY, MUT._MAX_RETRY_DELAY])
+
+    def test_retry_delay_does_not_hold_worker(self):
+        from google.cloud.bigquery.dataset import DatasetReference
+
+        row_errors = [{'index': 0, 'errors': [{'reason': 'timeout'}]}]
+        client = self._make_client({'insertErrors': row_errors}, {}, {})
+        batcher = self._make_one(
+            client, max_rows=1, max_latency=None, max_workers=1,
+            retry_delay=2.0)
+        other_table = DatasetReference(self.PROJECT, self.DS_ID).table('t2')
+
+        retried = batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+        other = batcher.insert_rows_json(other_table, [{'n': 2}])
+
+        # The only worker sends the other table's rows during the delay.
+        self.assertEqual(other.result(timeout=1.0), [])
+        self.assertFalse(retried.done())
+        batcher.close()
+        self.assertEqual(retried.result(), [])
+        self.assertEqual(client._call_api.call_count, 3)
+
+    def test_cancelled_future(self):
+        client = self._make_client({})
+        batcher = self._make_one(client, max_latency=None)
+        table = self._make_table_ref()
+
+        cancelled = batcher.insert_rows_json(table, [{'n': 1}])
+        future = batcher.insert_rows_json(table, [{'n': 2}])
+        self.assertTrue(cancelled.cancel())
+        batcher.close()
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(future.result(), [])
+        self.assertEqual(client._call_api.call_count, 1)
+
+    def test_request_error_sets_exception(self):
+        from google.cloud.exceptions import BadRequest
+
+        client = self._make_client(BadRequest('bad'))
+        batcher = self._make_one(client, max_latency=None)
+
+        future = batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+        batcher.close()
+
+        with self.assertRaises(BadRequest):
+            future.result()
+
+    def test_max_latency_sends_in_background(self):
+        client = self._make_client({})
+        batcher = self._make_one(client, max_latency=0.01)
+
+        future = batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
+
+        self.assertEqual(future.result(timeout=10), [])
+        client._call_api.assert_called_once()
+        batcher.close()
+        self.assertFalse(batcher._thread.is_alive())
+
+    def test_insert_rows_w_schema_and_table_id(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client({})
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+        ]
+
+        with self._make_one(client, max_latency=None) as batcher:
+            future = batcher.insert_rows(
+                '{}.{}'.format(self.DS_ID, self.TABLE_ID),
+                [('Phred Phlyntstone', 32)], selected_fields=schema)
+
+        self.assertEqual(future.result(), [])
+        call = client._call_api.call_args
+        self.assertEqual(call[1]['path'], self.PATH)
+        self.assertEqual(
+            self._sent_rows(call),
+            [{'name': 'Phred Phlyntstone', 'age': '32'}])
+
+    def test_insert_rows_json_empty(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_latency=None)
+
+        future = batcher.insert_rows_json(self._make_table_ref(), [])
+        batcher.close()
+
+        self.assertEqual(future.result(), [])
+        client._call_api.assert_not_called()
+
+    def test_insert_after_close(self):
+        client = self._make_client()
+        batcher = self._make_one(client, max_latency=None)
+        batcher.close()
+
+        with self.assertRaises(ValueError):
+            batcher.insert_rows_json(self._make_table_ref(), [{'n': 1}])
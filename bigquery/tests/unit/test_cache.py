@@ -0,0 +1,203 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+class Test_normalize_query(unittest.TestCase):
+
+    def _call_fut(self, query):
+        from google.cloud.bigquery.cache import _normalize_query
+
+        return _normalize_query(query)
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(
+            self._call_fut('\n  SELECT a,\n\tb\n  FROM t  \n'),
+            'SELECT a, b FROM t')
+
+    def test_keeps_strings_and_identifiers(self):
+        query = "SELECT 'a  b', \"c\\\"  d\", `my  table`, '''e\n\nf'''"
+        self.assertEqual(self._call_fut(query), query)
+
+    def test_keeps_line_comment_end(self):
+        self.assertNotEqual(
+            self._call_fut('SELECT 1 -- one\n+ 1'),
+            self._call_fut('SELECT 1 -- one + 1'))
+        self.assertEqual(
+            self._call_fut('SELECT 1 -- one\n   + 1'),
+            'SELECT 1 -- one\n + 1')
+
+
+class TestQueryCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.cache import QueryCache
+
+        return QueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_result(rows):
+        return {'job': {}, 'schema': {}, 'rows': rows, 'tables': []}
+
+    @staticmethod
+    def _make_query_job(query, job_config=None, project='project'):
+        from google.cloud.bigquery.job import QueryJob
+
+        client = mock.Mock(project=project, spec=['project'])
+        return QueryJob('job-id', query, client, job_config=job_config)
+
+    def test_key_ignores_formatting_and_labels(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        cache = self._make_one()
+        config = QueryJobConfig()
+        config.labels = {'dashboard': 'sales'}
+
+        self.assertEqual(
+            cache.key(self._make_query_job('SELECT 1')),
+            cache.key(self._make_query_job(' SELECT\n 1 ', config)))
+
+    def test_key_w_parameters(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        cache = self._make_one()
+        keys = set()
+        for value in (1, 2):
+            config = QueryJobConfig()
+            config.query_parameters = [
+                ScalarQueryParameter('x', 'INT64', value)]
+            keys.add(cache.key(self._make_query_job('SELECT @x', config)))
+        keys.add(cache.key(self._make_query_job('SELECT @x')))
+        keys.add(cache.key(
+            self._make_query_job('SELECT @x', project='other')))
+
+        self.assertEqual(len(keys), 4)
+
+    def test_put_and_get(self):
+        cache = self._make_one()
+        result = self._make_result([{'f': [{'v': '1'}]}])
+
+        cache.put('key', result)
+
+        self.assertEqual(cache.get('key'), result)
+        self.assertIsNone(cache.get('missing'))
+
+    def test_get_expired(self):
+        cache = self._make_one(ttl=10)
+
+        with mock.patch('time.time', return_value=100.0):
+            cache.put('key', self._make_result([]))
+        with mock.patch('time.time', return_value=109.0):
+            self.assertIsNotNone(cache.get('key'))
+        with mock.patch('time.time', return_value=110.0):
+            self.assertIsNone(cache.get('key'))
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(max_entries=2)
+        cache.put('a', self._make_result([]))
+        cache.put('b', self._make_result([]))
+        cache.get('a')
+
+        cache.put('c', self._make_result([]))
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_evicts_over_max_bytes(self):
+        row = {'f': [{'v': 'x' * 10}]}
+        row_size = len('[{"f": [{"v": "xxxxxxxxxx"}]}]')
+        cache = self._make_one(max_bytes=2 * row_size)
+
+        cache.put('a', self._make_result([row]))
+        cache.put('b', self._make_result([row]))
+        cache.put('c', self._make_result([row]))
+        cache.put('too-big', self._make_result([row] * 3))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.get('too-big'))
+
+    def test_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        result = self._make_result([{'f': [{'v': u'\u00e9'}]}])
+
+        self._make_one(directory=directory).put('key', result)
+        cache = self._make_one(directory=directory)
+
+        self.assertEqual(cache.get('key'), result)
+        cache.clear()
+        self.assertIsNone(self._make_one(directory=directory).get('key'))
+
+
+class Test_QueryResultRecorder(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.cache import _QueryResultRecorder
+
+        return _QueryResultRecorder
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_records_all_pages(self):
+        api_request = mock.Mock(side_effect=[
+            {'rows': [1, 2], 'pageToken': 'next'},
+            {'rows': [3]},
+        ])
+        on_complete = mock.Mock()
+        recorder = self._make_one(api_request, 1000, on_complete)
+
+        recorder(method='GET', path='/data', query_params={})
+        on_complete.assert_not_called()
+        response = recorder(
+            method='GET', path='/data', query_params={'pageToken': 'next'})
+
+        self.assertEqual(response, {'rows': [3]})
+        on_complete.assert_called_once_with([1, 2, 3])
+
+    def test_stops_over_max_bytes(self):
+        api_request = mock.Mock(side_effect=[
+            {'rows': [1, 2], 'pageToken': 'next'},
+            {'rows': [3]},
+        ])
+        on_complete = mock.Mock()
+        recorder = self._make_one(api_request, 5, on_complete)
+
+        recorder(method='GET', path='/data', query_params={})
+        recorder(method='GET', path='/data', query_params={})
+
+        on_complete.assert_not_called()
+
+    def test_stops_on_prefetched_ranges(self):
+        api_request = mock.Mock(return_value={'rows': [3]})
+        on_complete = mock.Mock()
+        recorder = self._make_one(api_request, 1000, on_complete)
+
+        recorder(method='GET', path='/data', query_params={'startIndex': 2})
+
+        on_complete.assert_not_called()
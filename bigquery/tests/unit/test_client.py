@@ -2238,6 +2238,156 @@ class TestClient(unittest.TestCase):
                 'maxCreationTime': str(end_time_millis),
             })
 
+    def _make_job_resource(self, job_id, state, created=1500000000000.0,
+                           project=None):
+        return {
+            'jobReference': {
+                'projectId': project or self.PROJECT,
+                'jobId': job_id,
+            },
+            'state': state,
+            'status': {'state': state},
+            'statistics': {'creationTime': str(created)},
+            'configuration': {
+                'query': {'query': 'SELECT 1'},
+            },
+        }
+
+    def test_as_completed_lists_outstanding_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        jobs = [
+            client.job_from_resource(self._make_job_resource(
+                job_id, 'RUNNING', created=created))
+            for job_id, created in [
+                ('job-1', 1500000000000.0),
+                ('job-2', 1500000001000.5),
+                ('job-3', 1500000002000.0),
+            ]]
+        conn = client._connection = _make_connection(
+            {'jobs': [
+                self._make_job_resource('job-1', 'DONE'),
+                self._make_job_resource('job-2', 'RUNNING'),
+                self._make_job_resource('job-3', 'DONE'),
+            ]},
+            self._make_job_resource('job-2', 'DONE'),
+        )
+
+        with mock.patch('time.sleep') as sleep:
+            finished = list(client.as_completed(jobs))
+
+        self.assertEqual(finished, [jobs[0], jobs[2], jobs[1]])
+        self.assertEqual(sleep.call_count, 2)
+        # Jobs completed in the first round, so the delay is not increased.
+        sleep.assert_called_with(1.0)
+        self.assertEqual(conn.api_request.call_count, 2)
+        conn.api_request.assert_any_call(
+            method='GET',
+            path='/projects/%s/jobs' % self.PROJECT,
+            query_params={
+                'projection': 'full',
+                'minCreationTime': '1500000000000',
+                'maxCreationTime': '1500000002001',
+            })
+        conn.api_request.assert_called_with(
+            method='GET',
+            path='/projects/%s/jobs/job-2' % self.PROJECT,
+            query_params={})
+
+    def test_as_completed_gets_unlisted_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        jobs = [
+            client.job_from_resource(
+                self._make_job_resource(job_id, 'RUNNING'))
+            for job_id in ('job-1', 'job-2', 'job-3')]
+        conn = client._connection = _make_connection(
+            {'jobs': [
+                self._make_job_resource('job-1', 'DONE'),
+                self._make_job_resource('job-2', 'DONE'),
+            ]},
+            self._make_job_resource('job-3', 'DONE'),
+        )
+
+        with mock.patch('time.sleep'):
+            finished = list(client.as_completed(jobs))
+
+        self.assertEqual(finished, jobs)
+        self.assertEqual(conn.api_request.call_count, 2)
+        conn.api_request.assert_called_with(
+            method='GET',
+            path='/projects/%s/jobs/job-3' % self.PROJECT,
+            query_params={})
+
+    def test_as_completed_backs_off_while_jobs_run(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        running = self._make_job_resource('job-1', 'RUNNING')
+        query_job = client.job_from_resource(running)
+        client._connection = _make_connection(
+            running, running, self._make_job_resource('job-1', 'DONE'))
+
+        with mock.patch('time.sleep') as sleep:
+            finished = list(client.as_completed([query_job]))
+
+        self.assertEqual(finished, [query_job])
+        self.assertEqual(
+            sleep.call_args_list,
+            [mock.call(1.0), mock.call(1.5), mock.call(2.25)])
+
+    def test_as_completed_begins_unstarted_jobs(self):
+        from google.cloud.bigquery.job import QueryJob
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _make_connection(
+            self._make_job_resource('job-1', 'DONE'))
+        query_job = QueryJob('job-1', 'SELECT 1', client)
+
+        with mock.patch('time.sleep') as sleep:
+            finished = list(client.as_completed([query_job]))
+
+        self.assertEqual(finished, [query_job])
+        sleep.assert_not_called()
+        conn.api_request.assert_called_once()
+        self.assertEqual(
+            conn.api_request.call_args[1]['path'],
+            '/projects/%s/jobs' % self.PROJECT)
+
+    def test_as_completed_w_timeout(self):
+        import concurrent.futures
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        running = self._make_job_resource('job-1', 'RUNNING')
+        query_job = client.job_from_resource(running)
+        client._connection = _make_connection(running)
+
+        with mock.patch('time.sleep') as sleep:
+            with mock.patch('time.time', side_effect=[0.0, 0.0, 2.0]):
+                with self.assertRaises(concurrent.futures.TimeoutError):
+                    list(client.as_completed([query_job], timeout=1.0))
+
+        sleep.assert_called_once_with(1.0)
+
+    def test_wait_for_jobs(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        jobs = [
+            client.job_from_resource(
+                self._make_job_resource('job-1', 'RUNNING')),
+            client.job_from_resource(
+                self._make_job_resource('job-2', 'DONE')),
+        ]
+        client._connection = _make_connection(
+            self._make_job_resource('job-1', 'DONE'))
+
+        with mock.patch('time.sleep'):
+            result = client.wait_for_jobs(iter(jobs))
+
+        self.assertEqual(result, jobs)
+        self.assertTrue(all(query_job.done() for query_job in jobs))
+
     def test_load_table_from_uri(self):
         from google.cloud.bigquery.job import LoadJob
 
@@ -2939,6 +3089,201 @@ class TestClient(unittest.TestCase):
         self.assertEqual(sent_config['query'], QUERY)
         self.assertFalse(sent_config['useLegacySql'])
 
+    def _make_cached_query_resources(self, query, etag='etag-1'):
+        job_resource = {
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': 'job-1',
+            },
+            'configuration': {
+                'query': {
+                    'query': query,
+                    'useLegacySql': False,
+                    'destinationTable': {
+                        'projectId': self.PROJECT,
+                        'datasetId': '_anonymous',
+                        'tableId': 'anon_1',
+                    },
+                },
+            },
+            'status': {'state': 'DONE'},
+            'statistics': {
+                'startTime': '1500000002000',
+                'query': {
+                    'statementType': 'SELECT',
+                    'referencedTables': [{
+                        'projectId': self.PROJECT,
+                        'datasetId': self.DS_ID,
+                        'tableId': self.TABLE_ID,
+                    }],
+                },
+            },
+        }
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': job_resource['jobReference'],
+            'schema': {'fields': [
+                {'name': 'name', 'type': 'STRING'},
+                {'name': 'age', 'type': 'INTEGER'},
+            ]},
+            'totalRows': '2',
+        }
+        rows_resource = {
+            'totalRows': '2',
+            'rows': [
+                {'f': [{'v': 'Phred'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney'}, {'v': '33'}]},
+            ],
+        }
+        table_resource = {
+            'tableReference': {
+                'projectId': self.PROJECT,
+                'datasetId': self.DS_ID,
+                'tableId': self.TABLE_ID,
+            },
+            'etag': etag,
+            'lastModifiedTime': '1500000001000',
+        }
+        return job_resource, query_resource, rows_resource, table_resource
+
+    def test_query_w_query_cache(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        query = 'SELECT name, age FROM dataset_id.table_id'
+        job_resource, query_resource, rows_resource, table_resource = (
+            self._make_cached_query_resources(query))
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        conn = client._connection = _make_connection(
+            job_resource, query_resource, rows_resource, table_resource,
+            table_resource)
+
+        first = [tuple(row) for row in client.query(query).result()]
+        self.assertEqual(conn.api_request.call_count, 4)
+        self.assertEqual(len(client._query_cache), 1)
+
+        cached_job = client.query(
+            'SELECT name, age\n  FROM dataset_id.table_id')
+        self.assertEqual(cached_job.job_id, 'job-1')
+        rows = cached_job.result()
+        second = [tuple(row) for row in rows]
+
+        self.assertEqual(first, [('Phred', 32), ('Bharney', 33)])
+        self.assertEqual(second, first)
+        self.assertEqual(rows.total_rows, 2)
+        self.assertEqual(conn.api_request.call_count, 5)
+        conn.api_request.assert_called_with(
+            method='GET',
+            path='/projects/%s/datasets/%s/tables/%s' % (
+                self.PROJECT, self.DS_ID, self.TABLE_ID))
+
+    def test_query_w_query_cache_table_changed(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        query = 'SELECT name, age FROM dataset_id.table_id'
+        job_resource, query_resource, rows_resource, table_resource = (
+            self._make_cached_query_resources(query))
+        changed_table_resource = self._make_cached_query_resources(
+            query, etag='etag-2')[3]
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        conn = client._connection = _make_connection(
+            job_resource, query_resource, rows_resource, table_resource,
+            changed_table_resource, job_resource)
+
+        list(client.query(query).result())
+        client.query(query)
+
+        self.assertEqual(conn.api_request.call_count, 6)
+        _, req = conn.api_request.call_args
+        self.assertEqual(req['method'], 'POST')
+        self.assertEqual(len(client._query_cache), 0)
+
+    def test_query_w_query_cache_skips_modified_table(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        query = 'SELECT name, age FROM dataset_id.table_id'
+        job_resource, query_resource, rows_resource, table_resource = (
+            self._make_cached_query_resources(query))
+        # The table changed while the query was running.
+        table_resource['lastModifiedTime'] = '1500000003000'
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        client._connection = _make_connection(
+            job_resource, query_resource, rows_resource, table_resource)
+
+        list(client.query(query).result())
+
+        self.assertEqual(len(client._query_cache), 0)
+
+    def test_query_w_query_cache_get_table_fails(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.exceptions import Forbidden
+
+        query = 'SELECT name, age FROM dataset_id.table_id'
+        job_resource, query_resource, rows_resource, _ = (
+            self._make_cached_query_resources(query))
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        client._connection = _make_connection(
+            job_resource, query_resource, rows_resource,
+            Forbidden('tables.get denied'))
+
+        rows = [tuple(row) for row in client.query(query).result()]
+
+        self.assertEqual(rows, [('Phred', 32), ('Bharney', 33)])
+        self.assertEqual(len(client._query_cache), 0)
+
+    def test_query_w_query_cache_lookup_get_table_fails(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.exceptions import Forbidden
+
+        query = 'SELECT name, age FROM dataset_id.table_id'
+        job_resource, query_resource, rows_resource, table_resource = (
+            self._make_cached_query_resources(query))
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        conn = client._connection = _make_connection(
+            job_resource, query_resource, rows_resource, table_resource,
+            Forbidden('tables.get denied'), job_resource)
+
+        list(client.query(query).result())
+        client.query(query)
+
+        _, req = conn.api_request.call_args
+        self.assertEqual(req['method'], 'POST')
+        self.assertEqual(len(client._query_cache), 0)
+
+    def test_query_w_query_cache_and_destination(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        query = 'SELECT 1'
+        job_config = QueryJobConfig()
+        job_config.destination = self.TABLE_REF
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds,
+            query_cache=QueryCache())
+        client._connection = _make_connection({
+            'jobReference': {'projectId': self.PROJECT, 'jobId': 'job-1'},
+            'configuration': {'query': {'query': query}},
+        })
+
+        query_job = client.query(query, job_config=job_config)
+
+        self.assertIsNone(query_job._query_cache_key)
+
     def test_query_w_explicit_project(self):
         job_id = 'some-job-id'
         query = 'select count(*) from persons'
@@ -3962,6 +4307,30 @@ class TestClient(unittest.TestCase):
             self.assertEqual(req[1]['query_params'], test[1],
                              'for kwargs %s' % test[0])
 
+    def test_list_rows_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import Table, SchemaField
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                _http=http)
+        table = Table(self.TABLE_REF,
+                      schema=[SchemaField('age', 'INTEGER', mode='NULLABLE')])
+        conn = client._connection = _make_connection(
+            {'totalRows': '12', 'pageToken': 'NEXT',
+             'rows': [{'f': [{'v': '7'}]}]},
+            {'totalRows': '12', 'rows': [{'f': [{'v': '8'}]}]})
+
+        iterator = client.list_rows(
+            table, start_index=10, page_size=1, prefetch_pages=4)
+        rows = list(iterator)
+
+        self.assertEqual([row.age for row in rows], [7, 8])
+        self.assertEqual(iterator._prefetch_pages, 4)
+        req = conn.api_request.call_args_list[1]
+        self.assertEqual(
+            req[1]['query_params'], {'startIndex': 11, 'maxResults': 1})
+
     def test_list_rows_repeated_fields(self):
         from google.cloud.bigquery.table import SchemaField
 
@@ -4464,7 +4833,7 @@ class TestClientUpload(object):
             project=None, job_config=mock.ANY)
 
         sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
+        sent_bytes = sent_file.read()
         assert isinstance(sent_bytes, bytes)
         assert len(sent_bytes) > 0
 
@@ -4501,7 +4870,7 @@ class TestClientUpload(object):
         )
 
         sent_file = load_table_from_file.mock_calls[0][1][1]
-        sent_bytes = sent_file.getvalue()
+        sent_bytes = sent_file.read()
         assert isinstance(sent_bytes, bytes)
         assert len(sent_bytes) > 0
 
@@ -83,9 +83,27 @@ class TestCursor(unittest.TestCase):
         from google.cloud.bigquery.dbapi import connect
         connection = connect(self._mock_client())
         cursor = connection.cursor()
-        # close() is a no-op, there is nothing to test.
+        # Without results, close() has nothing to release.
         cursor.close()
 
+    def test_close_releases_rows(self):
+        from google.cloud.bigquery import dbapi
+
+        rows_iter = mock.MagicMock()
+        rows_iter.__iter__.return_value = iter([(1,), (2,)])
+        client = self._mock_client(rows=[])
+        client.list_rows.return_value = rows_iter
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT a FROM t;')
+
+        self.assertEqual(cursor.fetchone(), (1,))
+        cursor.execute('SELECT a FROM t;')
+        rows_iter.close.assert_called_once_with()
+        cursor.fetchone()
+        cursor.close()
+
+        self.assertEqual(rows_iter.close.call_count, 2)
+
     def test_fetchone_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -161,6 +179,34 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_streams_rows(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        produced = []
+
+        def rows():
+            for index in range(1000):
+                produced.append(index)
+                yield (index,)
+
+        client = self._mock_client(rows=[])
+        client.list_rows.return_value = rows()
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.arraysize = 2
+        cursor.execute('SELECT a FROM t;')
+
+        self.assertEqual(cursor.fetchmany(), [(0,), (1,)])
+        self.assertEqual(cursor.fetchmany(), [(2,), (3,)])
+
+        # Only the fetched rows have been read from the results.
+        self.assertEqual(produced, [0, 1, 2, 3])
+        _, kwargs = client.list_rows.call_args
+        self.assertEqual(kwargs['page_size'], 2)
+        self.assertEqual(
+            kwargs['prefetch_pages'], cursor_module._PREFETCH_PAGES)
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -269,6 +315,110 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def test_executemany_w_insert_coalesces_rows(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=3)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            'INSERT INTO dataset.people (name, age) VALUES (%s, %s);',
+            [('Phred', 32), ('Bharney', 33), ('Wylma', 29)])
+
+        client.query.assert_called_once()
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            'INSERT INTO dataset.people (name, age) '
+            'VALUES (?, ?), (?, ?), (?, ?)')
+        self.assertEqual(
+            [parameter.value
+             for parameter in kwargs['job_config'].query_parameters],
+            ['Phred', 32, 'Bharney', 33, 'Wylma', 29])
+        self.assertTrue(all(
+            parameter.name is None
+            for parameter in kwargs['job_config'].query_parameters))
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_executemany_w_insert_and_dict_parameters(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            'insert dataset.people (name, age) '
+            'values (%(name)s, CAST(%(age)s AS INT64))',
+            [{'age': 32, 'name': 'Phred'}, {'age': 33, 'name': 'Bharney'}])
+
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            'insert dataset.people (name, age) '
+            'values (?, CAST(? AS INT64)), (?, CAST(? AS INT64))')
+        self.assertEqual(
+            [parameter.value
+             for parameter in kwargs['job_config'].query_parameters],
+            ['Phred', 32, 'Bharney', 33])
+
+    def test_executemany_w_insert_and_max_statement_size(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            'INSERT INTO t (x) VALUES (%s)',
+            [(1,), (2,), (3,), (4,), (5,)],
+            max_statement_size=len('INSERT INTO t (x) VALUES (?), (?)'))
+
+        self.assertEqual(
+            [call[0][0] for call in client.query.call_args_list],
+            [
+                'INSERT INTO t (x) VALUES (?), (?)',
+                'INSERT INTO t (x) VALUES (?), (?)',
+                'INSERT INTO t (x) VALUES (?)',
+            ])
+        self.assertEqual(cursor.rowcount, 6)
+
+    def test_executemany_w_insert_and_max_parameters(self):
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        connection = connect(client)
+        cursor = connection.cursor()
+        with mock.patch.object(cursor_module, '_MAX_QUERY_PARAMETERS', 4):
+            cursor.executemany(
+                'INSERT INTO t (x, y) VALUES (%s, %s)',
+                [(1, 2), (3, 4), (5, 6)])
+
+        self.assertEqual(
+            [len(call[1]['job_config'].query_parameters)
+             for call in client.query.call_args_list],
+            [4, 2])
+
+    def test_executemany_w_insert_select(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            'INSERT INTO t (x) SELECT x FROM s WHERE x = %s',
+            [(1,), (2,)])
+
+        self.assertEqual(client.query.call_count, 2)
+
+    def test_executemany_w_insert_and_wrong_dict(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client())
+        cursor = connection.cursor()
+        with self.assertRaises(dbapi.ProgrammingError):
+            cursor.executemany(
+                'INSERT INTO t (x) VALUES (%(x)s)', [{'y': 1}])
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
         formatted_operation = cursor._format_operation(
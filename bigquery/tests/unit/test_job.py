@@ -4187,6 +4187,26 @@ class TestQueryJob(unittest.TestCase, _Base):
 
         self.assertEqual(list(result), [])
 
+    def test_result_w_prefetch_pages(self):
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_ID,
+            },
+            'schema': {'fields': [{'name': 'col1', 'type': 'STRING'}]},
+            'totalRows': '0',
+        }
+        connection = _make_connection(query_resource, query_resource)
+        client = _make_client(self.PROJECT, connection=connection)
+        resource = self._make_resource(ended=True)
+        job = self._get_target_class().from_api_repr(resource, client)
+
+        result = job.result(prefetch_pages=3)
+
+        self.assertEqual(result._prefetch_pages, 3)
+        self.assertEqual(list(result), [])
+
     def test_result_w_empty_schema(self):
         # Destination table may have no schema for some DDL and DML queries.
         query_resource = {
@@ -4924,6 +4944,7 @@ class TestQueryPlanEntry(unittest.TestCase, _Base):
     STATUS = 'STATUS'
     SHUFFLE_OUTPUT_BYTES = 1024
     SHUFFLE_OUTPUT_BYTES_SPILLED = 1
+    SLOT_MS = 5432
 
     START_RFC3339_MICROS = '2018-04-01T00:00:00.000000Z'
     END_RFC3339_MICROS = '2018-04-01T00:00:04.000000Z'
@@ -4967,6 +4988,7 @@ class TestQueryPlanEntry(unittest.TestCase, _Base):
         self.assertIsNone(entry.status)
         self.assertIsNone(entry.shuffle_output_bytes)
         self.assertIsNone(entry.shuffle_output_bytes_spilled)
+        self.assertIsNone(entry.slot_ms)
         self.assertEqual(entry.steps, [])
 
     def test_from_api_repr_normal(self):
@@ -5002,6 +5024,7 @@ class TestQueryPlanEntry(unittest.TestCase, _Base):
             'status': self.STATUS,
             'shuffleOutputBytes': self.SHUFFLE_OUTPUT_BYTES,
             'shuffleOutputBytesSpilled': self.SHUFFLE_OUTPUT_BYTES_SPILLED,
+            'slotMs': str(self.SLOT_MS),
             'steps': [{
                 'kind': TestQueryPlanEntryStep.KIND,
                 'substeps': TestQueryPlanEntryStep.SUBSTEPS,
@@ -5023,6 +5046,7 @@ class TestQueryPlanEntry(unittest.TestCase, _Base):
         self.assertEqual(entry.records_read, self.RECORDS_READ)
         self.assertEqual(entry.records_written, self.RECORDS_WRITTEN)
         self.assertEqual(entry.status, self.STATUS)
+        self.assertEqual(entry.slot_ms, self.SLOT_MS)
         self.assertEqual(entry.steps, steps)
 
     def test_start(self):
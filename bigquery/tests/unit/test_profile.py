@@ -0,0 +1,207 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+
+
+PROJECT = 'project'
+
+
+def _make_stage(entry_id, start_ms, end_ms, input_stages=(), **kwargs):
+    stage = {
+        'id': str(entry_id),
+        'name': 'S{:02d}'.format(entry_id),
+        'startMs': str(start_ms),
+        'endMs': str(end_ms),
+        'inputStages': [str(input_id) for input_id in input_stages],
+    }
+    stage.update(kwargs)
+    return stage
+
+
+def _make_query_job(job_id='job-1', query_plan=(), timeline=(), **stats):
+    from google.cloud.bigquery.job import QueryJob
+
+    client = mock.Mock(project=PROJECT, spec=['project'])
+    query_stats = {
+        'queryPlan': list(query_plan),
+        'timeline': list(timeline),
+    }
+    query_stats.update(stats)
+    resource = {
+        'jobReference': {'projectId': PROJECT, 'jobId': job_id},
+        'configuration': {'query': {'query': 'SELECT 1'}},
+        'status': {'state': 'DONE'},
+        'user_email': 'phred@example.com',
+        'statistics': {
+            'creationTime': '1500000000000',
+            'startTime': '1500000001000',
+            'endTime': '1500000011000',
+            'query': query_stats,
+        },
+    }
+    return QueryJob.from_api_repr(resource, client)
+
+
+def _make_plan():
+    # Two input stages feed a join; stage 1 finishes last and gates it.
+    return [
+        _make_stage(
+            0, 1500000001000, 1500000003000,
+            computeMsAvg='100', computeMsMax='150', slotMs='2000',
+            shuffleOutputBytes='1000', shuffleOutputBytesSpilled='0'),
+        _make_stage(
+            1, 1500000001000, 1500000006000,
+            computeMsAvg='100', computeMsMax='900', slotMs='9000',
+            shuffleOutputBytes='5000', shuffleOutputBytesSpilled='10'),
+        _make_stage(
+            2, 1500000006000, 1500000010000, input_stages=(0, 1),
+            computeMsAvg='0', computeMsMax='10', slotMs='500'),
+    ]
+
+
+class TestQueryProfile(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.profile import QueryProfile
+
+        return QueryProfile
+
+    def test_from_job(self):
+        timeline = [
+            {'elapsedMs': '1000', 'activeUnits': '4', 'totalSlotMs': '100'},
+            {'elapsedMs': '2000', 'activeUnits': '9', 'totalSlotMs': '900'},
+            {'elapsedMs': '3000', 'totalSlotMs': '11500'},
+        ]
+        query_job = _make_query_job(
+            query_plan=_make_plan(), timeline=timeline,
+            statementType='SELECT', totalBytesProcessed='1234',
+            totalBytesBilled='10485760', cacheHit=False)
+
+        profile = self._get_target_class().from_job(query_job)
+
+        self.assertEqual(profile.job_id, 'job-1')
+        self.assertEqual(profile.user_email, 'phred@example.com')
+        self.assertEqual(profile.statement_type, 'SELECT')
+        self.assertFalse(profile.cache_hit)
+        self.assertEqual(profile.total_bytes_processed, 1234)
+        self.assertEqual(profile.total_bytes_billed, 10485760)
+        self.assertEqual(profile.elapsed_ms, 10000)
+        # Falls back to the last timeline sample.
+        self.assertEqual(profile.slot_millis, 11500)
+        self.assertEqual(profile.peak_active_units, 9)
+
+        self.assertEqual(
+            [stage.entry_id for stage in profile.critical_path], ['1', '2'])
+        self.assertEqual(
+            [stage.on_critical_path for stage in profile.stages],
+            [False, True, True])
+        self.assertEqual(profile.critical_path_ms, 9000)
+        self.assertEqual(profile.bottleneck.name, 'S01')
+        self.assertEqual(profile.stages[1].duration_ms, 5000)
+        self.assertEqual(profile.stages[1].slot_ms, 9000)
+        self.assertEqual(profile.stages[1].compute_skew, 9.0)
+        self.assertIsNone(profile.stages[2].compute_skew)
+        self.assertEqual(profile.max_compute_skew, 9.0)
+        self.assertEqual(profile.shuffle_output_bytes, 6000)
+        self.assertEqual(profile.shuffle_output_bytes_spilled, 10)
+
+    def test_from_job_wo_statistics(self):
+        query_job = _make_query_job(totalSlotMs='42')
+
+        profile = self._get_target_class().from_job(query_job)
+
+        self.assertEqual(profile.slot_millis, 42)
+        self.assertEqual(profile.stages, [])
+        self.assertEqual(profile.critical_path, [])
+        self.assertIsNone(profile.critical_path_ms)
+        self.assertIsNone(profile.bottleneck)
+        self.assertIsNone(profile.max_compute_skew)
+        self.assertIsNone(profile.shuffle_output_bytes)
+        self.assertIsNone(profile.peak_active_units)
+        self.assertEqual(profile.to_summary()['num_stages'], 0)
+
+    def test_to_summary(self):
+        query_job = _make_query_job(
+            query_plan=_make_plan(), totalSlotMs='11500')
+
+        summary = self._get_target_class().from_job(query_job).to_summary()
+
+        self.assertEqual(summary['job_id'], 'job-1')
+        self.assertEqual(summary['slot_millis'], 11500)
+        self.assertEqual(summary['num_stages'], 3)
+        self.assertEqual(summary['bottleneck_stage'], 'S01')
+        self.assertEqual(summary['bottleneck_duration_ms'], 5000)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        query_job = _make_query_job(query_plan=_make_plan())
+
+        df = self._get_target_class().from_job(query_job).to_dataframe()
+
+        self.assertEqual(list(df.index), ['0', '1', '2'])
+        self.assertEqual(list(df['duration_ms']), [2000, 5000, 4000])
+        self.assertEqual(
+            list(df['on_critical_path']), [False, True, True])
+
+    @mock.patch('google.cloud.bigquery.profile.pandas', new=None)
+    def test_to_dataframe_error_if_pandas_is_none(self):
+        query_job = _make_query_job()
+        profile = self._get_target_class().from_job(query_job)
+
+        with self.assertRaises(ValueError):
+            profile.to_dataframe()
+
+
+class Test_jobs_to_dataframe(unittest.TestCase):
+
+    def _call_fut(self, jobs):
+        from google.cloud.bigquery.profile import jobs_to_dataframe
+
+        return jobs_to_dataframe(jobs)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_w_jobs(self):
+        from google.cloud.bigquery.job import CopyJob
+
+        jobs = [
+            _make_query_job(
+                job_id='cheap', totalSlotMs='10', totalBytesBilled='0'),
+            CopyJob('copy', [], None, mock.Mock(project=PROJECT)),
+            _make_query_job(
+                job_id='expensive', query_plan=_make_plan(),
+                totalSlotMs='11500', totalBytesBilled='10485760'),
+        ]
+
+        df = self._call_fut(jobs)
+
+        self.assertEqual(list(df.index), ['cheap', 'expensive'])
+        self.assertEqual(
+            df.sort_values('slot_millis', ascending=False).index[0],
+            'expensive')
+        self.assertEqual(list(df['num_stages']), [0, 3])
+        self.assertEqual(df.loc['expensive', 'bottleneck_stage'], 'S01')
+
+    @mock.patch('google.cloud.bigquery.profile.pandas', new=None)
+    def test_error_if_pandas_is_none(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([])
@@ -1369,6 +1369,138 @@ class TestRowIterator(unittest.TestCase):
             method='GET', path=path, query_params={
                 'maxResults': row_iterator._page_size})
 
+    def _make_rows_api_request(self, values, truncate_at=()):
+        def api_request(method, path, query_params):
+            start = query_params.get('startIndex', 0)
+            end = min(len(values), start + query_params['maxResults'])
+            for index in truncate_at:
+                if start < index < end:
+                    end = index
+            response = {
+                'totalRows': str(len(values)),
+                'rows': [{'f': [{'v': value}]} for value in values[start:end]],
+            }
+            if end < len(values):
+                response['pageToken'] = 'TOKEN-{}'.format(end)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def test_iterate_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        values = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+        path = '/foo'
+        api_request = self._make_rows_api_request(values, truncate_at=(5,))
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_size=2, extra_params={'selectedFields': 'name'},
+            prefetch_pages=2)
+
+        pages = [[row.name for row in page] for page in row_iterator.pages]
+
+        self.assertEqual(pages, [['a', 'b'], ['c', 'd'], ['e', 'f'], ['g']])
+        self.assertEqual(row_iterator.total_rows, 7)
+        self.assertIsNone(row_iterator.next_page_token)
+        requested = sorted(
+            (call[1]['query_params'].get('startIndex', 0),
+             call[1]['query_params']['maxResults'])
+            for call in api_request.call_args_list)
+        # The range starting at 4 is truncated by the API after one row, so
+        # the remainder of that range is requested separately.
+        self.assertEqual(requested, [(0, 2), (2, 2), (4, 2), (5, 1), (6, 1)])
+        for call in api_request.call_args_list:
+            self.assertEqual(call[1]['query_params']['selectedFields'], 'name')
+
+    def test_iterate_w_prefetch_pages_abandoned(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        api_request = self._make_rows_api_request(list('abcdefgh'))
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema,
+            page_size=2, prefetch_pages=2)
+
+        rows = iter(row_iterator)
+        self.assertEqual(next(rows).name, 'a')
+        executor = row_iterator._prefetch_executor
+        self.assertIsNotNone(executor)
+        rows.close()
+
+        self.assertIsNone(row_iterator._prefetch_executor)
+        self.assertEqual(len(row_iterator._prefetch_futures), 0)
+        self.assertTrue(executor._shutdown)
+        # Closing again does nothing.
+        row_iterator.close()
+
+    def test_close_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        api_request = self._make_rows_api_request(list('abcdefgh'))
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, '/foo', schema,
+            page_size=2, prefetch_pages=2)
+        pages = row_iterator.pages
+
+        self.assertEqual([row.name for row in next(pages)], ['a', 'b'])
+        row_iterator.close()
+
+        self.assertEqual(list(pages), [])
+        self.assertIsNone(row_iterator._prefetch_executor)
+
+    def test_iterate_w_prefetch_pages_and_max_results(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[
+            {'totalRows': '7', 'pageToken': 'TOKEN',
+             'rows': [{'f': [{'v': 'b'}]}, {'f': [{'v': 'c'}]}]},
+            {'totalRows': '7',
+             'rows': [{'f': [{'v': 'd'}]}, {'f': [{'v': 'e'}]}]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            max_results=4, extra_params={'startIndex': 1},
+            prefetch_pages=3)
+
+        # Without a page size, the ranges are sized like the first page.
+        rows = [row.name for row in row_iterator]
+
+        self.assertEqual(rows, ['b', 'c', 'd', 'e'])
+        self.assertEqual(api_request.call_count, 2)
+        _, kwargs = api_request.call_args
+        self.assertEqual(
+            kwargs['query_params'], {'startIndex': 3, 'maxResults': 2})
+
+    def test_iterate_w_prefetch_pages_and_page_token(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('name', 'STRING', mode='REQUIRED')]
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[
+            {'totalRows': '3', 'pageToken': 'NEXT',
+             'rows': [{'f': [{'v': 'b'}]}]},
+            {'totalRows': '3', 'rows': [{'f': [{'v': 'c'}]}]},
+        ])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema,
+            page_token='START', prefetch_pages=2)
+
+        rows = [row.name for row in row_iterator]
+
+        self.assertEqual(rows, ['b', 'c'])
+        self.assertIsNone(row_iterator._prefetch_ranges)
+        _, kwargs = api_request.call_args
+        self.assertEqual(kwargs['query_params'], {'pageToken': 'NEXT'})
+
     @unittest.skipIf(pandas is None, 'Requires `pandas`')
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1498,6 +1630,123 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.complete.dtype.name, 'bool')
         self.assertEqual(df.date.dtype.name, 'object')
 
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER'),
+        ]
+        page_1 = {
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': '33'}]},
+            ],
+            'pageToken': 'NEXTPAGE',
+        }
+        page_2 = {
+            'rows': [
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': None}]},
+            ],
+        }
+        path = '/foo'
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(len(df), 3)
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(
+            list(df.name),
+            ['Phred Phlyntstone', 'Bharney Rhubble', 'Wylma Phlyntstone'])
+        # The null in the second page promotes the integers to floats.
+        self.assertEqual(df.age.dtype.name, 'float64')
+        self.assertEqual(list(df.age[:2]), [32.0, 33.0])
+        self.assertTrue(pandas.isnull(df.age[2]))
+        self.assertEqual(api_request.call_count, 2)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_repeated_and_record_fields(self):
+        import datetime
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+            SchemaField('scores', 'INTEGER', mode='REPEATED'),
+            SchemaField('person', 'RECORD', fields=[
+                SchemaField('name', 'STRING'),
+                SchemaField('born', 'DATE'),
+            ]),
+        ]
+        rows = [
+            {'f': [
+                {'v': [{'v': 'a'}, {'v': 'b'}]},
+                {'v': [{'v': '1'}, {'v': '2'}]},
+                {'v': {'f': [{'v': 'Phred'}, {'v': '1990-01-31'}]}},
+            ]},
+            {'f': [
+                {'v': [{'v': 'c'}, {'v': 'd'}]},
+                {'v': []},
+                {'v': None},
+            ]},
+        ]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df.tags.dtype.name, 'object')
+        self.assertEqual(list(df.tags), [['a', 'b'], ['c', 'd']])
+        self.assertEqual(list(df.scores), [[1, 2], []])
+        self.assertEqual(
+            df.person[0],
+            {'name': 'Phred', 'born': datetime.date(1990, 1, 31)})
+        self.assertIsNone(df.person[1])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_nulls_column_dtypes(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField('start_timestamp', 'TIMESTAMP'),
+            SchemaField('miles', 'FLOAT64'),
+            SchemaField('complete', 'BOOL'),
+        ]
+        row_data = [
+            ['1.4338368E9', '1.1', 'true'],
+            [None, None, None],
+            ['1.3878117000001E9', 'Infinity', 'false'],
+        ]
+        rows = [{'f': [{'v': field} for field in row]} for row in row_data]
+        path = '/foo'
+        api_request = mock.Mock(return_value={'rows': rows})
+        row_iterator = RowIterator(
+            mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(df.start_timestamp.dtype.name, 'datetime64[ns, UTC]')
+        self.assertEqual(
+            df.start_timestamp[0],
+            pandas.Timestamp('2015-06-09 08:00:00', tz='UTC'))
+        self.assertTrue(pandas.isnull(df.start_timestamp[1]))
+        self.assertEqual(
+            df.start_timestamp[2],
+            pandas.Timestamp('2013-12-23 15:15:00.000100', tz='UTC'))
+        self.assertEqual(df.miles.dtype.name, 'float64')
+        self.assertEqual(df.miles[2], float('inf'))
+        self.assertEqual(df.complete.dtype.name, 'object')
+        self.assertEqual(list(df.complete), [True, None, False])
+
     @mock.patch('google.cloud.bigquery.table.pandas', new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
         from google.cloud.bigquery.table import RowIterator
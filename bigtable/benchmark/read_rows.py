@@ -0,0 +1,134 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of PartialRowsData over synthetic ReadRows responses.
+
+No RPC is made: the responses are built in memory, so this only measures
+the parsing of chunks into rows.
+
+Usage:
+
+  $ python bigtable/benchmark/read_rows.py --rows 10000 --cells 10
+  $ python bigtable/benchmark/read_rows.py --rows 10 --cells 1 \
+    --value-size 10485760 --chunk-size 65536
+
+"""
+
+import argparse
+import timeit
+
+from google.cloud.bigtable.row_data import PartialRowsData
+from google.cloud.bigtable_v2.proto import bigtable_pb2
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='The number of rows.')
+    parser.add_argument('--cells', type=int, default=10,
+                        help='The number of cells per row.')
+    parser.add_argument('--families', type=int, default=2,
+                        help='The number of column families.')
+    parser.add_argument('--value-size', type=int, default=100,
+                        help='The size of each cell value, in bytes.')
+    parser.add_argument('--chunk-size', type=int, default=1048576,
+                        help='The largest value fragment per chunk.')
+    parser.add_argument('--chunks-per-response', type=int, default=100,
+                        help='The number of chunks per response.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of runs; the best one is reported.')
+    return parser.parse_args()
+
+
+def make_chunks(options):
+    """Yields the chunks of the rows, as sent by the service."""
+    value = b'v' * options.value_size
+    fragments = [value[start:start + options.chunk_size]
+                 for start in range(0, len(value), options.chunk_size)]
+    fragments = fragments or [b'']
+    CellChunk = bigtable_pb2.ReadRowsResponse.CellChunk
+    for row_index in range(options.rows):
+        chunks = []
+        for cell_index in range(options.cells):
+            for index, fragment in enumerate(fragments):
+                chunk = CellChunk(value=fragment)
+                if index == 0:
+                    chunk.family_name.value = 'cf{}'.format(
+                        cell_index % options.families)
+                    chunk.qualifier.value = 'col{}'.format(
+                        cell_index).encode('ascii')
+                    chunk.timestamp_micros = 1000 * cell_index
+                if index < len(fragments) - 1:
+                    chunk.value_size = len(value)
+                chunks.append(chunk)
+        chunks[0].row_key = 'row{:010d}'.format(row_index).encode('ascii')
+        chunks[-1].commit_row = True
+        for chunk in chunks:
+            yield chunk
+
+
+def make_responses(options):
+    """Groups the chunks into responses."""
+    responses = []
+    response = bigtable_pb2.ReadRowsResponse()
+    for chunk in make_chunks(options):
+        response.chunks.add().CopyFrom(chunk)
+        if len(response.chunks) == options.chunks_per_response:
+            responses.append(response)
+            response = bigtable_pb2.ReadRowsResponse()
+    if response.chunks:
+        responses.append(response)
+    return responses
+
+
+class _Stream(object):
+
+    def __init__(self, responses):
+        self._iterator = iter(responses)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    next = __next__
+
+    def cancel(self):
+        pass
+
+
+def read_all(responses):
+    """Parses the responses into rows, as Table.read_rows() does."""
+    request = bigtable_pb2.ReadRowsRequest()
+    rows_data = PartialRowsData(lambda _: _Stream(responses), request)
+    return sum(1 for _ in rows_data)
+
+
+def main():
+    options = parse_options()
+    responses = make_responses(options)
+    timer = timeit.Timer(lambda: read_all(responses))
+    seconds = min(timer.repeat(repeat=options.repeat, number=1))
+    cells = options.rows * options.cells
+    print('{} rows, {} cells, {} bytes per value: {:.3f} sec, '
+          '{:.0f} cells/sec, {:.1f} MB/sec'.format(
+              options.rows, cells, options.value_size, seconds,
+              cells / seconds,
+              cells * options.value_size / seconds / 1048576))
+
+
+if __name__ == '__main__':
+    main()
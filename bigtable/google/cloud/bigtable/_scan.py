@@ -0,0 +1,196 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel scans of row ranges, split into shards.
+
+These are *not* part of the API.
+"""
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from six.moves import queue
+
+from google.cloud._helpers import _to_bytes
+
+
+_ROW = 'row'
+_DONE = 'done'
+_ERROR = 'error'
+_POLL_INTERVAL = 0.1  # seconds
+
+
+def _shard_ranges(sample_keys, start_key=None, end_key=None):
+    """Split a row range at the sampled row keys within it.
+
+    :type sample_keys: iterable of bytes
+    :param sample_keys: The row keys returned by
+                        :meth:`~google.cloud.bigtable.table.Table.sample_row_keys`.
+
+    :type start_key: bytes
+    :param start_key: (Optional) The beginning of the range, included.
+
+    :type end_key: bytes
+    :param end_key: (Optional) The end of the range.
+
+    :rtype: list
+    :returns: The ``(start_key, end_key)`` of each shard, in key order. Each
+              shard includes its start key and excludes its end key, except
+              for the ends of the range. :data:`None` is unbounded.
+    """
+    keys = sorted(set(
+        key for key in sample_keys
+        if key and (start_key is None or key > start_key) and
+        (end_key is None or key < end_key)))
+    bounds = [start_key] + keys + [end_key]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class ParallelScan(object):
+    """Iterator over the rows of a range, read as shards in parallel.
+
+    Each shard is read by its own
+    :class:`~google.cloud.bigtable.row_data.PartialRowsData`, which retries
+    and resumes its ``ReadRows`` stream after transient errors.
+
+    :type table: :class:`~google.cloud.bigtable.table.Table`
+    :param table: The table to read.
+
+    :type sample_keys: iterable of bytes
+    :param sample_keys: The row keys splitting the table into shards.
+
+    :type start_key: bytes
+    :param start_key: (Optional) The beginning of the range, included.
+
+    :type end_key: bytes
+    :param end_key: (Optional) The end of the range, excluded unless
+                    ``end_inclusive``.
+
+    :type filter_: :class:`.RowFilter`
+    :param filter_: (Optional) The filter to apply to each row.
+
+    :type end_inclusive: bool
+    :param end_inclusive: (Optional) Whether ``end_key`` is included.
+
+    :type ordered: bool
+    :param ordered: (Optional) Whether to yield rows in key order. Otherwise,
+                    rows are yielded as soon as any shard reads them.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of shards read concurrently.
+
+    :type max_buffered_rows: int
+    :param max_buffered_rows: (Optional) The number of rows read ahead: in
+                              all, or for each shard if ``ordered``.
+    """
+
+    def __init__(self, table, sample_keys, start_key=None, end_key=None,
+                 filter_=None, end_inclusive=False, ordered=False,
+                 max_workers=8, max_buffered_rows=1000):
+        if start_key is not None:
+            start_key = _to_bytes(start_key)
+        if end_key is not None:
+            end_key = _to_bytes(end_key)
+        self.table = table
+        self.shards = _shard_ranges(
+            (_to_bytes(key) for key in sample_keys), start_key, end_key)
+        self.end_key = end_key
+        self.filter_ = filter_
+        self.end_inclusive = end_inclusive
+        self.ordered = ordered
+        self.max_workers = max_workers
+        self.max_buffered_rows = max_buffered_rows
+
+    def __iter__(self):
+        # Each iteration is a scan of its own, with its own readers.
+        stopped = threading.Event()
+        streams = []
+        if self.ordered:
+            queues = [queue.Queue(maxsize=self.max_buffered_rows)
+                      for _ in self.shards]
+        else:
+            queues = [queue.Queue(maxsize=self.max_buffered_rows)]
+            queues *= len(self.shards)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.shards)))
+        try:
+            # Shards start in key order, so that the first shard not read
+            # entirely is always being read.
+            for shard, rows_queue in zip(self.shards, queues):
+                executor.submit(
+                    self._read_shard, shard, rows_queue, stopped, streams)
+            if self.ordered:
+                for rows_queue in queues:
+                    for row in self._drain(rows_queue, 1):
+                        yield row
+            else:
+                for row in self._drain(queues[0], len(self.shards)):
+                    yield row
+        finally:
+            stopped.set()
+            for stream in list(streams):
+                stream.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _drain(rows_queue, shard_count):
+        """Yield the rows of shards, until all of them are read."""
+        done = 0
+        while done < shard_count:
+            kind, value = rows_queue.get()
+            if kind is _ROW:
+                yield value
+            elif kind is _ERROR:
+                raise value
+            else:
+                done += 1
+
+    @staticmethod
+    def _put(rows_queue, kind, value, stopped):
+        """Queue a message, unless the scan is stopped.
+
+        :rtype: bool
+        :returns: Whether the message was queued.
+        """
+        while not stopped.is_set():
+            try:
+                rows_queue.put((kind, value), timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _read_shard(self, shard, rows_queue, stopped, streams):
+        """Read the rows of a shard into a queue."""
+        if stopped.is_set():
+            return
+        start_key, end_key = shard
+        end_inclusive = self.end_inclusive and end_key == self.end_key
+        try:
+            rows = self.table.read_rows(
+                start_key=start_key, end_key=end_key, filter_=self.filter_,
+                end_inclusive=end_inclusive)
+            streams.append(rows)
+            if stopped.is_set():
+                # Stopped after the streams were cancelled.
+                rows.cancel()
+                return
+            for row in rows:
+                if not self._put(rows_queue, _ROW, row, stopped):
+                    return
+        except Exception as exc:
+            self._put(rows_queue, _ERROR, exc, stopped)
+            return
+        self._put(rows_queue, _DONE, None, stopped)
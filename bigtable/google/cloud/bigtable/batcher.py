@@ -14,10 +14,18 @@
 
 """User friendly container for Google Cloud Bigtable MutationBatcher."""
 
+import threading
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
 
 FLUSH_COUNT = 1000
 MAX_MUTATIONS = 100000
 MAX_ROW_BYTES = 5242880  # 5MB
+FLUSH_INTERVAL = 1.0  # seconds
+MAX_IN_FLIGHT_RPCS = 10
+MAX_OUTSTANDING_BYTES = 104857600  # 100MB
 
 
 class MaxMutationsError(ValueError):
@@ -38,8 +46,7 @@ class MutationsBatcher(object):
     memory will not necessarily be sent to the service, even after the
     completion of the mutate() method.
 
-    TODO: Performance would dramatically improve if this class had the
-    capability of asynchronous, parallel RPCs.
+    For asynchronous, parallel RPCs, use :class:`AsyncMutationsBatcher`.
 
     :type table: class
     :param table: class:`~google.cloud.bigtable.table.Table`.
@@ -149,3 +156,254 @@ class MutationsBatcher(object):
             self.total_mutation_count = 0
             self.total_size = 0
             self.rows = []
+
+
+class AsyncMutationsBatcher(object):
+    """ An AsyncMutationsBatcher sends batches of DirectRows to Cloud Bigtable
+    in the background, with several ``MutateRows`` RPCs in flight.
+
+    A batch is sent when it reaches ``flush_count`` rows or ``max_row_bytes``,
+    and at least every ``flush_interval`` seconds. :meth:`mutate` does not
+    wait for the batch to be sent, unless the rows not yet applied reach
+    ``max_outstanding_bytes``: it then waits for some of them to be applied.
+
+    :meth:`mutate` returns a future of the status of the row mutation.
+    :meth:`close` sends the remaining rows and waits for all of them to be
+    applied, as does leaving the batcher used as a context manager.
+
+    Example:
+        >>> with table.async_mutations_batcher() as batcher:
+        ...     futures = batcher.mutate_rows(rows)
+        >>>
+        >>> failed = [future.result() for future in futures
+        ...           if future.result().code != 0]
+
+    :type table: class
+    :param table: class:`~google.cloud.bigtable.table.Table`.
+
+    :type flush_count: int
+    :param flush_count: (Optional) Max number of rows per batch. Default is
+    FLUSH_COUNT (1000 rows).
+
+    :type max_row_bytes: int
+    :param max_row_bytes: (Optional) Max number of row mutations size per
+    batch. Default is MAX_ROW_BYTES (5 MB).
+
+    :type flush_interval: float
+    :param flush_interval: (Optional) Max number of seconds rows wait in the
+    current batch before it is sent. If :data:`None`, batches are only sent
+    when full, or by :meth:`flush` or :meth:`close`. Default is
+    FLUSH_INTERVAL (1 second).
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) Max number of concurrent ``MutateRows``
+    RPCs. Default is MAX_IN_FLIGHT_RPCS (10).
+
+    :type max_outstanding_bytes: int
+    :param max_outstanding_bytes: (Optional) Max number of row mutations size
+    not yet applied, in the current batch or in flight. Default is
+    MAX_OUTSTANDING_BYTES (100 MB).
+    """
+
+    def __init__(self, table, flush_count=FLUSH_COUNT,
+                 max_row_bytes=MAX_ROW_BYTES, flush_interval=FLUSH_INTERVAL,
+                 max_in_flight=MAX_IN_FLIGHT_RPCS,
+                 max_outstanding_bytes=MAX_OUTSTANDING_BYTES):
+        self.table = table
+        self.flush_count = flush_count
+        self.max_row_bytes = max_row_bytes
+        self.flush_interval = flush_interval
+        self.max_in_flight = max_in_flight
+        self.max_outstanding_bytes = max_outstanding_bytes
+
+        self._rows = []
+        self._futures = []
+        self._mutation_count = 0
+        self._size = 0
+        self._outstanding_bytes = 0
+        self._batches_in_flight = 0
+        self._errors = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._stopped = threading.Event()
+        self._flusher = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name='AsyncMutationsBatcher.flusher')
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def outstanding_bytes(self):
+        """Size of the row mutations not yet applied.
+
+        :rtype: int
+        :returns: The size of the rows in the current batch or in flight.
+        """
+        return self._outstanding_bytes
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError('The batcher is closed.')
+
+    def mutate(self, row):
+        """ Add a row to the current batch.
+
+        The batch is sent in the background when it meets one of the size
+        limits. If the rows not yet applied would exceed
+        ``max_outstanding_bytes``, the current batch is sent and this method
+        waits for rows in flight to be applied.
+
+        :type row: class
+        :param row: class:`~google.cloud.bigtable.row.DirectRow`.
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: The future of the status (``google.rpc.status_pb2.Status``)
+                  of the row mutation. If the ``MutateRows`` RPC fails, the
+                  future raises its exception instead. Cancelling the future
+                  before its batch is sent drops the row from the batch.
+        :raises: One of the following:
+                 * :exc:`.batcher.MaxMutationsError` if the row exceeds max
+                   mutations count.
+                 * :exc:`ValueError` if the batcher is closed.
+        """
+        mutation_count = len(row._get_mutations())
+        if mutation_count > MAX_MUTATIONS:
+            raise MaxMutationsError(
+                'The row key {} exceeds the number of mutations {}.'.format(
+                    row.row_key, mutation_count), )
+        size = row.get_mutations_size()
+        future = Future()
+
+        with self._condition:
+            self._check_open()
+            # A row larger than the limit is sent once nothing else is left.
+            while (self._outstanding_bytes and
+                   self._outstanding_bytes + size >
+                   self.max_outstanding_bytes):
+                self._send_batch()
+                self._condition.wait()
+                self._check_open()
+
+            if (self._mutation_count + mutation_count) >= MAX_MUTATIONS:
+                self._send_batch()
+
+            self._rows.append(row)
+            self._futures.append(future)
+            self._mutation_count += mutation_count
+            self._size += size
+            self._outstanding_bytes += size
+
+            if (self._size >= self.max_row_bytes or
+                    len(self._rows) >= self.flush_count):
+                self._send_batch()
+
+        return future
+
+    def mutate_rows(self, rows):
+        """ Add rows to the current batch.
+
+        :type rows: list:[`~google.cloud.bigtable.row.DirectRow`]
+        :param rows: list:[`~google.cloud.bigtable.row.DirectRow`].
+
+        :rtype: list
+        :returns: The futures of the statuses of the row mutations, as
+                  returned by :meth:`mutate`, in the same order as ``rows``.
+        """
+        return [self.mutate(row) for row in rows]
+
+    def _send_batch(self):
+        """Send the current batch in the background.
+
+        Must be called with ``_condition`` acquired.
+        """
+        if not self._rows:
+            return
+        rows, futures, size = self._rows, self._futures, self._size
+        self._rows = []
+        self._futures = []
+        self._mutation_count = 0
+        self._size = 0
+        self._batches_in_flight += 1
+        self._executor.submit(self._mutate_rows, rows, futures, size)
+
+    def _mutate_rows(self, rows, futures, size):
+        """Apply a batch, then resolve the futures of its rows.
+
+        Rows whose future was cancelled are not sent.
+        """
+        error = None
+        try:
+            pending = [
+                (row, future) for row, future in zip(rows, futures)
+                if future.set_running_or_notify_cancel()]
+            if pending:
+                rows, futures = zip(*pending)
+                try:
+                    statuses = self.table.mutate_rows(list(rows))
+                except Exception as exc:
+                    error = exc
+                    for future in futures:
+                        future.set_exception(exc)
+                else:
+                    for future, status in zip(futures, statuses):
+                        future.set_result(status)
+        finally:
+            with self._condition:
+                self._outstanding_bytes -= size
+                self._batches_in_flight -= 1
+                if error is not None:
+                    self._errors.append(error)
+                self._condition.notify_all()
+
+    def _flush_periodically(self):
+        """Send the current batch every ``flush_interval`` seconds."""
+        while not self._stopped.wait(self.flush_interval):
+            with self._condition:
+                self._send_batch()
+
+    def flush(self):
+        """ Sends the current batch, and waits for all batches in flight to
+        be applied.
+
+        :raises: The first exception raised by a ``MutateRows`` RPC since the
+                 last flush, if any. Per-row failures are not raised: they
+                 are reported by the status of each row.
+        """
+        with self._condition:
+            self._send_batch()
+            while self._batches_in_flight:
+                self._condition.wait()
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """ Sends the remaining rows, waits for all of them to be applied and
+        releases the background threads.
+
+        Further calls to :meth:`mutate` raise :exc:`ValueError`.
+
+        :raises: The first exception raised by a ``MutateRows`` RPC since the
+                 last flush, if any.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
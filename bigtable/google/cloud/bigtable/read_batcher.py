@@ -0,0 +1,189 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User friendly container for Google Cloud Bigtable ReadBatcher."""
+
+import collections
+import threading
+import time
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from google.cloud._helpers import _to_bytes
+
+
+MAX_KEYS_PER_REQUEST = 1000
+READ_WINDOW = 0.002  # seconds
+MAX_IN_FLIGHT_READS = 10
+
+
+class ReadBatcher(object):
+    """ A ReadBatcher coalesces point reads of single rows into
+    ``ReadRows`` RPCs of many keys.
+
+    The keys read within ``window`` seconds of each other are deduplicated
+    and read with :meth:`~google.cloud.bigtable.table.Table.read_rows_batch`,
+    in the background. :meth:`read_row` returns a future of the row, so that
+    it can be called concurrently by many threads.
+
+    Example:
+        >>> with table.read_batcher() as batcher:
+        ...     futures = [batcher.read_row(key) for key in keys]
+        ...     rows = [future.result() for future in futures]
+
+    :type table: class
+    :param table: class:`~google.cloud.bigtable.table.Table`.
+
+    :type filter_: :class:`.RowFilter`
+    :param filter_: (Optional) The filter to apply to the contents of every
+                    row. If unset, reads every column in each row.
+
+    :type window: float
+    :param window: (Optional) Number of seconds to wait for more keys after
+                   the first one, before sending them. Default is
+                   READ_WINDOW (2 milliseconds).
+
+    :type max_keys: int
+    :param max_keys: (Optional) Max number of keys per batch; a full batch is
+                     sent at once. Default is MAX_KEYS_PER_REQUEST (1000).
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) Max number of batches read concurrently.
+                          Default is MAX_IN_FLIGHT_READS (10).
+    """
+
+    def __init__(self, table, filter_=None, window=READ_WINDOW,
+                 max_keys=MAX_KEYS_PER_REQUEST,
+                 max_in_flight=MAX_IN_FLIGHT_READS):
+        self.table = table
+        self.filter_ = filter_
+        self.window = window
+        self.max_keys = max_keys
+        self.max_in_flight = max_in_flight
+
+        self._pending = collections.OrderedDict()
+        self._deadline = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name='ReadBatcher.dispatcher')
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def read_row(self, row_key):
+        """ Add a row key to the current batch.
+
+        :type row_key: bytes
+        :param row_key: The key of the row to read.
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: The future of the row, a :class:`.PartialRowData`, or of
+                  :data:`None` if the row does not exist. Reads of the same
+                  key in the same batch share the same future. Cancelling
+                  it before the batch is read drops the key from the batch.
+        :raises: :exc:`ValueError` if the batcher is closed.
+        """
+        row_key = _to_bytes(row_key)
+        with self._condition:
+            if self._closed:
+                raise ValueError('The batcher is closed.')
+            future = self._pending.get(row_key)
+            if future is None:
+                future = self._pending[row_key] = Future()
+                if len(self._pending) >= self.max_keys:
+                    self._send_batch()
+                elif len(self._pending) == 1:
+                    self._deadline = time.time() + self.window
+                    self._condition.notify_all()
+        return future
+
+    def read_rows(self, row_keys):
+        """ Add row keys to the current batch.
+
+        :type row_keys: list
+        :param row_keys: The keys of the rows to read.
+
+        :rtype: list
+        :returns: The futures of the rows, as returned by :meth:`read_row`,
+                  in the same order as ``row_keys``.
+        """
+        return [self.read_row(row_key) for row_key in row_keys]
+
+    def _send_batch(self):
+        """Read the current batch in the background.
+
+        Must be called with ``_condition`` acquired.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, collections.OrderedDict()
+        self._deadline = None
+        self._executor.submit(self._read_rows, pending)
+
+    def _read_rows(self, pending):
+        """Read a batch, then resolve the futures of its keys.
+
+        Keys whose future was cancelled are not read.
+        """
+        pending = [
+            (row_key, future) for row_key, future in pending.items()
+            if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        try:
+            rows = self.table.read_rows_batch(
+                [row_key for row_key, _ in pending], filter_=self.filter_,
+                max_keys_per_request=self.max_keys, max_workers=1)
+        except Exception as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+        else:
+            for (_, future), row in zip(pending, rows):
+                future.set_result(row)
+
+    def _dispatch(self):
+        """Send each batch ``window`` seconds after its first key."""
+        with self._condition:
+            while not self._closed:
+                if self._deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._deadline - time.time()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._send_batch()
+
+    def close(self):
+        """ Sends the remaining keys, waits for all reads to complete and
+        releases the background threads.
+
+        Further calls to :meth:`read_row` raise :exc:`ValueError`.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._send_batch()
+            self._condition.notify_all()
+        self._dispatcher.join()
+        self._executor.shutdown()
@@ -16,9 +16,19 @@
 
 
 import copy
+import struct
+
 import six
 
 import grpc
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 
 from google.api_core import exceptions
 from google.api_core import retry
@@ -37,6 +47,54 @@ _MISSING_COLUMN = (
 _MISSING_INDEX = (
     'Index {!r} is not valid for the cells stored in this row for column {} '
     'in the column family {}. There are {} such cells.')
+_MAX_CACHED_NAMES = 10000
+_NO_PANDAS_ERROR = (
+    'The pandas library is not installed, please install '
+    'pandas to use the to_dataframe() function.'
+)
+_NO_PYARROW_ERROR = (
+    'The pyarrow library is not installed, please install '
+    'pyarrow to use the to_arrow() function.'
+)
+_INT64 = struct.Struct('>q')
+_FLOAT64 = struct.Struct('>d')
+
+
+def decode_int64(value):
+    """Decode a big-endian signed 64-bit integer, as written by
+    :meth:`~google.cloud.bigtable.row.AppendRow.increment_cell_value`.
+
+    :type value: bytes
+    :param value: The cell value.
+
+    :rtype: int
+    :returns: The decoded integer.
+    """
+    return _INT64.unpack(value)[0]
+
+
+def decode_float64(value):
+    """Decode a big-endian IEEE 754 double.
+
+    :type value: bytes
+    :param value: The cell value.
+
+    :rtype: float
+    :returns: The decoded float.
+    """
+    return _FLOAT64.unpack(value)[0]
+
+
+def decode_utf8(value):
+    """Decode UTF-8 text.
+
+    :type value: bytes
+    :param value: The cell value.
+
+    :rtype: str
+    :returns: The decoded text.
+    """
+    return value.decode('utf-8')
 
 
 class Cell(object):
@@ -52,6 +110,8 @@ class Cell(object):
     :param labels: (Optional) List of strings. Labels applied to the cell.
     """
 
+    __slots__ = ('value', 'timestamp_micros', 'labels')
+
     def __init__(self, value, timestamp_micros, labels=None):
         self.value = value
         self.timestamp_micros = timestamp_micros
@@ -113,6 +173,10 @@ class PartialCellData(object):
     :type value: bytes
     :param value: The (accumulated) value of the (partial) cell.
     """
+
+    __slots__ = ('row_key', 'family_name', 'qualifier', 'timestamp_micros',
+                 'labels', 'value')
+
     def __init__(self, row_key, family_name, qualifier, timestamp_micros,
                  labels=(), value=b''):
         self.row_key = row_key
@@ -128,7 +192,11 @@ class PartialCellData(object):
         :type value: bytes
         :param value: bytes to append
         """
-        self.value += value
+        # Appending to bytes copies the whole value, which is quadratic
+        # for cells split into many chunks.
+        if not isinstance(self.value, bytearray):
+            self.value = bytearray(self.value)
+        self.value.extend(value)
 
 
 class PartialRowData(object):
@@ -141,6 +209,8 @@ class PartialRowData(object):
     :param row_key: The key for the row holding the (partial) data.
     """
 
+    __slots__ = ('_row_key', '_cells')
+
     def __init__(self, row_key):
         self._row_key = row_key
         self._cells = {}
@@ -353,6 +423,12 @@ class PartialRowsData(object):
 
         self.rows = {}
         self._state = self.STATE_NEW_ROW
+        # Family names and qualifiers already read, so that the cells of
+        # all rows share the same objects.
+        self._family_names = {}
+        self._qualifiers = {}
+        # While exporting columns, the (family, qualifier) to keep.
+        self._columns = None
 
     @property
     def state(self):
@@ -383,6 +459,116 @@ class PartialRowsData(object):
         for row in self:
             self.rows[row.row_key] = row
 
+    def _read_columns(self, columns, row_key_column):
+        """Consume the rows into the columns of a table.
+
+        Only the latest cell of the mapped columns is kept, and rows are
+        discarded as soon as their values are collected.
+
+        :type columns: dict
+        :param columns: See :meth:`to_dataframe`.
+
+        :type row_key_column: str
+        :param row_key_column: See :meth:`to_dataframe`.
+
+        :rtype: tuple
+        :returns: The names of the columns, and the list of the values of
+                  each.
+        """
+        specs = []
+        for (family, qualifier), target in six.iteritems(columns):
+            name, decoder = target, None
+            if isinstance(target, tuple):
+                name, decoder = target
+            specs.append((family, _to_bytes(qualifier), name, decoder))
+
+        row_keys = []
+        column_values = [[] for _ in specs]
+        names = [spec[2] for spec in specs]
+        values = list(column_values)
+        if row_key_column is not None:
+            names.insert(0, row_key_column)
+            values.insert(0, row_keys)
+
+        self._columns = set((spec[0], spec[1]) for spec in specs)
+        try:
+            for row in self:
+                row_keys.append(row.row_key)
+                cells = row._cells
+                for (family, qualifier, _, decoder), column in zip(
+                        specs, column_values):
+                    qualified = cells.get(family, {}).get(qualifier)
+                    if qualified is None:
+                        column.append(None)
+                    elif decoder is None:
+                        column.append(qualified[0].value)
+                    else:
+                        column.append(decoder(qualified[0].value))
+        finally:
+            self._columns = None
+        return names, values
+
+    def to_dataframe(self, columns, row_key_column='row_key'):
+        """Consume the rows into a pandas DataFrame.
+
+        Each mapped column holds the value of the latest cell of a column
+        family and qualifier, or :data:`None` if the row has no such cell.
+        Other cells are skipped while reading, and rows are not kept.
+
+        Example:
+            >>> from google.cloud.bigtable.row_data import decode_int64
+            >>> rows_data = table.read_rows()
+            >>> frame = rows_data.to_dataframe(collections.OrderedDict([
+            ...     (('stats', b'views'), ('views', decode_int64)),
+            ...     (('info', b'title'), 'title'),
+            ... ]))
+
+        :type columns: dict
+        :param columns: Maps ``(column_family_id, column)`` to the name of
+                        the column in the frame, or to a ``(name, decoder)``
+                        tuple. The decoder, such as :func:`decode_int64`,
+                        converts the bytes of the cell value. Use an
+                        :class:`~collections.OrderedDict` to order columns.
+
+        :type row_key_column: str
+        :param row_key_column: (Optional) The name of the column holding the
+                               row keys, first. If :data:`None`, row keys
+                               are not included.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A frame with one row per row read.
+        :raises: :exc:`ValueError` if the :mod:`pandas` library cannot be
+                 imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        names, values = self._read_columns(columns, row_key_column)
+        return pandas.DataFrame(dict(zip(names, values)), columns=names)
+
+    def to_arrow(self, columns, row_key_column='row_key'):
+        """Consume the rows into a pyarrow Table.
+
+        Columns are built as for :meth:`to_dataframe`. Their types are
+        inferred from the decoded values: ``binary`` without a decoder,
+        ``int64`` with :func:`decode_int64`.
+
+        :type columns: dict
+        :param columns: See :meth:`to_dataframe`.
+
+        :type row_key_column: str
+        :param row_key_column: (Optional) See :meth:`to_dataframe`.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: A table with one row per row read.
+        :raises: :exc:`ValueError` if the :mod:`pyarrow` library cannot be
+                 imported.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        names, values = self._read_columns(columns, row_key_column)
+        arrays = [pyarrow.array(column) for column in values]
+        return pyarrow.Table.from_arrays(arrays, names=names)
+
     def _create_retry_request(self):
         """Helper for :meth:`__iter__`."""
         req_manager = _ReadRowsRequestManager(self.request,
@@ -472,10 +658,12 @@ class PartialRowsData(object):
         if self._cell is None:
             qualifier = None
             if chunk.HasField('qualifier'):
-                qualifier = chunk.qualifier.value
+                qualifier = self._cached_name(
+                    self._qualifiers, chunk.qualifier.value)
             family = None
             if chunk.HasField('family_name'):
-                family = chunk.family_name.value
+                family = self._cached_name(
+                    self._family_names, chunk.family_name.value)
 
             self._cell = PartialCellData(
                 chunk.row_key,
@@ -489,6 +677,16 @@ class PartialRowsData(object):
         else:
             self._cell.append_value(chunk.value)
 
+    @staticmethod
+    def _cached_name(names, name):
+        """Helper for :meth:`_update_cell`."""
+        cached = names.get(name)
+        if cached is None:
+            if len(names) >= _MAX_CACHED_NAMES:
+                names.clear()
+            cached = names[name] = name
+        return cached
+
     def _validate_cell_data_new_cell(self):
         cell = self._cell
         if (not cell.row_key or
@@ -517,10 +715,23 @@ class PartialRowsData(object):
     def _save_current_cell(self):
         """Helper for :meth:`consume_next`."""
         row, cell = self._row, self._cell
-        family = row._cells.setdefault(cell.family_name, {})
-        qualified = family.setdefault(cell.qualifier, [])
-        complete = Cell.from_pb(cell)
-        qualified.append(complete)
+        if self._columns is not None and (
+                (cell.family_name, cell.qualifier) not in self._columns or
+                cell.qualifier in row._cells.get(cell.family_name, ())):
+            # Only the first, latest cell of an exported column is kept.
+            self._cell, self._previous_cell = None, cell
+            return
+        family = row._cells.get(cell.family_name)
+        if family is None:
+            family = row._cells[cell.family_name] = {}
+        qualified = family.get(cell.qualifier)
+        if qualified is None:
+            qualified = family[cell.qualifier] = []
+        value = cell.value
+        if isinstance(value, bytearray):
+            value = bytes(value)
+        qualified.append(Cell(value, cell.timestamp_micros,
+                              cell.labels or None))
         self._cell, self._previous_cell = None, cell
 
     def _copy_from_previous(self, cell):
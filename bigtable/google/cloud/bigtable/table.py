@@ -15,6 +15,8 @@
 """User-friendly container for Google Cloud Bigtable Table."""
 
 
+from concurrent.futures import ThreadPoolExecutor
+
 from grpc import StatusCode
 
 from google.api_core.exceptions import RetryError
@@ -23,10 +25,17 @@ from google.api_core.retry import if_exception_type
 from google.api_core.retry import Retry
 from google.api_core.gapic_v1.method import wrap_method
 from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable._scan import ParallelScan
 from google.cloud.bigtable.column_family import _gc_rule_from_pb
 from google.cloud.bigtable.column_family import ColumnFamily
+from google.cloud.bigtable.read_batcher import ReadBatcher
+from google.cloud.bigtable.read_batcher import (
+    MAX_IN_FLIGHT_READS, MAX_KEYS_PER_REQUEST, READ_WINDOW)
+from google.cloud.bigtable.batcher import AsyncMutationsBatcher
 from google.cloud.bigtable.batcher import MutationsBatcher
 from google.cloud.bigtable.batcher import (FLUSH_COUNT, MAX_ROW_BYTES)
+from google.cloud.bigtable.batcher import (
+    FLUSH_INTERVAL, MAX_IN_FLIGHT_RPCS, MAX_OUTSTANDING_BYTES)
 from google.cloud.bigtable.row import AppendRow
 from google.cloud.bigtable.row import ConditionalRow
 from google.cloud.bigtable.row import DirectRow
@@ -342,6 +351,113 @@ class Table(object):
             data_client.transport.read_rows,
             request_pb)
 
+    def read_rows_batch(self, row_keys, filter_=None,
+                        max_keys_per_request=MAX_KEYS_PER_REQUEST,
+                        max_workers=8):
+        """Read many rows by key, with as few ``ReadRows`` RPCs as possible.
+
+        Keys are deduplicated and read as row sets of at most
+        ``max_keys_per_request`` keys, concurrently.
+
+        :type row_keys: list
+        :param row_keys: The keys of the rows to read.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        specified row(s). If unset, reads every column in
+                        each row.
+
+        :type max_keys_per_request: int
+        :param max_keys_per_request: (Optional) The maximum number of keys
+                                     read by each RPC.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of RPCs made
+                            concurrently.
+
+        :rtype: list
+        :returns: The :class:`.PartialRowData` of each key, or :data:`None`
+                  if the row does not exist, in the same order as
+                  ``row_keys``.
+        """
+        row_keys = [_to_bytes(row_key) for row_key in row_keys]
+        unique_keys = sorted(set(row_keys))
+        key_groups = [
+            unique_keys[index:index + max_keys_per_request]
+            for index in range(0, len(unique_keys), max_keys_per_request)]
+
+        def read_key_group(key_group):
+            row_set = RowSet()
+            for row_key in key_group:
+                row_set.add_row_key(row_key)
+            return list(self.read_rows(filter_=filter_, row_set=row_set))
+
+        if len(key_groups) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(key_groups))) as pool:
+                results = list(pool.map(read_key_group, key_groups))
+        else:
+            results = [read_key_group(key_group) for key_group in key_groups]
+
+        rows = {}
+        for group_rows in results:
+            for row in group_rows:
+                rows[row.row_key] = row
+        return [rows.get(row_key) for row_key in row_keys]
+
+    def read_rows_parallel(self, start_key=None, end_key=None, filter_=None,
+                           end_inclusive=False, ordered=False, max_workers=8,
+                           max_buffered_rows=1000):
+        """Read rows from this table, with one stream per shard.
+
+        The range is split into shards at the row keys returned by
+        :meth:`sample_row_keys`, and shards are read in parallel. Each shard
+        is read like :meth:`read_rows`, which resumes after transient
+        errors.
+
+        :type start_key: bytes
+        :param start_key: (Optional) The beginning of a range of row keys to
+                          read from. The range will include ``start_key``. If
+                          left empty, will be interpreted as the empty string.
+
+        :type end_key: bytes
+        :param end_key: (Optional) The end of a range of row keys to read from.
+                        The range will not include ``end_key``. If left empty,
+                        will be interpreted as an infinite string.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        specified row(s). If unset, reads every column in
+                        each row.
+
+        :type end_inclusive: bool
+        :param end_inclusive: (Optional) Whether the ``end_key`` should be
+                      considered inclusive. The default is False (exclusive).
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether rows are yielded in key order. The
+                        default (False) yields rows as soon as they are read,
+                        which is faster.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of shards read
+                            concurrently.
+
+        :type max_buffered_rows: int
+        :param max_buffered_rows: (Optional) The maximum number of rows read
+                                  ahead of the caller, or of rows read ahead
+                                  for each shard if ``ordered``.
+
+        :rtype: iterable
+        :returns: A :class:`.PartialRowData` for each row returned. Closing
+                  the iterator cancels the streams still open.
+        """
+        sample_keys = [response.row_key for response in self.sample_row_keys()]
+        return ParallelScan(
+            self, sample_keys, start_key=start_key, end_key=end_key,
+            filter_=filter_, end_inclusive=end_inclusive, ordered=ordered,
+            max_workers=max_workers, max_buffered_rows=max_buffered_rows)
+
     def yield_rows(self, **kwargs):
         """Read rows from this table.
 
@@ -518,6 +634,78 @@ class Table(object):
         """
         return MutationsBatcher(self, flush_count, max_row_bytes)
 
+    def read_batcher(self, filter_=None, window=READ_WINDOW,
+                     max_keys=MAX_KEYS_PER_REQUEST,
+                     max_in_flight=MAX_IN_FLIGHT_READS):
+        """Factory to create a read batcher associated with this instance.
+
+        The batcher coalesces concurrent point reads into
+        :meth:`read_rows_batch` calls.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of
+                        every row. If unset, reads every column in each row.
+
+        :type window: float
+        :param window: (Optional) Number of seconds to wait for more keys
+                       after the first one. Default is READ_WINDOW
+                       (2 milliseconds).
+
+        :type max_keys: int
+        :param max_keys: (Optional) Max number of keys per batch. Default is
+                         MAX_KEYS_PER_REQUEST (1000).
+
+        :type max_in_flight: int
+        :param max_in_flight: (Optional) Max number of batches read
+                              concurrently. Default is MAX_IN_FLIGHT_READS
+                              (10).
+
+        :rtype: :class:`~google.cloud.bigtable.read_batcher.ReadBatcher`
+        :returns: The batcher.
+        """
+        return ReadBatcher(self, filter_, window, max_keys, max_in_flight)
+
+    def async_mutations_batcher(self, flush_count=FLUSH_COUNT,
+                                max_row_bytes=MAX_ROW_BYTES,
+                                flush_interval=FLUSH_INTERVAL,
+                                max_in_flight=MAX_IN_FLIGHT_RPCS,
+                                max_outstanding_bytes=MAX_OUTSTANDING_BYTES):
+        """Factory to create an asynchronous mutation batcher associated
+        with this instance.
+
+        Batches are sent in the background, with several ``MutateRows``
+        RPCs in flight. Use the batcher as a context manager, or call its
+        ``close()`` method, to make sure all rows are applied.
+
+        :type flush_count: int
+        :param flush_count: (Optional) Maximum number of rows per batch.
+                Default is FLUSH_COUNT (1000 rows).
+
+        :type max_row_bytes: int
+        :param max_row_bytes: (Optional) Max number of row mutations size
+                per batch. Default is MAX_ROW_BYTES (5 MB).
+
+        :type flush_interval: float
+        :param flush_interval: (Optional) Max number of seconds rows wait in
+                the current batch before it is sent, or :data:`None` to only
+                send full batches. Default is FLUSH_INTERVAL (1 second).
+
+        :type max_in_flight: int
+        :param max_in_flight: (Optional) Max number of concurrent
+                ``MutateRows`` RPCs. Default is MAX_IN_FLIGHT_RPCS (10).
+
+        :type max_outstanding_bytes: int
+        :param max_outstanding_bytes: (Optional) Max number of row mutations
+                size not yet applied; adding rows beyond it waits for rows in
+                flight. Default is MAX_OUTSTANDING_BYTES (100 MB).
+
+        :rtype: :class:`~google.cloud.bigtable.batcher.AsyncMutationsBatcher`
+        :returns: The batcher.
+        """
+        return AsyncMutationsBatcher(
+            self, flush_count, max_row_bytes, flush_interval, max_in_flight,
+            max_outstanding_bytes)
+
 
 class _RetryableMutateRowsWorker(object):
     """A callable worker that can retry to mutate rows with transient errors.
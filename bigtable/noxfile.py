@@ -36,7 +36,13 @@ def default(session):
     session.install('mock', 'pytest', 'pytest-cov')
     for local_dep in LOCAL_DEPS:
         session.install('-e', local_dep)
-    session.install('-e', '.')
+
+    # Pyarrow does not support Python 3.7
+    if session.python == '3.7':
+        dev_install = '.[pandas]'
+    else:
+        dev_install = '.[pandas, pyarrow]'
+    session.install('-e', dev_install)
 
     # Run py.test against the unit tests.
     session.run(
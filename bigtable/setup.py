@@ -34,6 +34,10 @@ dependencies = [
     'grpc-google-iam-v1<0.12dev,>=0.11.4'
 ]
 extras = {
+    'pandas': 'pandas>=0.17.1',
+    # Exclude PyArrow dependency from Windows Python 2.7.
+    'pyarrow: platform_system != "Windows" or python_version >= "3.4"':
+        'pyarrow>=0.4.1',
 }
 
 
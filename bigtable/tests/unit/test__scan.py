@@ -0,0 +1,214 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+
+class Test__shard_ranges(unittest.TestCase):
+
+    def _call_fut(self, sample_keys, start_key=None, end_key=None):
+        from google.cloud.bigtable._scan import _shard_ranges
+
+        return _shard_ranges(sample_keys, start_key, end_key)
+
+    def test_whole_table(self):
+        self.assertEqual(
+            self._call_fut([b'm', b'f', b'', b'm']),
+            [(None, b'f'), (b'f', b'm'), (b'm', None)])
+
+    def test_no_samples(self):
+        self.assertEqual(self._call_fut([]), [(None, None)])
+
+    def test_w_range(self):
+        self.assertEqual(
+            self._call_fut([b'b', b'f', b'm', b't'], b'f', b'p'),
+            [(b'f', b'm'), (b'm', b'p')])
+
+
+class _Row(object):
+
+    def __init__(self, row_key):
+        self.row_key = row_key
+
+
+class _Stream(object):
+
+    def __init__(self, rows, error=None):
+        self._rows = rows
+        self._error = error
+        self.cancelled = False
+
+    def __iter__(self):
+        for row in self._rows:
+            yield row
+        if self._error is not None:
+            raise self._error
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _Table(object):
+
+    def __init__(self, keys, error_start_key=None):
+        self._keys = sorted(keys)
+        self._error_start_key = error_start_key
+        self.read_rows_calls = []
+        self.streams = []
+
+    def read_rows(self, start_key=None, end_key=None, filter_=None,
+                  end_inclusive=False):
+        self.read_rows_calls.append(
+            (start_key, end_key, filter_, end_inclusive))
+        rows = [
+            _Row(key) for key in self._keys
+            if (start_key is None or key >= start_key) and
+            (end_key is None or key < end_key or
+             (end_inclusive and key == end_key))]
+        error = None
+        if start_key is not None and start_key == self._error_start_key:
+            error = ValueError(start_key)
+        stream = _Stream(rows, error)
+        self.streams.append(stream)
+        return stream
+
+
+class TestParallelScan(unittest.TestCase):
+
+    KEYS = [b'a', b'c', b'f', b'g', b'm', b'n', b'x', b'z']
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable._scan import ParallelScan
+
+        return ParallelScan
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_unordered(self):
+        table = _Table(self.KEYS)
+        filter_ = mock.sentinel.filter
+
+        scan = self._make_one(
+            table, [b'f', b'm'], filter_=filter_, max_workers=2)
+        keys = [row.row_key for row in scan]
+
+        self.assertEqual(sorted(keys), self.KEYS)
+        self.assertEqual(sorted(table.read_rows_calls, key=repr), sorted([
+            (None, b'f', filter_, False),
+            (b'f', b'm', filter_, False),
+            (b'm', None, filter_, False),
+        ], key=repr))
+
+    def test_ordered(self):
+        table = _Table(self.KEYS)
+
+        scan = self._make_one(
+            table, [b'b', b'f', b'm', b'y'], ordered=True, max_workers=3,
+            max_buffered_rows=1)
+
+        self.assertEqual([row.row_key for row in scan], self.KEYS)
+
+    def test_w_range(self):
+        table = _Table(self.KEYS)
+
+        scan = self._make_one(
+            table, [b'b', b'f', b'm', b'y'], start_key='c', end_key='x',
+            end_inclusive=True, ordered=True)
+
+        self.assertEqual(
+            [row.row_key for row in scan],
+            [b'c', b'f', b'g', b'm', b'n', b'x'])
+        self.assertEqual(
+            [call[3] for call in sorted(table.read_rows_calls)],
+            [False, False, True])
+
+    def test_iterate_twice(self):
+        table = _Table(self.KEYS)
+
+        scan = self._make_one(table, [b'f', b'm'], ordered=True)
+
+        self.assertEqual([row.row_key for row in scan], self.KEYS)
+        self.assertEqual([row.row_key for row in scan], self.KEYS)
+        self.assertEqual(len(table.read_rows_calls), 6)
+
+    def test_error(self):
+        table = _Table(self.KEYS, error_start_key=b'm')
+
+        scan = self._make_one(table, [b'f', b'm'])
+
+        with self.assertRaises(ValueError):
+            list(scan)
+
+    def test_close_stops_scan(self):
+        keys = [b'%03d' % index for index in range(100)]
+        table = _Table(keys)
+        scan = self._make_one(table, [b'050'], max_buffered_rows=1)
+
+        iterator = iter(scan)
+        self.assertIn(next(iterator).row_key, keys)
+        iterator.close()
+
+        self.assertTrue(table.streams)
+        self.assertTrue(all(stream.cancelled for stream in table.streams))
+
+    def test__put_when_stopped(self):
+        from six.moves import queue
+        from google.cloud.bigtable._scan import _ROW
+
+        scan = self._make_one(_Table([]), [])
+        rows_queue = queue.Queue(maxsize=1)
+        stopped = threading.Event()
+
+        with mock.patch('google.cloud.bigtable._scan._POLL_INTERVAL', 0.0):
+            self.assertTrue(scan._put(rows_queue, _ROW, 'a', stopped))
+            threading.Timer(0.05, stopped.set).start()
+            self.assertFalse(scan._put(rows_queue, _ROW, 'b', stopped))
+
+    def test__read_shard_when_stopped(self):
+        table = _Table(self.KEYS)
+        scan = self._make_one(table, [])
+        stopped = threading.Event()
+        stopped.set()
+
+        scan._read_shard((None, None), None, stopped, [])
+
+        self.assertEqual(table.read_rows_calls, [])
+
+    def test__read_shard_stopped_while_starting(self):
+        from six.moves import queue
+
+        stopped = threading.Event()
+        table = _Table(self.KEYS)
+        read_rows = table.read_rows
+
+        def read_rows_then_stop(**kwargs):
+            stream = read_rows(**kwargs)
+            stopped.set()
+            return stream
+
+        table.read_rows = read_rows_then_stop
+        scan = self._make_one(table, [])
+        rows_queue = queue.Queue()
+        streams = []
+
+        scan._read_shard((None, None), rows_queue, stopped, streams)
+
+        self.assertEqual(streams, table.streams)
+        self.assertTrue(table.streams[0].cancelled)
+        self.assertTrue(rows_queue.empty())
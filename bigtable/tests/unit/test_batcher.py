@@ -161,6 +161,196 @@ class TestMutationsBatcher(unittest.TestCase):
         self.assertEqual(table.mutation_calls, 1)
 
 
+class TestAsyncMutationsBatcher(unittest.TestCase):
+
+    TABLE_NAME = '/tables/table-id'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.batcher import AsyncMutationsBatcher
+
+        return AsyncMutationsBatcher
+
+    def _make_one(self, table, **kwargs):
+        kwargs.setdefault('flush_interval', None)
+        return self._get_target_class()(table, **kwargs)
+
+    @staticmethod
+    def _make_row(row_key, size=0):
+        row = DirectRow(row_key=row_key)
+        if size:
+            row.set_cell('cf1', b'c1', b'1' * size)
+        return row
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.batcher import FLUSH_INTERVAL
+        from google.cloud.bigtable.batcher import MAX_IN_FLIGHT_RPCS
+        from google.cloud.bigtable.batcher import MAX_OUTSTANDING_BYTES
+
+        table = _Table(self.TABLE_NAME)
+        batcher = self._get_target_class()(table)
+        self.addCleanup(batcher.close)
+
+        self.assertIs(batcher.table, table)
+        self.assertEqual(batcher.flush_interval, FLUSH_INTERVAL)
+        self.assertEqual(batcher.max_in_flight, MAX_IN_FLIGHT_RPCS)
+        self.assertEqual(
+            batcher.max_outstanding_bytes, MAX_OUTSTANDING_BYTES)
+        self.assertTrue(batcher._flusher.daemon)
+
+    def test_mutate_returns_future_of_status(self):
+        table = _Table(self.TABLE_NAME, codes={b'row_key_2': 5})
+        batcher = self._make_one(table)
+
+        futures = batcher.mutate_rows(
+            [self._make_row(b'row_key_1'), self._make_row(b'row_key_2')])
+        self.assertFalse(any(future.done() for future in futures))
+        batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 1)
+        self.assertEqual(
+            [future.result().code for future in futures], [0, 5])
+
+    def test_mutate_cancelled_future(self):
+        table = _Table(self.TABLE_NAME, codes={b'row_key_2': 5})
+        batcher = self._make_one(table)
+
+        futures = batcher.mutate_rows(
+            [self._make_row(b'row_key_1', 10), self._make_row(b'row_key_2')])
+        self.assertTrue(futures[0].cancel())
+        batcher.close()
+
+        self.assertEqual(table.batch_sizes, [1])
+        self.assertTrue(futures[0].cancelled())
+        self.assertEqual(futures[1].result(timeout=5).code, 5)
+        self.assertEqual(batcher.outstanding_bytes, 0)
+
+    def test_mutate_all_futures_cancelled(self):
+        table = _Table(self.TABLE_NAME)
+        batcher = self._make_one(table)
+
+        future = batcher.mutate(self._make_row(b'row_key_1', 10))
+        future.cancel()
+        batcher.flush()
+
+        self.assertEqual(table.mutation_calls, 0)
+        self.assertEqual(batcher.outstanding_bytes, 0)
+        batcher.close()
+
+    def test_mutate_sends_full_batches_in_background(self):
+        table = _Table(self.TABLE_NAME)
+        batcher = self._make_one(table, flush_count=2)
+
+        futures = batcher.mutate_rows(
+            [self._make_row(b'row_key_%d' % index) for index in range(5)])
+        futures[1].result(timeout=5)
+        self.assertEqual(table.mutation_calls, 2)
+
+        batcher.close()
+
+        self.assertEqual(table.mutation_calls, 3)
+        self.assertEqual(table.batch_sizes, [2, 2, 1])
+        self.assertTrue(all(future.done() for future in futures))
+
+    def test_mutate_sends_batches_on_max_row_bytes(self):
+        table = _Table(self.TABLE_NAME)
+        batcher = self._make_one(table, max_row_bytes=1024)
+
+        future = batcher.mutate(self._make_row(b'row_key', 1024))
+
+        self.assertEqual(future.result(timeout=5).code, 0)
+        self.assertEqual(table.mutation_calls, 1)
+        batcher.close()
+
+    @mock.patch('google.cloud.bigtable.batcher.MAX_MUTATIONS', new=3)
+    def test_mutate_with_max_mutations(self):
+        from google.cloud.bigtable.batcher import MaxMutationsError
+
+        table = _Table(self.TABLE_NAME)
+        batcher = self._make_one(table)
+        row = self._make_row(b'row_key')
+        for column in (b'c1', b'c2', b'c3', b'c4'):
+            row.set_cell('cf1', column, 1)
+
+        with self.assertRaises(MaxMutationsError):
+            batcher.mutate(row)
+
+        row_1 = self._make_row(b'row_key_1', 1)
+        row_1.set_cell('cf1', b'c2', 1)
+        row_2 = self._make_row(b'row_key_2', 1)
+        batcher.mutate_rows([row_1, row_2])
+        batcher.close()
+
+        self.assertEqual(table.batch_sizes, [1, 1])
+
+    def test_flush_interval(self):
+        import threading
+
+        table = _Table(self.TABLE_NAME)
+        batcher = self._make_one(table, flush_interval=0.01)
+        sent = threading.Event()
+
+        future = batcher.mutate(self._make_row(b'row_key'))
+        future.add_done_callback(lambda _: sent.set())
+
+        self.assertTrue(sent.wait(5))
+        self.assertEqual(table.mutation_calls, 1)
+        batcher.close()
+        self.assertFalse(batcher._flusher.is_alive())
+
+    def test_flow_control(self):
+        import threading
+
+        release = threading.Event()
+        table = _Table(self.TABLE_NAME, wait_for=release)
+        batcher = self._make_one(
+            table, max_in_flight=4, max_outstanding_bytes=2048)
+
+        batcher.mutate(self._make_row(b'row_key_1', 1024))
+        self.assertGreater(batcher.outstanding_bytes, 1024)
+        waiting = threading.Thread(
+            target=batcher.mutate, args=(self._make_row(b'row_key_2', 1024),))
+        waiting.start()
+        waiting.join(0.1)
+
+        # The first row was sent, and the second waits for it.
+        self.assertTrue(waiting.is_alive())
+        self.assertEqual(table.batch_sizes, [1])
+
+        release.set()
+        waiting.join(5)
+        batcher.close()
+
+        self.assertFalse(waiting.is_alive())
+        self.assertEqual(table.batch_sizes, [1, 1])
+        self.assertEqual(batcher.outstanding_bytes, 0)
+
+    def test_rpc_error(self):
+        table = _Table(self.TABLE_NAME, error=RuntimeError('boom'))
+        batcher = self._make_one(table)
+
+        future = batcher.mutate(self._make_row(b'row_key'))
+
+        with self.assertRaises(RuntimeError):
+            batcher.flush()
+        self.assertIsInstance(future.exception(), RuntimeError)
+        # Errors are only raised once.
+        batcher.flush()
+
+    def test_close(self):
+        table = _Table(self.TABLE_NAME)
+
+        with self._make_one(table) as batcher:
+            future = batcher.mutate(self._make_row(b'row_key'))
+
+        self.assertTrue(future.done())
+        self.assertEqual(table.mutation_calls, 1)
+        with self.assertRaises(ValueError):
+            batcher.mutate(self._make_row(b'row_key'))
+        # Closing again is a no-op.
+        batcher.close()
+
+
 class _Instance(object):
 
     def __init__(self, client=None):
@@ -169,11 +359,26 @@ class _Instance(object):
 
 class _Table(object):
 
-    def __init__(self, name, client=None):
+    def __init__(self, name, client=None, codes=None, error=None,
+                 wait_for=None):
         self.name = name
         self._instance = _Instance(client)
-        self.mutation_calls = 0
+        self.batch_sizes = []
+        self._codes = codes or {}
+        self._error = error
+        self._wait_for = wait_for
+
+    @property
+    def mutation_calls(self):
+        return len(self.batch_sizes)
 
     def mutate_rows(self, rows):
-        self.mutation_calls += 1
-        return rows
+        from google.rpc import status_pb2
+
+        self.batch_sizes.append(len(rows))
+        if self._wait_for is not None:
+            self._wait_for.wait(5)
+        if self._error is not None:
+            raise self._error
+        return [status_pb2.Status(code=self._codes.get(row.row_key, 0))
+                for row in rows]
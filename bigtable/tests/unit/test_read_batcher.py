@@ -0,0 +1,149 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+
+import mock
+
+
+class TestReadBatcher(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.read_batcher import ReadBatcher
+
+        return ReadBatcher
+
+    def _make_one(self, table, **kwargs):
+        batcher = self._get_target_class()(table, **kwargs)
+        self.addCleanup(batcher.close)
+        return batcher
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.read_batcher import MAX_IN_FLIGHT_READS
+        from google.cloud.bigtable.read_batcher import MAX_KEYS_PER_REQUEST
+        from google.cloud.bigtable.read_batcher import READ_WINDOW
+
+        table = _Table()
+        batcher = self._make_one(table)
+
+        self.assertIs(batcher.table, table)
+        self.assertIsNone(batcher.filter_)
+        self.assertEqual(batcher.window, READ_WINDOW)
+        self.assertEqual(batcher.max_keys, MAX_KEYS_PER_REQUEST)
+        self.assertEqual(batcher.max_in_flight, MAX_IN_FLIGHT_READS)
+        self.assertTrue(batcher._dispatcher.daemon)
+
+    def test_read_row_coalesces_keys(self):
+        table = _Table(existing=[b'a', b'b'])
+        filter_ = mock.sentinel.filter
+        batcher = self._make_one(table, filter_=filter_, window=0.05)
+
+        futures = batcher.read_rows([b'a', 'b', b'c', b'a'])
+
+        self.assertIs(futures[0], futures[3])
+        self.assertEqual(futures[0].result(timeout=5), b'row:a')
+        self.assertEqual(futures[1].result(timeout=5), b'row:b')
+        self.assertIsNone(futures[2].result(timeout=5))
+        self.assertEqual(table.calls, [([b'a', b'b', b'c'], filter_)])
+
+    def test_read_row_sends_full_batch(self):
+        table = _Table(existing=[b'a', b'b', b'c'])
+        batcher = self._make_one(table, window=60.0, max_keys=2)
+
+        futures = batcher.read_rows([b'a', b'b', b'c'])
+
+        self.assertEqual(futures[1].result(timeout=5), b'row:b')
+        self.assertFalse(futures[2].done())
+        batcher.close()
+
+        self.assertEqual(futures[2].result(), b'row:c')
+        self.assertEqual(
+            [call[0] for call in table.calls], [[b'a', b'b'], [b'c']])
+
+    def test_read_row_concurrent_callers(self):
+        table = _Table(existing=[b'a', b'b'])
+        batcher = self._make_one(table, window=0.05)
+        results = {}
+
+        def read(row_key):
+            results[row_key] = batcher.read_row(row_key).result(timeout=5)
+
+        threads = [threading.Thread(target=read, args=(row_key,))
+                   for row_key in (b'a', b'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, {b'a': b'row:a', b'b': b'row:b'})
+        self.assertEqual(len(table.calls), 1)
+
+    def test_read_row_cancelled(self):
+        table = _Table(existing=[b'a', b'b'])
+
+        with self._make_one(table, window=60.0) as batcher:
+            futures = batcher.read_rows([b'a', b'b'])
+            self.assertTrue(futures[0].cancel())
+
+        self.assertTrue(futures[0].cancelled())
+        self.assertEqual(futures[1].result(timeout=5), b'row:b')
+        self.assertEqual([call[0] for call in table.calls], [[b'b']])
+
+    def test_read_row_all_cancelled(self):
+        table = _Table(existing=[b'a'])
+
+        with self._make_one(table, window=60.0) as batcher:
+            batcher.read_row(b'a').cancel()
+
+        self.assertEqual(table.calls, [])
+
+    def test_read_error(self):
+        table = _Table(error=RuntimeError('boom'))
+        batcher = self._make_one(table, window=0.0)
+
+        future = batcher.read_row(b'a')
+
+        self.assertIsInstance(future.exception(timeout=5), RuntimeError)
+
+    def test_close(self):
+        table = _Table(existing=[b'a'])
+
+        with self._make_one(table, window=60.0) as batcher:
+            future = batcher.read_row(b'a')
+
+        self.assertEqual(future.result(), b'row:a')
+        self.assertFalse(batcher._dispatcher.is_alive())
+        with self.assertRaises(ValueError):
+            batcher.read_row(b'a')
+        # Closing again is a no-op.
+        batcher.close()
+
+
+class _Table(object):
+
+    def __init__(self, existing=(), error=None):
+        self._existing = set(existing)
+        self._error = error
+        self.calls = []
+
+    def read_rows_batch(self, row_keys, filter_=None,
+                        max_keys_per_request=None, max_workers=None):
+        self.calls.append((row_keys, filter_))
+        if self._error is not None:
+            raise self._error
+        return [b'row:' + row_key if row_key in self._existing else None
+                for row_key in row_keys]
@@ -17,6 +17,15 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
 from ._testing import _make_credentials
 from google.cloud.bigtable.row_set import RowRange
 from google.cloud.bigtable_v2.proto import (
@@ -130,6 +139,31 @@ class TestCell(unittest.TestCase):
         cell2 = self._make_one(value2, TestCell.timestamp_micros)
         self.assertNotEqual(cell1, cell2)
 
+    def test_slots(self):
+        cell = self._make_one(b'value', TestCell.timestamp_micros)
+        self.assertFalse(hasattr(cell, '__dict__'))
+
+
+class TestPartialCellData(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_data import PartialCellData
+
+        return PartialCellData
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_append_value(self):
+        cell = self._make_one(b'row', u'cf', b'col', 0, value=b'ab')
+        cell.append_value(b'cd')
+        cell.append_value(b'ef')
+
+        self.assertIsInstance(cell.value, bytearray)
+        self.assertEqual(cell.value, b'abcdef')
+        self.assertFalse(hasattr(cell, '__dict__'))
+
 
 class TestPartialRowData(unittest.TestCase):
 
@@ -309,6 +343,10 @@ class TestPartialRowData(unittest.TestCase):
         self.assertIsNot(partial_row_data.cells, cells)
         self.assertEqual(partial_row_data.cells, cells)
 
+    def test_slots(self):
+        partial_row_data = self._make_one(b'row-key')
+        self.assertFalse(hasattr(partial_row_data, '__dict__'))
+
     def test_row_key_getter(self):
         row_key = object()
         partial_row_data = self._make_one(row_key)
@@ -485,6 +523,66 @@ class TestPartialRowsData(unittest.TestCase):
         self.assertEqual(yrd._counter, 1)
         self.assertEqual(yrd.state, yrd.NEW_ROW)
 
+    def test_split_cell_value(self):
+        chunks = [
+            _ReadRowsResponseCellChunkPB(
+                row_key=self.ROW_KEY,
+                family_name=self.FAMILY_NAME,
+                qualifier=self.QUALIFIER,
+                timestamp_micros=self.TIMESTAMP_MICROS,
+                value=b'ab',
+                value_size=6,
+            ),
+            _ReadRowsResponseCellChunkPB(value=b'cd', value_size=6),
+            _ReadRowsResponseCellChunkPB(value=b'ef', commit_row=True),
+        ]
+        iterator = _MockCancellableIterator(_ReadRowsResponseV2(chunks))
+        read_method = mock.Mock(return_value=iterator)
+        yrd = self._make_one(read_method, object())
+
+        rows = list(yrd)
+
+        value = rows[0].cell_value(self.FAMILY_NAME, self.QUALIFIER)
+        self.assertIsInstance(value, bytes)
+        self.assertEqual(value, b'abcdef')
+
+    def test_names_shared_across_rows(self):
+        chunks = [
+            _ReadRowsResponseCellChunkPB(
+                row_key=row_key,
+                family_name=self.FAMILY_NAME,
+                qualifier=self.QUALIFIER,
+                timestamp_micros=self.TIMESTAMP_MICROS,
+                value=self.VALUE,
+                commit_row=True,
+            )
+            for row_key in (b'row-1', b'row-2')
+        ]
+        iterator = _MockCancellableIterator(_ReadRowsResponseV2(chunks))
+        read_method = mock.Mock(return_value=iterator)
+        yrd = self._make_one(read_method, object())
+
+        row_1, row_2 = list(yrd)
+
+        family_1, = row_1._cells
+        family_2, = row_2._cells
+        self.assertIs(family_1, family_2)
+        qualifier_1, = row_1._cells[family_1]
+        qualifier_2, = row_2._cells[family_2]
+        self.assertIs(qualifier_1, qualifier_2)
+
+    @mock.patch('google.cloud.bigtable.row_data._MAX_CACHED_NAMES', new=2)
+    def test__cached_name_clears_cache(self):
+        names = {}
+        cached_name = self._get_target_class()._cached_name
+
+        self.assertEqual(cached_name(names, b'a'), b'a')
+        self.assertEqual(cached_name(names, b'b'), b'b')
+        self.assertEqual(cached_name(names, b'a'), b'a')
+        self.assertEqual(cached_name(names, b'c'), b'c')
+
+        self.assertEqual(names, {b'c': b'c'})
+
     def test_cancel(self):
         client = _Client()
         response_iterator = _MockCancellableIterator()
@@ -646,6 +744,128 @@ class TestPartialRowsData(unittest.TestCase):
         return [row.row_key for row in yrd]
 
 
+class Test_decoders(unittest.TestCase):
+
+    def test_decode_int64(self):
+        from google.cloud.bigtable.row_data import decode_int64
+
+        self.assertEqual(decode_int64(b'\x00' * 7 + b'\x2a'), 42)
+        self.assertEqual(decode_int64(b'\xff' * 8), -1)
+
+    def test_decode_float64(self):
+        from google.cloud.bigtable.row_data import decode_float64
+
+        self.assertEqual(decode_float64(b'\x3f\xf8' + b'\x00' * 6), 1.5)
+
+    def test_decode_utf8(self):
+        from google.cloud.bigtable.row_data import decode_utf8
+
+        self.assertEqual(decode_utf8(b'caf\xc3\xa9'), u'caf\xe9')
+
+
+def _make_export_rows_data():
+    import struct
+    from google.cloud.bigtable.row_data import PartialRowsData
+
+    def chunk(value, row_key=None, family=None, qualifier=None,
+              timestamp_micros=0, commit_row=False):
+        return _ReadRowsResponseCellChunkPB(
+            row_key=row_key, family_name=family, qualifier=qualifier,
+            timestamp_micros=timestamp_micros, value=value,
+            commit_row=commit_row)
+
+    chunks = [
+        # Cells of a column are returned newest first.
+        chunk(struct.pack('>q', 2), b'row-1', u'stats', b'views', 2000),
+        chunk(struct.pack('>q', 1), timestamp_micros=1000),
+        chunk(b'Title', family=u'info', qualifier=b'title'),
+        chunk(b'ignored', qualifier=b'other', commit_row=True),
+        chunk(b'Other title', b'row-2', u'info', b'title', commit_row=True),
+    ]
+    iterator = _MockCancellableIterator(_ReadRowsResponseV2(chunks))
+    return PartialRowsData(mock.Mock(return_value=iterator), object())
+
+
+def _export_columns():
+    import collections
+    from google.cloud.bigtable.row_data import decode_int64
+
+    return collections.OrderedDict([
+        ((u'stats', b'views'), ('views', decode_int64)),
+        ((u'info', 'title'), 'title'),
+    ])
+
+
+class TestPartialRowsData_export(unittest.TestCase):
+
+    def test_keeps_latest_mapped_cells(self):
+        from google.cloud.bigtable.row_data import Cell
+
+        rows_data = _make_export_rows_data()
+        rows_data._columns = set([(u'stats', b'views'), (u'info', b'title')])
+
+        row_1, row_2 = list(rows_data)
+
+        self.assertEqual(row_1.to_dict(), {
+            b'stats:views': [Cell(b'\x00' * 7 + b'\x02', 2000)],
+            b'info:title': [Cell(b'Title', 0)],
+        })
+        self.assertEqual(row_2.to_dict(), {
+            b'info:title': [Cell(b'Other title', 0)],
+        })
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        rows_data = _make_export_rows_data()
+
+        frame = rows_data.to_dataframe(_export_columns())
+
+        self.assertEqual(list(frame.columns), ['row_key', 'views', 'title'])
+        self.assertEqual(list(frame['row_key']), [b'row-1', b'row-2'])
+        self.assertEqual(frame['views'][0], 2)
+        self.assertTrue(pandas.isnull(frame['views'][1]))
+        self.assertEqual(list(frame['title']), [b'Title', b'Other title'])
+        self.assertIsNone(rows_data._columns)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_wo_row_key(self):
+        rows_data = _make_export_rows_data()
+
+        frame = rows_data.to_dataframe(
+            {(u'info', b'title'): 'title'}, row_key_column=None)
+
+        self.assertEqual(list(frame.columns), ['title'])
+        self.assertEqual(len(frame), 2)
+
+    def test_to_dataframe_without_pandas(self):
+        rows_data = _make_export_rows_data()
+
+        with mock.patch('google.cloud.bigtable.row_data.pandas', new=None):
+            with self.assertRaises(ValueError):
+                rows_data.to_dataframe({})
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        rows_data = _make_export_rows_data()
+
+        table = rows_data.to_arrow(_export_columns())
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.names, ['row_key', 'views', 'title'])
+        self.assertEqual(table.schema.field_by_name('views').type,
+                         pyarrow.int64())
+        self.assertEqual(table.column(1).to_pylist(), [2, None])
+        self.assertEqual(
+            table.column(2).to_pylist(), [b'Title', b'Other title'])
+
+    def test_to_arrow_without_pyarrow(self):
+        rows_data = _make_export_rows_data()
+
+        with mock.patch('google.cloud.bigtable.row_data.pyarrow', new=None):
+            with self.assertRaises(ValueError):
+                rows_data.to_arrow({})
+
+
 class Test_ReadRowsRequestManager(unittest.TestCase):
 
     @classmethod
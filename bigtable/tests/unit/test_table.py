@@ -786,6 +786,88 @@ class TestTable(unittest.TestCase):
         self.assertEqual(rows[1].row_key, self.ROW_KEY_2)
         self.assertEqual(rows[2].row_key, self.ROW_KEY_3)
 
+    def _read_rows_batch_helper(self, row_keys, existing, **kwargs):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        table = self._make_one(self.TABLE_ID, None)
+        row_sets = []
+
+        def read_rows(filter_=None, row_set=None):
+            self.assertIs(filter_, mock.sentinel.filter)
+            row_sets.append(sorted(row_set.row_keys))
+            return iter([PartialRowData(row_key)
+                         for row_key in row_set.row_keys
+                         if row_key in existing])
+
+        table.read_rows = mock.Mock(side_effect=read_rows)
+        rows = table.read_rows_batch(
+            row_keys, filter_=mock.sentinel.filter, **kwargs)
+        return rows, row_sets
+
+    def test_read_rows_batch(self):
+        rows, row_sets = self._read_rows_batch_helper(
+            [b'c', 'a', b'b', b'a'], [b'a', b'c'])
+
+        self.assertEqual(
+            [row and row.row_key for row in rows], [b'c', b'a', None, b'a'])
+        self.assertIs(rows[1], rows[3])
+        self.assertEqual(row_sets, [[b'a', b'b', b'c']])
+
+    def test_read_rows_batch_split(self):
+        keys = [b'k%d' % index for index in range(5)]
+
+        rows, row_sets = self._read_rows_batch_helper(
+            keys, keys, max_keys_per_request=2, max_workers=2)
+
+        self.assertEqual([row.row_key for row in rows], keys)
+        self.assertEqual(sorted(row_sets), [
+            [b'k0', b'k1'], [b'k2', b'k3'], [b'k4']])
+
+    def test_read_rows_batch_empty(self):
+        rows, row_sets = self._read_rows_batch_helper([], [])
+
+        self.assertEqual(rows, [])
+        self.assertEqual(row_sets, [])
+
+    def test_read_batcher_factory(self):
+        from google.cloud.bigtable.read_batcher import ReadBatcher
+
+        table = self._make_one(self.TABLE_ID, None)
+        batcher = table.read_batcher(
+            filter_=mock.sentinel.filter, window=0.5, max_keys=10,
+            max_in_flight=2)
+        self.addCleanup(batcher.close)
+
+        self.assertIsInstance(batcher, ReadBatcher)
+        self.assertIs(batcher.table, table)
+        self.assertIs(batcher.filter_, mock.sentinel.filter)
+        self.assertEqual(batcher.window, 0.5)
+        self.assertEqual(batcher.max_keys, 10)
+        self.assertEqual(batcher.max_in_flight, 2)
+
+    def test_read_rows_parallel(self):
+        from google.cloud.bigtable._scan import ParallelScan
+
+        table = self._make_one(self.TABLE_ID, None)
+        responses = [mock.Mock(row_key=b'k', offset_bytes=100),
+                     mock.Mock(row_key=b'', offset_bytes=200)]
+        table.sample_row_keys = mock.Mock(return_value=iter(responses))
+        filter_ = mock.sentinel.filter
+
+        scan = table.read_rows_parallel(
+            start_key=b'a', end_key=b'z', filter_=filter_,
+            end_inclusive=True, ordered=True, max_workers=2,
+            max_buffered_rows=10)
+
+        self.assertIsInstance(scan, ParallelScan)
+        self.assertIs(scan.table, table)
+        self.assertEqual(scan.shards, [(b'a', b'k'), (b'k', b'z')])
+        self.assertIs(scan.filter_, filter_)
+        self.assertTrue(scan.end_inclusive)
+        self.assertTrue(scan.ordered)
+        self.assertEqual(scan.max_workers, 2)
+        self.assertEqual(scan.max_buffered_rows, 10)
+
     def test_sample_row_keys(self):
         from google.cloud.bigtable_v2.gapic import bigtable_client
         from google.cloud.bigtable_admin_v2.gapic import (
@@ -929,6 +1011,23 @@ class TestTable(unittest.TestCase):
         self.assertEqual(mutation_batcher.flush_count, flush_count)
         self.assertEqual(mutation_batcher.max_row_bytes, max_row_bytes)
 
+    def test_async_mutations_batcher_factory(self):
+        from google.cloud.bigtable.batcher import AsyncMutationsBatcher
+
+        table = self._make_one(self.TABLE_ID, None)
+        batcher = table.async_mutations_batcher(
+            flush_count=100, max_row_bytes=1000, flush_interval=None,
+            max_in_flight=2, max_outstanding_bytes=4000)
+        self.addCleanup(batcher.close)
+
+        self.assertIsInstance(batcher, AsyncMutationsBatcher)
+        self.assertIs(batcher.table, table)
+        self.assertEqual(batcher.flush_count, 100)
+        self.assertEqual(batcher.max_row_bytes, 1000)
+        self.assertIsNone(batcher.flush_interval)
+        self.assertEqual(batcher.max_in_flight, 2)
+        self.assertEqual(batcher.max_outstanding_bytes, 4000)
+
 
 class Test__RetryableMutateRowsWorker(unittest.TestCase):
     from grpc import StatusCode
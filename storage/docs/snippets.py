@@ -173,6 +173,31 @@ def configure_website(client, to_delete):
     to_delete.append(bucket)
 
 
+@snippet
+def list_blobs_parallel(client, to_delete):
+    # [START list_blobs_parallel]
+    bucket = client.get_bucket('my-bucket')
+    total_size = 0
+    for blob in bucket.list_blobs_parallel(
+            prefix='logs/', max_workers=32, fields='items(name,size)'):
+        total_size += blob.size
+    # [END list_blobs_parallel]
+    to_delete.append(bucket)
+
+
+@snippet
+def list_blob_records(client, to_delete):
+    # [START list_blob_records]
+    from google.cloud.storage import records
+
+    bucket = client.get_bucket('my-bucket')
+    iterator = bucket.list_blobs(record_fields=('name', 'size', 'updated'))
+    frame = records.to_dataframe(iterator)
+    print(frame.groupby(frame.updated.dt.date)['size'].sum())
+    # [END list_blob_records]
+    to_delete.append(bucket)
+
+
 @snippet
 def get_bucket(client, to_delete):
     import google
@@ -277,6 +302,26 @@ def policy_document(client, to_delete):
     # [END policy_document]
 
 
+@snippet
+def transfer_manager(client, to_delete):
+    # [START transfer_manager]
+    from google.cloud.storage.transfer_manager import TransferManager
+
+    def report(result):
+        print('{} {}: {} bytes in {:.1f}s'.format(
+            result.direction, result.filename, result.bytes_transferred,
+            result.elapsed))
+
+    bucket = client.get_bucket('my-bucket')
+    manager = TransferManager(client, max_workers=16, progress_callback=report)
+    results = manager.upload_directory('/local/photos', bucket, 'photos/')
+    failed = [result for result in results if not result.succeeded]
+    print('{:.0f} bytes/s, {} failed'.format(manager.throughput, len(failed)))
+
+    manager.download_prefix(bucket, 'photos/', '/local/restored')
+    # [END transfer_manager]
+
+
 def _line_no(func):
     code = getattr(func, '__code__', None) or getattr(func, 'func_code')
     return code.co_firstlineno
@@ -0,0 +1,377 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CRC32C checksums, as used by Cloud Storage for object data.
+
+These are *not* part of the API.
+"""
+
+import base64
+import hashlib
+import io
+import struct
+
+try:
+    import google_crc32c
+except ImportError:  # pragma: NO COVER
+    google_crc32c = None
+try:
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+
+
+_CRC32C_POLYNOMIAL = 0x82F63B78  # Reversed Castagnoli polynomial.
+_FILE_CHUNK_SIZE = 1048576  # 1 MB
+
+
+def _make_table():
+    table = []
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _CRC32C_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+_TABLE = _make_table()
+
+
+def _crc32c_python(data, crc=0):
+    """Pure Python CRC32C, for when no C implementation is installed.
+
+    :type data: bytes
+    :param data: The data to checksum.
+
+    :type crc: int
+    :param crc: (Optional) The checksum of the preceding data.
+
+    :rtype: int
+    :returns: The checksum of the preceding data followed by ``data``.
+    """
+    table = _TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in bytearray(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _crc32c_google(data, crc=0):
+    """CRC32C computed by :mod:`google_crc32c`."""
+    return google_crc32c.extend(crc, data)
+
+
+# NATIVE is True when CRC32C is computed by a C extension.
+if google_crc32c is not None and (
+        google_crc32c.implementation == 'c'):  # pragma: NO COVER
+    _crc32c_native = _crc32c_google
+    NATIVE = True
+elif crcmod is not None:  # pragma: NO COVER
+    _crc32c_native = crcmod.predefined.mkPredefinedCrcFun('crc-32c')
+    NATIVE = crcmod.crcmod._usingExtension
+else:  # pragma: NO COVER
+    _crc32c_native = None
+    NATIVE = False
+
+
+def crc32c(data, crc=0):
+    """Compute or update a CRC32C checksum.
+
+    Uses :mod:`google_crc32c` or :mod:`crcmod` if installed, which are fast
+    when their C extension is built (see :data:`NATIVE`).
+
+    :type data: bytes
+    :param data: The data to checksum.
+
+    :type crc: int
+    :param crc: (Optional) The checksum of the preceding data.
+
+    :rtype: int
+    :returns: The checksum of the preceding data followed by ``data``.
+    """
+    if _crc32c_native is not None:
+        return _crc32c_native(data, crc)
+    return _crc32c_python(data, crc)
+
+
+def _gf2_matrix_times(matrix, vector):
+    """Multiply a vector by a matrix over GF(2).
+
+    :type matrix: list of int
+    :param matrix: The 32 columns of the matrix, each as a 32-bit integer.
+
+    :type vector: int
+    :param vector: The vector, as a 32-bit integer.
+
+    :rtype: int
+    :returns: The product: the XOR of the columns selected by the bits of
+              ``vector``.
+    """
+    total = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return total
+
+
+def _gf2_matrix_square(matrix):
+    """Square a matrix over GF(2).
+
+    In :func:`crc32c_combine`, squaring the operator which appends ``n``
+    zero bits to the data gives the operator which appends ``2 * n``.
+
+    :type matrix: list of int
+    :param matrix: The 32 columns of the matrix, each as a 32-bit integer.
+
+    :rtype: list of int
+    :returns: The columns of the product of the matrix with itself.
+    """
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def crc32c_combine(crc1, crc2, length2):
+    """Combine the checksums of two consecutive pieces of data.
+
+    This is the algorithm of zlib's ``crc32_combine``, for the CRC32C
+    polynomial. It takes time logarithmic in ``length2``.
+
+    :type crc1: int
+    :param crc1: The checksum of the first piece.
+
+    :type crc2: int
+    :param crc2: The checksum of the second piece.
+
+    :type length2: int
+    :param length2: The length, in bytes, of the second piece.
+
+    :rtype: int
+    :returns: The checksum of the first piece followed by the second.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # Operator for one zero bit, then two, then four.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply ``length2`` zero bytes to ``crc1``.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def crc32c_to_b64(crc):
+    """Encode a checksum as in the ``crc32c`` property of an object.
+
+    :type crc: int
+    :param crc: The checksum.
+
+    :rtype: str
+    :returns: The big-endian checksum, base64-encoded.
+    """
+    return base64.b64encode(struct.pack('>I', crc)).decode('ascii')
+
+
+def parse_hash_header(header_value):
+    """Parse the checksums in an ``X-Goog-Hash`` header.
+
+    :type header_value: str
+    :param header_value: The header, such as
+                         ``crc32c=n03x6A==,md5=Ojk9c3dhfxgoKVVHYwFbHQ==``,
+                         or :data:`None`.
+
+    :rtype: dict
+    :returns: The base64-encoded checksums, keyed by ``crc32c`` and ``md5``.
+    """
+    checksums = {}
+    if header_value:
+        for checksum in header_value.split(','):
+            name, _, value = checksum.strip().partition('=')
+            checksums[name] = value
+    return checksums
+
+
+class Checksums(object):
+    """Checksums of data, computed incrementally.
+
+    :type crc32c: bool
+    :param crc32c: (Optional) Whether to compute the CRC32C checksum.
+                   Defaults to :data:`NATIVE`, as the pure Python
+                   implementation is much slower than the network.
+
+    :type md5: bool
+    :param md5: (Optional) Whether to compute the MD5 hash.
+    """
+
+    def __init__(self, crc32c=None, md5=True):
+        if crc32c is None:
+            crc32c = NATIVE
+        self.crc32c = 0 if crc32c else None
+        self._md5 = hashlib.md5() if md5 else None
+        self.bytes_hashed = 0
+
+    def update(self, data):
+        """Add data to the checksums.
+
+        :type data: bytes
+        :param data: The data following the data already checksummed.
+        """
+        if self.crc32c is not None:
+            self.crc32c = crc32c(data, self.crc32c)
+        if self._md5 is not None:
+            self._md5.update(data)
+        self.bytes_hashed += len(data)
+
+    @property
+    def crc32c_b64(self):
+        """The CRC32C checksum, as in the ``crc32c`` property of an object.
+
+        :rtype: str or ``NoneType``
+        :returns: The checksum, or :data:`None` if it is not computed.
+        """
+        if self.crc32c is None:
+            return None
+        return crc32c_to_b64(self.crc32c)
+
+    @property
+    def md5_b64(self):
+        """The MD5 hash, as in the ``md5Hash`` property of an object.
+
+        :rtype: str or ``NoneType``
+        :returns: The hash, or :data:`None` if it is not computed.
+        """
+        if self._md5 is None:
+            return None
+        return base64.b64encode(self._md5.digest()).decode('ascii')
+
+    def find_mismatch(self, crc32c=None, md5=None):
+        """Compare the checksums with those expected.
+
+        CRC32C is compared if both checksums are known, otherwise MD5.
+
+        :type crc32c: str
+        :param crc32c: (Optional) The expected base64-encoded CRC32C.
+
+        :type md5: str
+        :param md5: (Optional) The expected base64-encoded MD5 hash.
+
+        :rtype: tuple or ``NoneType``
+        :returns: The name, expected and actual value of the checksum which
+                  does not match, or :data:`None` if there is none.
+        """
+        if crc32c is not None and self.crc32c is not None:
+            if crc32c != self.crc32c_b64:
+                return 'crc32c', crc32c, self.crc32c_b64
+        elif md5 is not None and self._md5 is not None:
+            if md5 != self.md5_b64:
+                return 'md5', md5, self.md5_b64
+        return None
+
+
+def update_from_file(checksums, filename):
+    """Add the content of a file to checksums.
+
+    :type checksums: :class:`Checksums`
+    :param checksums: The checksums to update.
+
+    :type filename: str
+    :param filename: The file to read.
+
+    :rtype: :class:`Checksums`
+    :returns: ``checksums``.
+    """
+    with open(filename, 'rb') as file_obj:
+        while True:
+            data = file_obj.read(_FILE_CHUNK_SIZE)
+            if not data:
+                break
+            checksums.update(data)
+    return checksums
+
+
+class HashingWriter(object):
+    """File-like wrapper adding the data written through it to checksums.
+
+    :type file_obj: file
+    :param file_obj: The file to write to.
+
+    :type checksums: :class:`Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, file_obj, checksums):
+        self._file_obj = file_obj
+        self.checksums = checksums
+
+    def write(self, data):
+        self.checksums.update(data)
+        return self._file_obj.write(data)
+
+
+class HashingReader(object):
+    """File-like wrapper adding the data read through it to checksums.
+
+    Data read again after seeking backwards, as when an upload is retried,
+    is only added once. Data read after seeking past the data already
+    checksummed is not added at all.
+
+    :type stream: IO[bytes]
+    :param stream: The stream to read from. The data checksummed starts at
+                   its current position, and positions in the reader are
+                   relative to it.
+
+    :type checksums: :class:`Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._start = stream.tell()
+        self.checksums = checksums
+
+    def tell(self):
+        return self._stream.tell() - self._start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            offset += self._start
+        return self._stream.seek(offset, whence) - self._start
+
+    def read(self, *args):
+        position = self.tell()
+        data = self._stream.read(*args)
+        hashed = self.checksums.bytes_hashed - position
+        if 0 <= hashed < len(data):
+            self.checksums.update(data[hashed:])
+        return data
@@ -0,0 +1,131 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adaptive chunk sizes for resumable uploads.
+
+These are *not* part of the API.
+"""
+
+import time
+
+
+CHUNK_SIZE_MULTIPLE = 262144  # 256 KB
+INITIAL_CHUNK_SIZE = 8388608  # 8 MB
+MIN_CHUNK_SIZE = 1048576  # 1 MB
+MAX_CHUNK_SIZE = 104857600  # 100 MB
+TARGET_SECONDS = 4.0
+"""Time each chunk should take: long enough to make the round trip of
+each request negligible, short enough to lose little on a retry."""
+
+_RETRY_RATE_WEIGHT = 0.3  # Weight of the last chunk in the retry rate.
+_MIN_ELAPSED = 0.001  # Seconds, to avoid dividing by zero.
+
+
+class _CountingTransport(object):
+    """Transport wrapper counting the requests made through it.
+
+    :type transport: :class:`~requests.Session`
+    :param transport: The transport to make requests with.
+    """
+
+    def __init__(self, transport):
+        self._transport = transport
+        self.requests = 0
+
+    def request(self, *args, **kwargs):
+        self.requests += 1
+        return self._transport.request(*args, **kwargs)
+
+
+class AdaptiveChunkSize(object):
+    """Chunk size of a resumable upload, adapted after each chunk.
+
+    The size grows, up to twice as large at each chunk, so that a chunk
+    takes about :data:`TARGET_SECONDS` at the measured throughput. It is
+    halved whenever a chunk had to be retried. The more chunks have been
+    retried recently, the shorter chunks should take.
+
+    :type initial: int
+    :param initial: (Optional) The size of the first chunk.
+
+    :type minimum: int
+    :param minimum: (Optional) The smallest chunk size.
+
+    :type maximum: int
+    :param maximum: (Optional) The largest chunk size.
+
+    :type target_seconds: float
+    :param target_seconds: (Optional) The time each chunk should take.
+    """
+
+    def __init__(self, initial=INITIAL_CHUNK_SIZE, minimum=MIN_CHUNK_SIZE,
+                 maximum=MAX_CHUNK_SIZE, target_seconds=TARGET_SECONDS):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.retry_rate = 0.0
+        self.chunk_size = self._clamp(initial)
+
+    def _clamp(self, size):
+        """Round a size to a valid chunk size within the bounds."""
+        size = int(size) // CHUNK_SIZE_MULTIPLE * CHUNK_SIZE_MULTIPLE
+        return max(self.minimum, min(size, self.maximum))
+
+    def record(self, bytes_sent, elapsed, attempts):
+        """Adapt the chunk size to the transmission of a chunk.
+
+        :type bytes_sent: int
+        :param bytes_sent: The number of bytes the server accepted.
+
+        :type elapsed: float
+        :param elapsed: The time taken to send them, in seconds.
+
+        :type attempts: int
+        :param attempts: The number of requests made to send them.
+
+        :rtype: int
+        :returns: The size of the next chunk.
+        """
+        retried = attempts > 1
+        self.retry_rate += _RETRY_RATE_WEIGHT * (retried - self.retry_rate)
+        if retried or bytes_sent <= 0:
+            size = self.chunk_size // 2
+        else:
+            throughput = bytes_sent / max(elapsed, _MIN_ELAPSED)
+            ideal = throughput * self.target_seconds * (1.0 - self.retry_rate)
+            size = max(self.chunk_size // 2, min(ideal, self.chunk_size * 2))
+        self.chunk_size = self._clamp(size)
+        return self.chunk_size
+
+    def transmit_next_chunk(self, upload, transport):
+        """Send the next chunk of an upload, then adapt the chunk size.
+
+        :type upload: :class:`~google.resumable_media.requests.ResumableUpload`
+        :param upload: The upload in progress.
+
+        :type transport: :class:`~requests.Session`
+        :param transport: The transport to send the chunk with.
+
+        :rtype: :class:`~requests.Response`
+        :returns: The response to the last request for the chunk.
+        """
+        # The upload reads its chunk size each time it prepares a chunk.
+        upload._chunk_size = self.chunk_size
+        counting = _CountingTransport(transport)
+        bytes_before = upload.bytes_uploaded
+        started = time.time()
+        response = upload.transmit_next_chunk(counting)
+        self.record(upload.bytes_uploaded - bytes_before,
+                    time.time() - started, counting.requests)
+        return response
@@ -20,6 +20,8 @@ These are *not* part of the API.
 import base64
 from hashlib import md5
 
+from google.cloud import exceptions
+
 
 def _validate_name(name):
     """Pre-flight ``Bucket`` name validation.
@@ -149,6 +151,18 @@ class _PropertyMixin(object):
                        ``client`` stored on the current object.
         """
         client = self._require_client(client)
+        # Make the API call.
+        api_response = client._connection.api_request(
+            _target_object=self, **self._patch_request())
+        self._set_properties(api_response)
+
+    def _patch_request(self):
+        """Helper for :meth:`patch`, and for patching objects in batches.
+
+        :rtype: dict
+        :returns: The keyword arguments of the ``api_request`` sending the
+                  changed properties.
+        """
         # Pass '?projection=full' here because 'PATCH' documented not
         # to work properly w/ 'noAcl'.
         query_params = {'projection': 'full'}
@@ -156,12 +170,12 @@ class _PropertyMixin(object):
             query_params['userProject'] = self.user_project
         update_properties = {key: self._properties[key]
                              for key in self._changes}
-
-        # Make the API call.
-        api_response = client._connection.api_request(
-            method='PATCH', path=self.path, data=update_properties,
-            query_params=query_params, _target_object=self)
-        self._set_properties(api_response)
+        return {
+            'method': 'PATCH',
+            'path': self.path,
+            'data': update_properties,
+            'query_params': query_params,
+        }
 
     def update(self, client=None):
         """Sends all properties in a PUT request.
@@ -234,3 +248,25 @@ def _base64_md5hash(buffer_object):
     _write_buffer_to_hash(buffer_object, hash_obj)
     digest_bytes = hash_obj.digest()
     return base64.b64encode(digest_bytes)
+
+
+def _raise_from_invalid_response(error):
+    """Re-wrap and raise an ``InvalidResponse`` exception.
+
+    :type error: :exc:`google.resumable_media.InvalidResponse`
+    :param error: A caught exception from the ``google-resumable-media``
+                  library.
+
+    :raises: :class:`~google.cloud.exceptions.GoogleCloudError` corresponding
+             to the failed status code
+    """
+    response = error.response
+    error_message = str(error)
+
+    message = u'{method} {url}: {error}'.format(
+        method=response.request.method,
+        url=response.request.url,
+        error=error_message)
+
+    raise exceptions.from_http_status(
+        response.status_code, message, response=response)
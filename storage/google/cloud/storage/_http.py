@@ -14,6 +14,11 @@
 
 """Create / interact with Google Cloud Storage connections."""
 
+import threading
+
+import requests
+import requests.adapters
+
 from google.cloud import _http
 
 from google.cloud.storage import __version__
@@ -21,6 +26,162 @@ from google.cloud.storage import __version__
 
 _CLIENT_INFO = _http.CLIENT_INFO_TEMPLATE.format(__version__)
 
+DEFAULT_POOL_CONNECTIONS = 10
+"""Default number of hosts whose connections are kept open."""
+
+DEFAULT_POOL_MAXSIZE = 32
+"""Default number of connections kept open to each host."""
+
+
+class PooledHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter keeping a configurable pool of connections to each host.
+
+    The pools are thread-safe: each request takes a connection from the
+    pool of its host, or opens one, and gives it back once the response is
+    read. Requests are never pipelined; a connection carries one request at
+    a time.
+
+    :type pool_connections: int
+    :param pool_connections: (Optional) The number of hosts whose
+                             connections are kept open.
+
+    :type pool_maxsize: int
+    :param pool_maxsize: (Optional) The number of connections kept open to
+                         each host.
+
+    :type pool_block: bool
+    :param pool_block: (Optional) Whether requests wait for a connection of
+                       the pool when all are in use, rather than opening one
+                       which is closed after the request.
+
+    :type keep_alive: bool
+    :param keep_alive: (Optional) Whether connections are kept open between
+                       requests. If False, each request asks the server to
+                       close its connection.
+
+    :type max_retries: int
+    :param max_retries: (Optional) The number of times a failed connection
+                        is retried.
+    """
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['keep_alive']
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False,
+                 keep_alive=True, max_retries=0):
+        self.keep_alive = keep_alive
+        self._lock = threading.Lock()
+        self._retired_connections = 0
+        self._retired_requests = 0
+        super(PooledHTTPAdapter, self).__init__(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            max_retries=max_retries, pool_block=pool_block)
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._retired_connections = 0
+        self._retired_requests = 0
+        super(PooledHTTPAdapter, self).__setstate__(state)
+
+    def send(self, request, **kwargs):
+        if not self.keep_alive:
+            request.headers['Connection'] = 'close'
+        return super(PooledHTTPAdapter, self).send(request, **kwargs)
+
+    def _pools(self):
+        """The pools of connections to each host.
+
+        :rtype: list of :class:`urllib3.connectionpool.HTTPConnectionPool`
+        :returns: The pools kept by the pool manager.
+        """
+        pools = self.poolmanager.pools
+        found = (pools.get(key) for key in pools.keys())
+        return [pool for pool in found if pool is not None]
+
+    def resize(self, pool_maxsize):
+        """Keep at least ``pool_maxsize`` connections open to each host.
+
+        Pools cannot grow, so the existing pools are replaced. Their idle
+        connections are closed, and those in use are closed once released.
+
+        :type pool_maxsize: int
+        :param pool_maxsize: The number of connections to keep.
+        """
+        with self._lock:
+            if pool_maxsize <= self._pool_maxsize:
+                return
+            old_manager = self.poolmanager
+            for pool in self._pools():
+                self._retired_connections += pool.num_connections
+                self._retired_requests += pool.num_requests
+            self.init_poolmanager(
+                self._pool_connections, pool_maxsize, block=self._pool_block)
+            old_manager.clear()
+
+    def pool_stats(self):
+        """Statistics of the connection pools.
+
+        :rtype: dict
+        :returns: The configuration of the pools, with ``pools`` (the number
+                  of hosts connected to), ``connections_opened``,
+                  and ``requests`` (the number of requests sent).
+        """
+        with self._lock:
+            connections = self._retired_connections
+            requests_sent = self._retired_requests
+            pools = self._pools()
+        for pool in pools:
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+        return {
+            'pool_connections': self._pool_connections,
+            'pool_maxsize': self._pool_maxsize,
+            'pool_block': self._pool_block,
+            'keep_alive': self.keep_alive,
+            'pools': len(pools),
+            'connections_opened': connections,
+            'requests': requests_sent,
+        }
+
+
+def mount_pooled_adapter(session, adapter):
+    """Send the requests of a session through a pooled adapter.
+
+    :type session: :class:`requests.Session`
+    :param session: The session to configure.
+
+    :type adapter: :class:`PooledHTTPAdapter`
+    :param adapter: The adapter to send HTTP and HTTPS requests with.
+    """
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def _ensure_pool_size(session, size):
+    """Let a session keep at least ``size`` connections to each host.
+
+    Threads share the client's session, so the pool must be large enough
+    for all of them to reuse their connections.
+
+    :type session: :class:`requests.Session`
+    :param session: The session used by the client.
+
+    :type size: int
+    :param size: The number of connections to keep.
+    """
+    if not isinstance(session, requests.Session):
+        return
+    adapter = session.get_adapter('https://')
+    if isinstance(adapter, PooledHTTPAdapter):
+        adapter.resize(size)
+        return
+    if getattr(adapter, '_pool_maxsize', size) >= size:
+        return
+    session.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=adapter._pool_connections,
+        pool_maxsize=size,
+        max_retries=adapter.max_retries))
+
 
 class Connection(_http.JSONConnection):
     """A connection to Google Cloud Storage via the JSON REST API.
@@ -0,0 +1,149 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel listing of the blobs in a bucket, sharded by prefix.
+
+This is *not* part of the API. Use
+:meth:`~google.cloud.storage.bucket.Bucket.list_blobs_parallel`.
+"""
+
+import concurrent.futures
+import threading
+
+from six.moves import queue
+
+
+_POLL_INTERVAL = 0.1  # Seconds between checks that the listing is stopped.
+
+_BLOB = 'blob'
+_PREFIX = 'prefix'
+_DONE = 'done'
+_ERROR = 'error'
+
+
+def _with_prefixes(fields):
+    """Make sure a partial response includes what the listing needs.
+
+    :type fields: str
+    :param fields: The fields selector passed by the caller, or
+                   :data:`None`.
+
+    :rtype: str
+    :returns: The selector, including ``prefixes`` and ``nextPageToken``.
+    """
+    if fields is None:
+        return None
+    for field in ('prefixes', 'nextPageToken'):
+        if field not in fields:
+            fields += ',' + field
+    return fields
+
+
+class ParallelListing(object):
+    """Iterate over the blobs under a prefix, listing sub-prefixes at once.
+
+    The prefix is listed with a delimiter. Each prefix found in the
+    response is listed in the same way by a pool of worker threads, so that
+    every blob is listed exactly once.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to list.
+
+    :type prefix: str
+    :param prefix: The prefix of the blobs to list.
+
+    :type delimiter: str
+    :param delimiter: The delimiter used to find sub-prefixes.
+
+    :type max_workers: int
+    :param max_workers: The number of prefixes listed at once.
+
+    :type max_in_flight: int
+    :param max_in_flight: The number of blobs listed but not yet yielded,
+                          beyond the page being read by each worker.
+
+    :type list_kwargs: dict
+    :param list_kwargs: Other arguments to
+                        :meth:`~google.cloud.storage.bucket.Bucket.list_blobs`.
+    """
+
+    def __init__(self, bucket, prefix, delimiter, max_workers, max_in_flight,
+                 list_kwargs):
+        self._bucket = bucket
+        self._prefix = prefix
+        self._delimiter = delimiter
+        self._max_workers = max_workers
+        self._list_kwargs = dict(list_kwargs)
+        self._list_kwargs['fields'] = _with_prefixes(
+            self._list_kwargs.get('fields'))
+        self._queue = queue.Queue(max_in_flight)
+        self._stopped = threading.Event()
+
+    def __iter__(self):
+        executor = concurrent.futures.ThreadPoolExecutor(self._max_workers)
+        executor.submit(self._list_prefix, self._prefix)
+        pending = 1
+        try:
+            while pending:
+                kind, value = self._queue.get()
+                if kind == _BLOB:
+                    yield value
+                elif kind == _PREFIX:
+                    executor.submit(self._list_prefix, value)
+                    pending += 1
+                elif kind == _DONE:
+                    pending -= 1
+                else:
+                    raise value
+        finally:
+            self._stopped.set()
+            executor.shutdown(wait=False)
+
+    def _put(self, kind, value):
+        """Pass a message to the iterating thread.
+
+        Blocks while the queue is full.
+
+        :rtype: bool
+        :returns: False if the iteration has stopped.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._queue.put((kind, value), timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _list_prefix(self, prefix):
+        """List the blobs and sub-prefixes under a prefix, in a worker.
+
+        :type prefix: str
+        :param prefix: The prefix to list.
+        """
+        try:
+            iterator = self._bucket.list_blobs(
+                prefix=prefix, delimiter=self._delimiter,
+                **self._list_kwargs)
+            for page in iterator.pages:
+                for sub_prefix in page.prefixes:
+                    if not self._put(_PREFIX, sub_prefix):
+                        return
+                for blob in page:
+                    if not self._put(_BLOB, blob):
+                        return
+        except Exception as exc:  # pylint: disable=broad-except
+            self._put(_ERROR, exc)
+        else:
+            self._put(_DONE, prefix)
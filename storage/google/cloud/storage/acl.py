@@ -458,6 +458,24 @@ class ACL(object):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the ACL's parent.
         """
+        client = self._require_client(client)
+
+        result = client._connection.api_request(
+            **self._save_request(acl, predefined))
+        self._set_saved_entities(result)
+
+    def _save_request(self, acl, predefined):
+        """Helper for :meth:`_save`, and for saving ACLs in batches.
+
+        :type acl: :class:`google.cloud.storage.acl.ACL`, or a compatible list.
+        :param acl: The ACL object to save.
+
+        :type predefined: str
+        :param predefined: (Optional) An identifier for a predefined ACL.
+
+        :rtype: dict
+        :returns: The keyword arguments of the ``api_request`` saving the ACL.
+        """
         query_params = {'projection': 'full'}
         if predefined is not None:
             acl = []
@@ -466,14 +484,19 @@ class ACL(object):
         if self.user_project is not None:
             query_params['userProject'] = self.user_project
 
-        path = self.save_path
-        client = self._require_client(client)
+        return {
+            'method': 'PATCH',
+            'path': self.save_path,
+            'data': {self._URL_PATH_ELEM: list(acl)},
+            'query_params': query_params,
+        }
 
-        result = client._connection.api_request(
-            method='PATCH',
-            path=path,
-            data={self._URL_PATH_ELEM: list(acl)},
-            query_params=query_params)
+    def _set_saved_entities(self, result):
+        """Replace the entities with those of a saved resource.
+
+        :type result: dict
+        :param result: The resource returned when saving the ACL.
+        """
         self.entities.clear()
         for entry in result.get(self._URL_PATH_ELEM, ()):
             self.add_entity(self.entity_from_dict(entry))
@@ -20,6 +20,7 @@ from email.generator import Generator
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.parser import Parser
+import concurrent.futures
 import io
 import json
 
@@ -137,10 +138,15 @@ class _FutureResponse(requests.Response):
 class Batch(Connection):
     """Proxy an underlying connection, batching up change operations.
 
+    Any number of requests may be deferred. When the batch is finished, they
+    are sent in ``multipart/mixed`` requests of up to ``_MAX_BATCH_SIZE``
+    requests each, up to ``_MAX_CONCURRENT_BATCHES`` of them at once.
+
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
     """
-    _MAX_BATCH_SIZE = 1000
+    _MAX_BATCH_SIZE = 100
+    _MAX_CONCURRENT_BATCHES = 8
 
     def __init__(self, client):
         super(Batch, self).__init__(client)
@@ -150,8 +156,6 @@ class Batch(Connection):
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
 
-        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
-
         :type method: str
         :param method: The HTTP method to use in the request.
 
@@ -174,9 +178,6 @@ class Batch(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        if len(self._requests) >= self._MAX_BATCH_SIZE:
-            raise ValueError("Too many deferred requests (max %d)" %
-                             self._MAX_BATCH_SIZE)
         self._requests.append((method, url, headers, data))
         result = _FutureDict()
         self._target_objects.append(target_object)
@@ -184,19 +185,26 @@ class Batch(Connection):
             target_object._properties = result
         return _FutureResponse(result)
 
-    def _prepare_batch_request(self):
+    def _prepare_batch_request(self, requests=None):
         """Prepares headers and body for a batch request.
 
+        :type requests: list of tuples
+        :param requests: (Optional) The ``(method, url, headers, data)`` of
+                         the requests to send. Defaults to all the deferred
+                         requests.
+
         :rtype: tuple (dict, str)
         :returns: The pair of headers and body of the batch request to be sent.
         :raises: :class:`ValueError` if no requests have been deferred.
         """
-        if len(self._requests) == 0:
+        if requests is None:
+            requests = self._requests
+        if len(requests) == 0:
             raise ValueError("No deferred requests")
 
         multi = MIMEMultipart()
 
-        for method, uri, headers, body in self._requests:
+        for method, uri, headers, body in requests:
             subrequest = MIMEApplicationHTTP(method, uri, headers, body)
             multi.attach(subrequest)
 
@@ -213,13 +221,17 @@ class Batch(Connection):
         _, body = payload.split('\n\n', 1)
         return dict(multi._headers), body
 
-    def _finish_futures(self, responses):
+    def _finish_futures(self, responses, raise_exception=True):
         """Apply all the batch responses to the futures created.
 
         :type responses: list of (headers, payload) tuples.
         :param responses: List of headers and payloads from each response in
                           the batch.
 
+        :type raise_exception: bool
+        :param raise_exception: (Optional) Whether to raise an exception for
+                                the first response with an error status.
+
         :raises: :class:`ValueError` if no requests have been deferred.
         """
         # If a bad status occurs, we track it, but don't raise an exception
@@ -239,16 +251,20 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and raise_exception:
             raise exceptions.from_http_response(exception_args)
 
-    def finish(self):
-        """Submit a single `multipart/mixed` request with deferred requests.
+    def _send_batch(self, requests):
+        """Submit a single `multipart/mixed` request.
 
-        :rtype: list of tuples
-        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :type requests: list of tuples
+        :param requests: The ``(method, url, headers, data)`` of the requests
+                         to send.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: one response per request.
         """
-        headers, body = self._prepare_batch_request()
+        headers, body = self._prepare_batch_request(requests)
 
         url = '%s/batch/storage/v1' % self.API_BASE_URL
 
@@ -258,7 +274,43 @@ class Batch(Connection):
         response = self._client._base_connection._make_request(
             'POST', url, data=body, headers=headers)
         responses = list(_unpack_batch_response(response))
-        self._finish_futures(responses)
+        if len(responses) != len(requests):
+            raise ValueError('Expected a response for every request.')
+        return responses
+
+    def finish(self, raise_exception=True):
+        """Submit the deferred requests in `multipart/mixed` requests.
+
+        The deferred requests are split into groups of ``_MAX_BATCH_SIZE``,
+        and the groups are sent concurrently.
+
+        :type raise_exception: bool
+        :param raise_exception: (Optional) Whether to raise an exception if
+                                any deferred request failed. Either way, the
+                                responses of the others are applied.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: one response per deferred request, in order.
+        :raises: :class:`ValueError` if no requests have been deferred.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        size = self._MAX_BATCH_SIZE
+        groups = [
+            self._requests[start:start + size]
+            for start in range(0, len(self._requests), size)]
+        if len(groups) == 1:
+            results = [self._send_batch(groups[0])]
+        else:
+            workers = min(len(groups), self._MAX_CONCURRENT_BATCHES)
+            executor = concurrent.futures.ThreadPoolExecutor(workers)
+            with executor:
+                results = list(executor.map(self._send_batch, groups))
+
+        responses = [
+            response for result in results for response in result]
+        self._finish_futures(responses, raise_exception=raise_exception)
         return responses
 
     def current(self):
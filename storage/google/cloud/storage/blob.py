@@ -26,12 +26,15 @@
 """
 
 import base64
+import concurrent.futures
 import copy
 import hashlib
+import io
 from io import BytesIO
 import mimetypes
 import os
 import time
+import uuid
 import warnings
 
 from six.moves.urllib.parse import parse_qsl
@@ -46,17 +49,25 @@ from google.resumable_media.requests import Download
 from google.resumable_media.requests import MultipartUpload
 from google.resumable_media.requests import ResumableUpload
 
-from google.cloud import exceptions
 from google.cloud._helpers import _rfc3339_to_datetime
 from google.cloud._helpers import _to_bytes
 from google.cloud._helpers import _bytes_to_unicode
 from google.cloud.exceptions import NotFound
+from google.cloud.exceptions import PreconditionFailed
 from google.cloud.iam import Policy
+from google.cloud.storage import _checksum
+from google.cloud.storage import _chunking
 from google.cloud.storage._helpers import _PropertyMixin
+from google.cloud.storage._helpers import _raise_from_invalid_response
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ACL
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.fileio import BlobReader
+from google.cloud.storage.fileio import BlobWriter
+from google.cloud.storage.fileio import _BufferedBlobWriter
+from google.cloud.storage.fileio import _TextBlobWriter
+from google.cloud.storage.fileio import DEFAULT_CHUNK_SIZE
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
@@ -96,6 +107,14 @@ _READ_LESS_THAN_SIZE = (
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_MIN_DOWNLOAD_SLICE_SIZE = 8388608  # 8 MB
+_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while {}:\n\n  {}\n\nThe server computed a {} '
+    'checksum of:\n\n  {}\n\nbut the data has a checksum of:\n\n  {}\n')
+_MAX_COMPOSE_COMPONENTS = 32
+_MAX_COMPOSITE_UPLOAD_WORKERS = 8
+_COMPOSITE_COMPONENT_TEMPLATE = (
+    u'.parallel-composite-uploads/{token}/{level}-{index:05d}')
 
 
 class Blob(_PropertyMixin):
@@ -155,6 +174,15 @@ class Blob(_PropertyMixin):
        set as their 'storage_class'.
     """
 
+    adaptive_chunk_size = False
+    """Whether resumable uploads adapt their chunk size as they go.
+
+    If True, the first chunk has :attr:`chunk_size` bytes (or 8 MB if it is
+    not set), and each next chunk is sized from the throughput measured and
+    from how often chunks had to be retried: larger on fast and reliable
+    links, smaller on flaky ones.
+    """
+
     def __init__(self, name, bucket, chunk_size=None,
                  encryption_key=None, kms_key_name=None):
         name = _bytes_to_unicode(name)
@@ -169,6 +197,7 @@ class Blob(_PropertyMixin):
                 "and 'kms_key_name'")
 
         self._encryption_key = encryption_key
+        self._computed_checksums = None
 
         if kms_key_name is not None:
             self._properties['kmsKeyName'] = kms_key_name
@@ -450,7 +479,7 @@ class Blob(_PropertyMixin):
         return _add_query_parameters(base_url, name_value_pairs)
 
     def _do_download(self, transport, file_obj, download_url, headers,
-                     start=None, end=None):
+                     start=None, end=None, checksums=None):
         """Perform a download without any error handling.
 
         This is intended to be called by :meth:`download_to_file` so it can
@@ -475,19 +504,72 @@ class Blob(_PropertyMixin):
 
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
+
+        :type checksums: :class:`~google.cloud.storage._checksum.Checksums`
+        :param checksums: Optional, the checksums to compute over the data.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the whole
+                 blob is downloaded and its checksum does not match the one
+                 computed by the server.
         """
+        whole = start is None and end is None
+        if checksums is None and whole:
+            # ``Download`` checks the MD5 hash itself, ``ChunkedDownload``
+            # does not.
+            checksums = _checksum.Checksums(md5=self.chunk_size is not None)
+        elif checksums is None:
+            # Nothing to compare the checksums of a range with.
+            checksums = _checksum.Checksums(crc32c=False, md5=False)
+        writer = _checksum.HashingWriter(file_obj, checksums)
+
         if self.chunk_size is None:
             download = Download(
-                download_url, stream=file_obj, headers=headers,
+                download_url, stream=writer, headers=headers,
                 start=start, end=end)
-            download.consume(transport)
+            response = download.consume(transport)
         else:
             download = ChunkedDownload(
-                download_url, self.chunk_size, file_obj, headers=headers,
+                download_url, self.chunk_size, writer, headers=headers,
                 start=start if start else 0, end=end)
 
             while not download.finished:
-                download.consume_next_chunk(transport)
+                response = download.consume_next_chunk(transport)
+
+        if whole:
+            self._computed_checksums = checksums
+            self._verify_download(response, download_url, checksums)
+
+    def _verify_download(self, response, download_url, checksums):
+        """Check the checksums of a downloaded blob.
+
+        Blobs stored with ``Content-Encoding: gzip`` are not checked, as the
+        data written is decompressed.
+
+        :type response: :class:`~requests.Response`
+        :param response: The last response of the download.
+
+        :type download_url: str
+        :param download_url: The URL where the media was accessed.
+
+        :type checksums: :class:`~google.cloud.storage._checksum.Checksums`
+        :param checksums: The checksums of the data written.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums do not match those of the server.
+        """
+        headers = response.headers
+        stored_encoding = headers.get(
+            'x-goog-stored-content-encoding', self.content_encoding)
+        if stored_encoding == 'gzip':
+            return
+
+        expected = _checksum.parse_hash_header(headers.get('x-goog-hash'))
+        mismatch = checksums.find_mismatch(
+            crc32c=expected.get('crc32c'), md5=expected.get('md5'))
+        if mismatch is not None:
+            raise resumable_media.DataCorruption(
+                response, _CHECKSUM_MISMATCH.format(
+                    'downloading', download_url, *mismatch))
 
     def download_to_file(self, file_obj, client=None, start=None, end=None):
         """Download the contents of this blob into a file-like object.
@@ -542,13 +624,142 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+    def _download_slice(self, transport, filename, download_url, headers,
+                        start, end):
+        """Download one byte range of the blob into its place in a file.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: An existing file, at least ``end + 1`` bytes long.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Headers to be sent with the request(s).
+
+        :type start: int
+        :param start: The first byte in the range.
+
+        :type end: int
+        :param end: The last byte in the range.
+
+        :rtype: int
+        :returns: The CRC32C checksum of the range, or :data:`None` if
+                  CRC32C cannot be computed quickly.
+        """
+        checksums = _checksum.Checksums(md5=False)
+        with open(filename, 'r+b') as file_obj:
+            file_obj.seek(start)
+            self._do_download(
+                transport, file_obj, download_url, headers, start, end,
+                checksums=checksums)
+        return checksums.crc32c
+
+    def _download_sliced(self, filename, client, slices):
+        """Download the blob as byte ranges fetched concurrently.
+
+        The file is preallocated to the size of the blob, then each range
+        is written at its offset as it arrives. The checksums of the ranges
+        are combined and checked against the blob's ``crc32c``. If CRC32C
+        cannot be computed quickly, the whole file is checked once
+        downloaded, against the blob's ``md5Hash`` if it has one.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type slices: int
+        :param slices: The maximum number of ranges to download.
+
+        :rtype: bool
+        :returns:
+            False if the blob cannot be downloaded in slices, because it is
+            small, empty or stored with ``Content-Encoding: gzip``.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums do not match.
+        """
+        if self.size is None or self.media_link is None:
+            # The media link pins the generation, so that every slice reads
+            # the same version of the object.
+            self.reload(client=client)
+
+        size = self.size
+        if size < 2 * _MIN_DOWNLOAD_SLICE_SIZE or (
+                self.content_encoding == 'gzip'):
+            return False
+
+        slice_size = max(_MIN_DOWNLOAD_SLICE_SIZE, -(-size // slices))
+        ranges = [
+            (start, min(start + slice_size, size) - 1)
+            for start in range(0, size, slice_size)]
+
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        transport = self._get_transport(client)
+
+        with open(filename, 'wb') as file_obj:
+            file_obj.truncate(size)
+
+        executor = concurrent.futures.ThreadPoolExecutor(len(ranges))
+        with executor:
+            futures = [
+                executor.submit(
+                    self._download_slice, transport, filename, download_url,
+                    headers, start, end)
+                for start, end in ranges]
+            try:
+                checksums = [future.result() for future in futures]
+            except resumable_media.InvalidResponse as exc:
+                for future in futures:
+                    future.cancel()
+                _raise_from_invalid_response(exc)
+
+        if None not in checksums:
+            combined = _checksum.Checksums(crc32c=True, md5=False)
+            for (start, end), checksum in zip(ranges, checksums):
+                combined.crc32c = _checksum.crc32c_combine(
+                    combined.crc32c, checksum, end - start + 1)
+        else:
+            # Without a C implementation of CRC32C, read the file once more:
+            # MD5 is fast, but composite objects only have a CRC32C.
+            use_md5 = self.md5_hash is not None
+            combined = _checksum.update_from_file(
+                _checksum.Checksums(crc32c=not use_md5, md5=use_md5),
+                filename)
+        self._computed_checksums = combined
+        mismatch = combined.find_mismatch(
+            crc32c=self.crc32c, md5=self.md5_hash)
+        if mismatch is not None:
+            raise resumable_media.DataCorruption(
+                None, _CHECKSUM_MISMATCH.format(
+                    'downloading', download_url, *mismatch))
+
+        return True
+
     def download_to_filename(self, filename, client=None,
-                             start=None, end=None):
+                             start=None, end=None, slices=None):
         """Download the contents of this blob into a named file.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If ``slices`` is given and the whole blob is downloaded, it is split
+        into up to ``slices`` byte ranges of at least 8 MB, which are
+        downloaded concurrently and written into place in the file. If
+        CRC32C can be computed quickly, the combined checksum of the ranges is
+        checked against :attr:`crc32c`.
+        This makes an additional API request to load the blob's metadata if
+        :attr:`size` is not yet known.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -563,12 +774,21 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type slices: int
+        :param slices: Optional, the maximum number of byte ranges to
+                       download concurrently.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
         try:
-            with open(filename, 'wb') as file_obj:
-                self.download_to_file(
-                    file_obj, client=client, start=start, end=end)
+            sliced = (
+                slices is not None and slices > 1
+                and start is None and end is None
+                and self._download_sliced(filename, client, slices))
+            if not sliced:
+                with open(filename, 'wb') as file_obj:
+                    self.download_to_file(
+                        file_obj, client=client, start=start, end=end)
         except resumable_media.DataCorruption:
             # Delete the corrupt downloaded file.
             os.remove(filename)
@@ -577,7 +797,7 @@ class Blob(_PropertyMixin):
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
 
     def download_as_string(self, client=None, start=None, end=None):
         """Download the contents of this blob as a string.
@@ -605,6 +825,81 @@ class Blob(_PropertyMixin):
             string_buffer, client=client, start=start, end=end)
         return string_buffer.getvalue()
 
+    def open(self, mode='r', chunk_size=None, content_type=None,
+             client=None, encoding=None, errors=None, newline=None):
+        """Open the blob as a file, streaming its contents.
+
+        In ``'rb'`` mode, the blob is read in ranges of ``chunk_size``, the
+        next range being downloaded while the current one is read. In
+        ``'wb'`` mode, the data written is uploaded in chunks of
+        ``chunk_size`` with a resumable upload, which completes when the file
+        is closed. If an exception leaves a ``with`` block of the file, the
+        upload is abandoned and the blob is left unchanged. Either way, at
+        most about two chunks are held in memory.
+
+        .. code-block:: python
+
+           with blob.open('rb') as file_obj:
+               for line in gzip.GzipFile(fileobj=file_obj):
+                   ...
+
+        If :attr:`user_project` is set on the bucket, bills the API requests
+        to that project.
+
+        :type mode: str
+        :param mode: (Optional) One of ``'rb'``, ``'wb'`` or, to read or
+                     write text, ``'r'`` and ``'w'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The size, in bytes, of each range or
+                           chunk. Defaults to :attr:`chunk_size` if it is
+                           set, otherwise to 10 MB.
+
+        :type content_type: str
+        :param content_type: (Optional) Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type encoding: str
+        :param encoding: (Optional) In text mode, as for :class:`io.open`.
+
+        :type errors: str
+        :param errors: (Optional) In text mode, as for :class:`io.open`.
+
+        :type newline: str
+        :param newline: (Optional) In text mode, as for :class:`io.open`.
+
+        :rtype: :class:`io.BufferedReader`, :class:`io.BufferedWriter` or
+                :class:`io.TextIOWrapper`
+        :returns: The file object.
+
+        :raises: :exc:`ValueError` if ``mode`` is not supported.
+        """
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+            if chunk_size is None:
+                chunk_size = DEFAULT_CHUNK_SIZE
+
+        if mode in ('r', 'rt', 'rb'):
+            file_obj = io.BufferedReader(
+                BlobReader(self, chunk_size=chunk_size, client=client))
+            text_class = io.TextIOWrapper
+        elif mode in ('w', 'wt', 'wb'):
+            file_obj = _BufferedBlobWriter(
+                BlobWriter(self, chunk_size=chunk_size,
+                           content_type=content_type, client=client))
+            text_class = _TextBlobWriter
+        else:
+            raise ValueError('Unsupported mode: {!r}'.format(mode))
+
+        if 'b' in mode:
+            return file_obj
+        return text_class(
+            file_obj, encoding=encoding, errors=errors, newline=newline)
+
     def _get_content_type(self, content_type, filename=None):
         """Determine the content type from the current object.
 
@@ -862,6 +1157,8 @@ class Blob(_PropertyMixin):
         """Perform a resumable upload.
 
         Assumes ``chunk_size`` is not :data:`None` on the current blob.
+        If :attr:`adaptive_chunk_size` is set, the size of each chunk is
+        adapted to the transmission of the previous ones.
 
         The content type of the upload will be determined in order
         of precedence:
@@ -896,15 +1193,63 @@ class Blob(_PropertyMixin):
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
         """
+        checksums = _checksum.Checksums()
+        chunk_size = None
+        adaptive = None
+        if self.adaptive_chunk_size:
+            adaptive = _chunking.AdaptiveChunkSize(
+                self.chunk_size or _chunking.INITIAL_CHUNK_SIZE)
+            chunk_size = adaptive.chunk_size
         upload, transport = self._initiate_resumable_upload(
-            client, stream, content_type, size, num_retries,
-            predefined_acl=predefined_acl)
+            client, _checksum.HashingReader(stream, checksums), content_type,
+            size, num_retries, predefined_acl=predefined_acl,
+            chunk_size=chunk_size)
 
         while not upload.finished:
-            response = upload.transmit_next_chunk(transport)
+            if adaptive is None:
+                response = upload.transmit_next_chunk(transport)
+            else:
+                response = adaptive.transmit_next_chunk(upload, transport)
 
+        self._computed_checksums = checksums
+        self._verify_upload(client, response, checksums)
         return response
 
+    def _verify_upload(self, client, response, checksums):
+        """Check the checksums of an uploaded blob.
+
+        If they do not match, the blob is deleted, unless it was replaced
+        since.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.
+
+        :type response: :class:`~requests.Response`
+        :param response: The response to the last request of the upload.
+
+        :type checksums: :class:`~google.cloud.storage._checksum.Checksums`
+        :param checksums: The checksums of the data uploaded.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums do not match those of the server.
+        """
+        resource = response.json()
+        if int(resource.get('size', -1)) != checksums.bytes_hashed:
+            return
+
+        mismatch = checksums.find_mismatch(
+            crc32c=resource.get('crc32c'), md5=resource.get('md5Hash'))
+        if mismatch is not None:
+            uploaded = Blob(
+                self.name, bucket=self.bucket,
+                encryption_key=self._encryption_key)
+            _delete_if_exists(
+                uploaded, client,
+                if_generation_match=resource.get('generation'))
+            raise resumable_media.DataCorruption(
+                response, _CHECKSUM_MISMATCH.format(
+                    'uploading', resource.get('selfLink'), *mismatch))
+
     def _do_upload(self, client, stream, content_type,
                    size, num_retries, predefined_acl):
         """Determine an upload strategy and then perform the upload.
@@ -1043,6 +1388,144 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+    def _temporary_component(self, name):
+        """Create a temporary blob for a parallel composite upload.
+
+        It is encrypted with the key of this blob, as ``compose`` requires.
+
+        :type name: str
+        :param name: The name of the temporary blob.
+
+        :rtype: :class:`Blob`
+        :returns: The temporary blob, in the bucket of this blob.
+        """
+        return Blob(
+            name, bucket=self.bucket, encryption_key=self._encryption_key,
+            kms_key_name=self.kms_key_name)
+
+    def _upload_component(self, client, filename, content_type, start,
+                          size):
+        """Upload one part of a file as a temporary blob.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type start: int
+        :param start: Offset of the part in the file.
+
+        :type size: int
+        :param size: Length of the part, in bytes.
+        """
+        with open(filename, 'rb') as file_obj:
+            self.upload_from_file(
+                _FileSlice(file_obj, start, size), size=size,
+                content_type=content_type, client=client)
+
+    def _compose_components(self, executor, client, components, token):
+        """Compose temporary blobs into this blob.
+
+        Sources beyond the limit of a single ``compose`` request are first
+        composed, concurrently, into intermediate temporary blobs.
+
+        :type executor: :class:`concurrent.futures.Executor`
+        :param executor: The executor running the intermediate composes.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type components: list of :class:`Blob`
+        :param components: The blobs to compose, in order. Intermediate blobs
+                           are appended, so that they can be deleted.
+
+        :type token: str
+        :param token: Identifies the temporary blobs of this upload.
+        """
+        sources = list(components)
+        level = 0
+        while len(sources) > _MAX_COMPOSE_COMPONENTS:
+            level += 1
+            groups = [
+                sources[index:index + _MAX_COMPOSE_COMPONENTS]
+                for index in range(0, len(sources), _MAX_COMPOSE_COMPONENTS)]
+            sources = []
+            for index in range(len(groups)):
+                name = _COMPOSITE_COMPONENT_TEMPLATE.format(
+                    token=token, level=level, index=index)
+                intermediate = self._temporary_component(name)
+                intermediate.content_type = self.content_type
+                sources.append(intermediate)
+                components.append(intermediate)
+            futures = [
+                executor.submit(intermediate.compose, group, client=client)
+                for intermediate, group in zip(sources, groups)]
+            for future in futures:
+                future.result()
+        self.compose(sources, client=client)
+
+    def _upload_composite(self, filename, content_type, client, total_bytes,
+                          component_size):
+        """Upload a file as a parallel composite upload.
+
+        Parts of the file are uploaded concurrently as temporary blobs, then
+        composed into this blob. The temporary blobs are deleted afterwards,
+        whether or not the upload succeeded.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type total_bytes: int
+        :param total_bytes: The size of the file.
+
+        :type component_size: int
+        :param component_size: The size of each part.
+        """
+        token = uuid.uuid4().hex
+        components = []
+        uploads = []
+        for index, start in enumerate(range(0, total_bytes, component_size)):
+            name = _COMPOSITE_COMPONENT_TEMPLATE.format(
+                token=token, level=0, index=index)
+            component = self._temporary_component(name)
+            components.append(component)
+            uploads.append(
+                (component, start, min(component_size, total_bytes - start)))
+
+        self.content_type = content_type
+        executor = concurrent.futures.ThreadPoolExecutor(
+            min(len(uploads), _MAX_COMPOSITE_UPLOAD_WORKERS))
+        with executor:
+            try:
+                futures = [
+                    executor.submit(
+                        component._upload_component, client, filename,
+                        content_type, start, size)
+                    for component, start, size in uploads]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+                    concurrent.futures.wait(futures)
+                self._compose_components(executor, client, components, token)
+            finally:
+                deletes = [
+                    executor.submit(_delete_if_exists, component, client)
+                    for component in components]
+                concurrent.futures.wait(deletes)
+
     def upload_from_filename(self, filename, content_type=None, client=None,
                              predefined_acl=None):
         """Upload this blob's contents from the content of a named file.
@@ -1069,6 +1552,16 @@ class Blob(_PropertyMixin):
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If the client's ``parallel_composite_upload_threshold`` is set and the
+        file is at least that large, the file is uploaded in parts of the
+        client's ``parallel_composite_upload_component_size``. The parts are
+        uploaded concurrently as temporary blobs, whose names start with
+        ``.parallel-composite-uploads/``, and then composed into this blob.
+        The resulting composite object has a ``crc32c`` checksum, but no
+        ``md5Hash``. The temporary blobs are encrypted with the encryption
+        key, or the Cloud KMS key, of this blob. Uploads with a
+        ``predefined_acl`` are always uploaded whole.
+
         :type filename: str
         :param filename: The path to the file.
 
@@ -1084,8 +1577,20 @@ class Blob(_PropertyMixin):
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
+        total_bytes = os.path.getsize(filename)
+        client = self._require_client(client)
+        threshold = getattr(
+            client, 'parallel_composite_upload_threshold', None)
+        if (threshold is not None and total_bytes >= threshold
+                and predefined_acl is None):
+            component_size = client.parallel_composite_upload_component_size
+            if total_bytes > component_size:
+                self._upload_composite(
+                    filename, content_type, client, total_bytes,
+                    component_size)
+                return
+
         with open(filename, 'rb') as file_obj:
-            total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
                 file_obj, content_type=content_type, client=client,
                 size=total_bytes, predefined_acl=predefined_acl)
@@ -1370,6 +1875,9 @@ class Blob(_PropertyMixin):
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If this blob has a `customer-supplied`_ encryption key, the sources
+        must be encrypted with the same key.
+
         :type sources: list of :class:`Blob`
         :param sources: blobs whose contents will be composed into this blob.
 
@@ -1384,6 +1892,9 @@ class Blob(_PropertyMixin):
         if self.user_project is not None:
             query_params['userProject'] = self.user_project
 
+        if self.kms_key_name is not None:
+            query_params['kmsKeyName'] = self.kms_key_name
+
         request = {
             'sourceObjects': [{'name': source.name} for source in sources],
             'destination': self._properties.copy(),
@@ -1393,6 +1904,7 @@ class Blob(_PropertyMixin):
             path=self.path + '/compose',
             query_params=query_params,
             data=request,
+            headers=_get_encryption_headers(self._encryption_key),
             _target_object=self)
         self._set_properties(api_response)
 
@@ -1558,6 +2070,39 @@ class Blob(_PropertyMixin):
     .. _RFC 4960: https://tools.ietf.org/html/rfc4960#appendix-B
     """
 
+    @property
+    def computed_crc32c(self):
+        """CRC32C checksum of the data last downloaded or uploaded.
+
+        It is computed as the data is streamed, and compared with the
+        server's checksum to detect corruption. It is only computed if a fast
+        CRC32C implementation, such as ``crcmod`` with its C extension, is
+        installed.
+
+        :rtype: str or ``NoneType``
+        :returns: The base64-encoded checksum, as :attr:`crc32c`, or
+                  :data:`None` if it was not computed.
+        """
+        if self._computed_checksums is None:
+            return None
+        return self._computed_checksums.crc32c_b64
+
+    @property
+    def computed_md5_hash(self):
+        """MD5 hash of the data last downloaded or uploaded.
+
+        It is computed as the data is streamed, except for downloads split
+        into slices, and for downloads of the whole blob in a single request,
+        whose hash ``google-resumable-media`` checks itself.
+
+        :rtype: str or ``NoneType``
+        :returns: The base64-encoded hash, as :attr:`md5_hash`, or
+                  :data:`None` if it was not computed.
+        """
+        if self._computed_checksums is None:
+            return None
+        return self._computed_checksums.md5_b64
+
     @property
     def component_count(self):
         """Number of underlying components that make up this object.
@@ -1892,26 +2437,80 @@ def _maybe_rewind(stream, rewind=False):
         stream.seek(0, os.SEEK_SET)
 
 
-def _raise_from_invalid_response(error):
-    """Re-wrap and raise an ``InvalidResponse`` exception.
+def _delete_if_exists(blob, client, if_generation_match=None):
+    """Delete a blob, ignoring it if it does not exist.
 
-    :type error: :exc:`google.resumable_media.InvalidResponse`
-    :param error: A caught exception from the ``google-resumable-media``
-                  library.
+    :type blob: :class:`Blob`
+    :param blob: The blob to delete.
 
-    :raises: :class:`~google.cloud.exceptions.GoogleCloudError` corresponding
-             to the failed status code
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use.
+
+    :type if_generation_match: int
+    :param if_generation_match: (Optional) Only delete the blob if this is
+                                its current generation, i.e. if it was not
+                                replaced since.
     """
-    response = error.response
-    error_message = str(error)
+    if if_generation_match is None:
+        try:
+            blob.delete(client=client)
+        except NotFound:
+            pass
+        return
+
+    client = blob._require_client(client)
+    query_params = {'ifGenerationMatch': int(if_generation_match)}
+    if blob.user_project is not None:
+        query_params['userProject'] = blob.user_project
+    try:
+        client._connection.api_request(
+            method='DELETE', path=blob.path, query_params=query_params,
+            _target_object=None)
+    except (NotFound, PreconditionFailed):
+        pass
+
 
-    message = u'{method} {url}: {error}'.format(
-        method=response.request.method,
-        url=response.request.url,
-        error=error_message)
+class _FileSlice(object):
+    """Read-only view of a range of bytes in a file.
+
+    Positions are relative to the start of the range, so that the slice can
+    be uploaded as if it were a whole file.
+
+    :type file_obj: file
+    :param file_obj: A file handle open for reading.
+
+    :type start: int
+    :param start: Offset of the range in the file.
+
+    :type size: int
+    :param size: Length of the range, in bytes.
+    """
 
-    raise exceptions.from_http_status(
-        response.status_code, message, response=response)
+    def __init__(self, file_obj, start, size):
+        self._file_obj = file_obj
+        self._start = start
+        self._size = size
+        self._position = 0
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = max(0, min(offset, self._size))
+        return self._position
+
+    def read(self, size=-1):
+        remaining = self._size - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._file_obj.seek(self._start + self._position)
+        data = self._file_obj.read(size)
+        self._position += len(data)
+        return data
 
 
 def _add_query_parameters(base_url, name_value_pairs):
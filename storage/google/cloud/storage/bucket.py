@@ -27,14 +27,18 @@ from google.api_core import datetime_helpers
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.storage import _signing
+from google.cloud.storage import records
+from google.cloud.storage._listing import ParallelListing
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
+from google.cloud.storage.batch import Batch
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.blob import _get_encryption_headers
 from google.cloud.storage.notification import BucketNotification
@@ -86,6 +90,26 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _item_to_record(iterator, item):
+    """Convert a JSON blob to a compact record.
+
+    .. note::
+
+        This assumes that the ``record_class`` attribute has been
+        added to the iterator after being created.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted to a record.
+
+    :rtype: :class:`~google.cloud.storage.records.BlobRecord`
+    :returns: The next record in the page.
+    """
+    return iterator.record_class.from_api_repr(item)
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -292,6 +316,13 @@ class Bucket(_PropertyMixin):
     This is used in Bucket.delete() and Bucket.make_public().
     """
 
+    _MAX_BATCHED_REQUESTS = 1000
+    """Maximum number of requests deferred in one batch.
+
+    This is used by the batched requests of Bucket.delete_blobs(),
+    Bucket.patch_blobs() and Bucket.save_blob_acls().
+    """
+
     _STORAGE_CLASSES = (
         'MULTI_REGIONAL',
         'REGIONAL',
@@ -592,7 +623,8 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   record_fields=None):
         """Return an iterator used to find blobs in the bucket.
 
         If :attr:`user_project` is set, bills the API request to that project.
@@ -632,10 +664,27 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type record_fields: sequence of str
+        :param record_fields: (Optional) Names of blob properties, such as
+                              ``('name', 'size', 'updated')``. If passed,
+                              only those properties are listed, and the
+                              iterator returns compact
+                              :class:`~google.cloud.storage.records.BlobRecord`
+                              instances instead of blobs. ``fields`` defaults
+                              to a selector of those properties.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
                   in this bucket matching the arguments.
         """
+        item_to_value = _item_to_blob
+        record_class = None
+        if record_fields is not None:
+            item_to_value = _item_to_record
+            record_class = records.record_class(record_fields)
+            if fields is None:
+                fields = records.api_fields(record_class.fields)
+
         extra_params = {'projection': projection}
 
         if prefix is not None:
@@ -659,15 +708,89 @@ class Bucket(_PropertyMixin):
             client=client,
             api_request=client._connection.api_request,
             path=path,
-            item_to_value=_item_to_blob,
+            item_to_value=item_to_value,
             page_token=page_token,
             max_results=max_results,
             extra_params=extra_params,
             page_start=_blobs_page_start)
         iterator.bucket = self
+        iterator.record_class = record_class
         iterator.prefixes = set()
         return iterator
 
+    def list_blobs_parallel(self, prefix='', delimiter='/', max_workers=8,
+                            max_in_flight=1000, versions=None,
+                            projection='noAcl', fields=None, client=None,
+                            record_fields=None):
+        """Return an iterator listing blobs with many requests at once.
+
+        The prefix is listed with ``delimiter``, and each of the prefixes
+        found is listed in the same way, on a pool of worker threads. This
+        is much faster than :meth:`list_blobs` for a bucket whose blob names
+        form a wide hierarchy; blob names without ``delimiter`` are listed
+        sequentially.
+
+        Blobs are yielded as they are listed, in no particular order. Stop
+        iterating, or close the iterator, to stop listing.
+
+        If :attr:`user_project` is set, bills the API requests to that project.
+
+        .. literalinclude:: snippets.py
+            :start-after: [START list_blobs_parallel]
+            :end-before: [END list_blobs_parallel]
+
+        :type prefix: str
+        :param prefix: (Optional) prefix used to filter blobs.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter used to split the listing.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of prefixes listed at once.
+
+        :type max_in_flight: int
+        :param max_in_flight: (Optional) The number of blobs listed ahead of
+                              those yielded, beyond one page per worker.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``. Specifies the set of
+                           properties to return.
+
+        :type fields: str
+        :param fields: (Optional) Selector specifying which fields to include
+                       in a partial response. ``prefixes`` and
+                       ``nextPageToken`` are added to it.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type record_fields: sequence of str
+        :param record_fields: (Optional) Names of blob properties. If passed,
+                              compact records are returned instead of blobs,
+                              as by :meth:`list_blobs`.
+
+        :rtype: iterator
+        :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
+                  in this bucket matching the arguments.
+        """
+        if record_fields is not None and fields is None:
+            fields = records.api_fields(record_fields)
+        list_kwargs = {
+            'versions': versions,
+            'projection': projection,
+            'fields': fields,
+            'client': self._require_client(client),
+            'record_fields': record_fields,
+        }
+        return iter(ParallelListing(
+            self, prefix, delimiter, max_workers, max_in_flight, list_kwargs))
+
     def list_notifications(self, client=None):
         """List Pub / Sub notifications for this bucket.
 
@@ -806,7 +929,18 @@ class Bucket(_PropertyMixin):
     def delete_blobs(self, blobs, on_error=None, client=None):
         """Deletes a list of blobs from the current bucket.
 
-        Uses :meth:`delete_blob` to delete each individual blob.
+        Unless a batch is already in progress, the blobs are deleted with
+        batch requests, each deleting up to 100 blobs, several of which are
+        sent at once. Otherwise, uses :meth:`delete_blob` to delete each
+        individual blob.
+
+        .. note::
+           With batch requests, every blob is deleted before any error is
+           raised: a blob which is not found, when ``on_error`` is not
+           passed, no longer prevents the deletion of the blobs after it.
+           ``on_error`` is called for every blob not found, then the error
+           of the first other blob which failed, in the order given, is
+           raised.
 
         If :attr:`user_project` is set, bills the API request to that project.
 
@@ -825,19 +959,136 @@ class Bucket(_PropertyMixin):
                        to the ``client`` stored on the current bucket.
 
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
-                 `on_error` is not passed).
-        """
-        for blob in blobs:
-            try:
-                blob_name = blob
-                if not isinstance(blob_name, six.string_types):
-                    blob_name = blob.name
-                self.delete_blob(blob_name, client=client)
-            except NotFound:
-                if on_error is not None:
-                    on_error(blob)
-                else:
-                    raise
+                 `on_error` is not passed), once every blob was deleted.
+        """
+        blobs = list(blobs)
+        blob_names = [
+            blob if isinstance(blob, six.string_types) else blob.name
+            for blob in blobs]
+        client = self._require_client(client)
+
+        if len(blobs) < 2 or client.current_batch is not None:
+            for blob, blob_name in zip(blobs, blob_names):
+                try:
+                    self.delete_blob(blob_name, client=client)
+                except NotFound:
+                    if on_error is not None:
+                        on_error(blob)
+                    else:
+                        raise
+            return
+
+        query_params = {}
+        if self.user_project is not None:
+            query_params['userProject'] = self.user_project
+        requests = [{
+            'method': 'DELETE',
+            'path': Blob.path_helper(self.path, blob_name),
+            'query_params': query_params,
+        } for blob_name in blob_names]
+
+        responses = self._batch_requests(requests, client)
+        error = None
+        for blob, response in zip(blobs, responses):
+            if response.status_code == 404 and on_error is not None:
+                on_error(blob)
+            elif not 200 <= response.status_code < 300 and error is None:
+                error = exceptions.from_http_response(response)
+        if error is not None:
+            raise error
+
+    def patch_blobs(self, blobs, client=None):
+        """Sends the changed properties of many blobs, in batch requests.
+
+        Each blob is patched as by
+        :meth:`~google.cloud.storage.blob.Blob.patch`, but up to 100 blobs
+        are patched by each request, and several requests are sent at once.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs to patch.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` for the
+                 first blob which could not be patched, once every request
+                 was sent. The other blobs are patched and updated.
+        """
+        blobs = list(blobs)
+        client = self._require_client(client)
+        requests = [blob._patch_request() for blob in blobs]
+
+        responses = self._batch_requests(requests, client)
+        error = None
+        for blob, response in zip(blobs, responses):
+            if 200 <= response.status_code < 300:
+                blob._set_properties(response.json())
+            elif error is None:
+                error = exceptions.from_http_response(response)
+        if error is not None:
+            raise error
+
+    def save_blob_acls(self, blobs, client=None):
+        """Saves the ACLs of many blobs, in batch requests.
+
+        The current entries of each blob's ACL are saved as by
+        :meth:`~google.cloud.storage.acl.ACL.save`, but up to 100 ACLs are
+        saved by each request, and several requests are sent at once.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blobs: list of :class:`~google.cloud.storage.blob.Blob`
+        :param blobs: The blobs whose ACLs to save.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` for the
+                 first ACL which could not be saved, once every request was
+                 sent. The other ACLs are saved and updated.
+        """
+        blobs = list(blobs)
+        client = self._require_client(client)
+        requests = [blob.acl._save_request(blob.acl, None) for blob in blobs]
+
+        responses = self._batch_requests(requests, client)
+        error = None
+        for blob, response in zip(blobs, responses):
+            if 200 <= response.status_code < 300:
+                blob.acl._set_saved_entities(response.json())
+            elif error is None:
+                error = exceptions.from_http_response(response)
+        if error is not None:
+            raise error
+
+    def _batch_requests(self, requests, client):
+        """Make API requests in batches.
+
+        The requests are deferred in batches of up to
+        ``_MAX_BATCHED_REQUESTS``, each sent after the previous one. Every
+        request is sent, whether or not others fail.
+
+        :type requests: list of dict
+        :param requests: The keyword arguments of each ``api_request``.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: The response to each request, in order.
+        """
+        size = self._MAX_BATCHED_REQUESTS
+        responses = []
+        for start in range(0, len(requests), size):
+            batch = Batch(client)
+            for request in requests[start:start + size]:
+                batch.api_request(**request)
+            responses.extend(batch.finish(raise_exception=False))
+        return responses
 
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None, preserve_acl=True, source_generation=None):
@@ -1633,9 +1884,8 @@ class Bucket(_PropertyMixin):
             If ``recursive`` is True, and the bucket contains more than 256
             blobs.  This is to prevent extremely long runtime of this
             method.  For such buckets, iterate over the blobs returned by
-            :meth:`list_blobs` and call
-            :meth:`~google.cloud.storage.blob.Blob.make_public`
-            for each blob.
+            :meth:`list_blobs`, update the ACL of each blob, and save them
+            with :meth:`save_blob_acls`.
         """
         self.acl.all().grant_read()
         self.acl.save(client=client)
@@ -1664,7 +1914,7 @@ class Bucket(_PropertyMixin):
 
             for blob in blobs:
                 blob.acl.all().grant_read()
-                blob.acl.save(client=client)
+            self.save_blob_acls(blobs, client=client)
 
     def make_private(self, recursive=False, future=False, client=None):
         """Update bucket's ACL, revoking read access for anonymous users.
@@ -1686,9 +1936,8 @@ class Bucket(_PropertyMixin):
             If ``recursive`` is True, and the bucket contains more than 256
             blobs.  This is to prevent extremely long runtime of this
             method.  For such buckets, iterate over the blobs returned by
-            :meth:`list_blobs` and call
-            :meth:`~google.cloud.storage.blob.Blob.make_private`
-            for each blob.
+            :meth:`list_blobs`, update the ACL of each blob, and save them
+            with :meth:`save_blob_acls`.
         """
         self.acl.all().revoke_read()
         self.acl.save(client=client)
@@ -1717,7 +1966,7 @@ class Bucket(_PropertyMixin):
 
             for blob in blobs:
                 blob.acl.all().revoke_read()
-                blob.acl.save(client=client)
+            self.save_blob_acls(blobs, client=client)
 
     def generate_upload_policy(
             self, conditions, expiration=None, client=None):
@@ -15,6 +15,8 @@
 """Client for interacting with the Google Cloud Storage API."""
 
 
+import requests
+
 from google.auth.credentials import AnonymousCredentials
 
 from google.api_core import page_iterator
@@ -22,11 +24,16 @@ from google.cloud._helpers import _LocalStack
 from google.cloud.client import ClientWithProject
 from google.cloud.exceptions import NotFound
 from google.cloud.storage._http import Connection
+from google.cloud.storage._http import DEFAULT_POOL_CONNECTIONS
+from google.cloud.storage._http import DEFAULT_POOL_MAXSIZE
+from google.cloud.storage._http import mount_pooled_adapter
+from google.cloud.storage._http import PooledHTTPAdapter
 from google.cloud.storage.batch import Batch
 from google.cloud.storage.bucket import Bucket
 
 
 _marker = object()
+_DEFAULT_COMPOSITE_COMPONENT_SIZE = 52428800  # 50 MB
 
 
 class Client(ClientWithProject):
@@ -51,6 +58,39 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type parallel_composite_upload_threshold: int
+    :param parallel_composite_upload_threshold:
+        (Optional) Size, in bytes, from which
+        :meth:`~google.cloud.storage.blob.Blob.upload_from_filename` uploads
+        a file as a parallel composite upload. If not passed, composite
+        uploads are disabled.
+
+    :type parallel_composite_upload_component_size: int
+    :param parallel_composite_upload_component_size:
+        (Optional) Size, in bytes, of each part of a parallel composite
+        upload. Defaults to 50 MB.
+
+    :type pool_connections: int
+    :param pool_connections: (Optional) The number of hosts whose
+                             connections are kept open. Defaults to 10.
+
+    :type pool_maxsize: int
+    :param pool_maxsize: (Optional) The number of connections kept open to
+                         each host, shared by the threads using the client.
+                         Defaults to 32.
+
+    :type pool_block: bool
+    :param pool_block: (Optional) Whether requests wait for a pooled
+                       connection when all are in use, rather than opening
+                       one which is closed after the request.
+
+    :type keep_alive: bool
+    :param keep_alive: (Optional) Whether connections are kept open between
+                       requests. Defaults to True.
+
+    The pool options apply to the HTTP session created by the client, and
+    are ignored if ``_http`` is passed.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/devstorage.full_control',
@@ -58,8 +98,20 @@ class Client(ClientWithProject):
              'https://www.googleapis.com/auth/devstorage.read_write')
     """The scopes required for authenticating as a Cloud Storage consumer."""
 
-    def __init__(self, project=_marker, credentials=None, _http=None):
+    def __init__(self, project=_marker, credentials=None, _http=None,
+                 parallel_composite_upload_threshold=None,
+                 parallel_composite_upload_component_size=(
+                     _DEFAULT_COMPOSITE_COMPONENT_SIZE),
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False,
+                 keep_alive=True):
         self._base_connection = None
+        self._pool_options = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block,
+            'keep_alive': keep_alive,
+        }
         if project is None:
             no_project = True
             project = '<none>'
@@ -73,6 +125,10 @@ class Client(ClientWithProject):
             self.project = None
         self._connection = Connection(self)
         self._batch_stack = _LocalStack()
+        self.parallel_composite_upload_threshold = (
+            parallel_composite_upload_threshold)
+        self.parallel_composite_upload_component_size = (
+            parallel_composite_upload_component_size)
 
     @classmethod
     def create_anonymous_client(cls):
@@ -90,6 +146,39 @@ class Client(ClientWithProject):
         client.project = None
         return client
 
+    @property
+    def _http(self):
+        """Getter for object used for HTTP transport.
+
+        The session created by the client sends requests through a
+        :class:`~google.cloud.storage._http.PooledHTTPAdapter`.
+
+        :rtype: :class:`~requests.Session`
+        :returns: An HTTP object.
+        """
+        if self._http_internal is None:
+            http = super(Client, self)._http
+            mount_pooled_adapter(
+                http, PooledHTTPAdapter(**self._pool_options))
+        return self._http_internal
+
+    def pool_stats(self):
+        """Statistics of the pool of connections of the client.
+
+        :rtype: dict or ``NoneType``
+        :returns: The statistics returned by
+                  :meth:`~google.cloud.storage._http.PooledHTTPAdapter.pool_stats`,
+                  or :data:`None` if the HTTP object of the client does not
+                  use a pooled adapter.
+        """
+        http = self._http
+        if not isinstance(http, requests.Session):
+            return None
+        adapter = http.get_adapter(self._base_connection.API_BASE_URL)
+        if not isinstance(adapter, PooledHTTPAdapter):
+            return None
+        return adapter.pool_stats()
+
     @property
     def _connection(self):
         """Get connection or batch on the client.
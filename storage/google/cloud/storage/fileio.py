@@ -0,0 +1,323 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects streaming the contents of blobs.
+
+Use :meth:`~google.cloud.storage.blob.Blob.open` to create them.
+"""
+
+import concurrent.futures
+import io
+
+from google import resumable_media
+from google.cloud.storage._helpers import _raise_from_invalid_response
+
+
+DEFAULT_CHUNK_SIZE = 10485760  # 1024 * 1024 B * 10 = 10 MB
+"""Default size of the ranges read, and of the chunks uploaded."""
+
+_GZIP_NOT_SUPPORTED = (
+    'Blobs stored with Content-Encoding: gzip cannot be read in ranges. '
+    'Use download_to_file() instead.')
+
+
+class BlobReader(io.RawIOBase):
+    """Read a blob as a file, in ranges.
+
+    While the data of one range is read, the next range is downloaded in
+    the background.
+
+    The blob's metadata is loaded, if it is not already, so that all ranges
+    are read from the same generation of the blob.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The size, in bytes, of each range.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :raises: :exc:`ValueError` if the blob is stored with
+             ``Content-Encoding: gzip``.
+    """
+
+    def __init__(self, blob, chunk_size=DEFAULT_CHUNK_SIZE, client=None):
+        super(BlobReader, self).__init__()
+        if blob.size is None or blob.media_link is None:
+            blob.reload(client=client)
+        if blob.content_encoding == 'gzip':
+            raise ValueError(_GZIP_NOT_SUPPORTED)
+
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._size = blob.size
+        self._position = 0
+        self._buffer = b''
+        self._buffer_start = 0
+        self._executor = concurrent.futures.ThreadPoolExecutor(1)
+        self._read_ahead = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError('Invalid whence: {!r}'.format(whence))
+        self._position = max(0, offset)
+        return self._position
+
+    def readinto(self, buffer_):
+        if self._position >= self._size:
+            return 0
+
+        offset = self._position - self._buffer_start
+        if not 0 <= offset < len(self._buffer):
+            self._fill()
+            offset = 0
+
+        data = self._buffer[offset:offset + len(buffer_)]
+        buffer_[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self):
+        if self._read_ahead is not None:
+            self._read_ahead[1].cancel()
+            self._read_ahead = None
+        self._executor.shutdown(wait=False)
+        self._buffer = b''
+        super(BlobReader, self).close()
+
+    def _fill(self):
+        """Replace the buffer with the range at the current position."""
+        start = self._position
+        read_ahead, self._read_ahead = self._read_ahead, None
+        if read_ahead is not None and read_ahead[0] == start:
+            data = read_ahead[1].result()
+        else:
+            if read_ahead is not None:
+                read_ahead[1].cancel()
+            data = self._download(start)
+
+        self._buffer = data
+        self._buffer_start = start
+
+        next_start = start + len(data)
+        if data and next_start < self._size:
+            self._read_ahead = (
+                next_start, self._executor.submit(self._download, next_start))
+
+    def _download(self, start):
+        """Download the range starting at ``start``.
+
+        :type start: int
+        :param start: The first byte of the range.
+
+        :rtype: bytes
+        :returns: The data of the range.
+        """
+        end = min(start + self._chunk_size, self._size) - 1
+        file_obj = io.BytesIO()
+        self._blob.download_to_file(
+            file_obj, client=self._client, start=start, end=end)
+        return file_obj.getvalue()
+
+
+class _SlidingBuffer(object):
+    """In-memory stream of the data written but not yet uploaded.
+
+    Positions are those in the whole upload, so that a
+    :class:`~google.resumable_media.requests.ResumableUpload` can read the
+    buffer as if it were the whole stream.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._start = 0
+        self._cursor = 0
+
+    def __len__(self):
+        """The number of bytes written but not yet read."""
+        return self._start + len(self._data) - self._cursor
+
+    def write(self, data):
+        self._data.extend(data)
+
+    def tell(self):
+        return self._cursor
+
+    def seek(self, position):
+        if not self._start <= position <= self._start + len(self._data):
+            raise ValueError(
+                'Cannot seek to {}, which is no longer buffered.'.format(
+                    position))
+        self._cursor = position
+
+    def read(self, size=-1):
+        offset = self._cursor - self._start
+        if size is None or size < 0:
+            size = len(self._data) - offset
+        data = bytes(self._data[offset:offset + size])
+        self._cursor += len(data)
+        return data
+
+    def discard(self, position):
+        """Forget the data before ``position``."""
+        del self._data[:position - self._start]
+        self._start = position
+
+
+class BlobWriter(io.RawIOBase):
+    """Write a blob as a file, with a resumable upload.
+
+    Data is uploaded each time a chunk's worth has been written, and the
+    upload is completed when the writer is closed. The blob does not exist,
+    or keeps its previous contents, until then. When the writer is used as a
+    context manager and an exception is raised in its block, the upload is
+    abandoned instead, and the blob is left as it was.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The size, in bytes, of each chunk. Must be
+                       a multiple of 256 KB. Up to this much data is held
+                       in memory.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+    """
+
+    def __init__(self, blob, chunk_size=DEFAULT_CHUNK_SIZE, content_type=None,
+                 client=None):
+        super(BlobWriter, self).__init__()
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError(
+                'Chunk size must be a multiple of %d.' % (
+                    blob._CHUNK_SIZE_MULTIPLE,))
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._content_type = content_type
+        self._client = client
+        self._buffer = _SlidingBuffer()
+        self._upload = None
+        self._transport = None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._abandon()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        self._buffer.write(data)
+        while len(self._buffer) >= self._chunk_size:
+            self._transmit_next_chunk()
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            try:
+                if self._upload is None:
+                    self._initiate_upload()
+                while not self._upload.finished:
+                    response = self._transmit_next_chunk()
+                self._blob._set_properties(response.json())
+            finally:
+                super(BlobWriter, self).close()
+
+    def _abandon(self):
+        """Close the writer without completing the upload."""
+        self._buffer = _SlidingBuffer()
+        self._upload = None
+        super(BlobWriter, self).close()
+
+    def _initiate_upload(self):
+        """Start the resumable upload."""
+        try:
+            self._upload, self._transport = (
+                self._blob._initiate_resumable_upload(
+                    self._client, self._buffer, self._content_type, None,
+                    None, chunk_size=self._chunk_size))
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+    def _transmit_next_chunk(self):
+        """Upload a chunk of the buffer.
+
+        :rtype: :class:`~requests.Response`
+        :returns: The response to the upload request.
+        """
+        if self._upload is None:
+            self._initiate_upload()
+        try:
+            response = self._upload.transmit_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+        self._buffer.seek(self._upload.bytes_uploaded)
+        self._buffer.discard(self._upload.bytes_uploaded)
+        return response
+
+
+class _BufferedBlobWriter(io.BufferedWriter):
+    """Buffered :class:`BlobWriter`, abandoning the upload on an exception.
+
+    :type raw: :class:`BlobWriter`
+    :param raw: The writer to buffer.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Closing the raw writer first skips the flush and the final
+            # upload request.
+            self.raw._abandon()
+        return super(_BufferedBlobWriter, self).__exit__(
+            exc_type, exc_value, traceback)
+
+
+class _TextBlobWriter(io.TextIOWrapper):
+    """Text :class:`BlobWriter`, abandoning the upload on an exception.
+
+    :type buffer: :class:`_BufferedBlobWriter`
+    :param buffer: The buffered writer to wrap.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.buffer.raw._abandon()
+        return super(_TextBlobWriter, self).__exit__(
+            exc_type, exc_value, traceback)
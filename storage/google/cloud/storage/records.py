@@ -0,0 +1,276 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact records of listed blobs, and their export to tables.
+
+When only a few properties of many blobs are needed, pass
+``record_fields`` to :meth:`~google.cloud.storage.bucket.Bucket.list_blobs`:
+only those properties are requested, and each blob is returned as a small
+record rather than a :class:`~google.cloud.storage.blob.Blob`.
+
+.. literalinclude:: snippets.py
+    :start-after: [START list_blob_records]
+    :end-before: [END list_blob_records]
+"""
+
+import itertools
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud._helpers import _rfc3339_to_datetime
+
+
+_NO_PANDAS_ERROR = (
+    'The pandas library is not installed, please install '
+    'pandas to use the to_dataframe() function.'
+)
+_NO_PYARROW_ERROR = (
+    'The pyarrow library is not installed, please install '
+    'pyarrow to use the to_arrow() function.'
+)
+
+_INTEGER = 'integer'
+_TIMESTAMP = 'timestamp'
+
+# Blob property name -> (JSON API field, type).
+_FIELDS = {
+    'cache_control': ('cacheControl', None),
+    'component_count': ('componentCount', _INTEGER),
+    'content_disposition': ('contentDisposition', None),
+    'content_encoding': ('contentEncoding', None),
+    'content_language': ('contentLanguage', None),
+    'content_type': ('contentType', None),
+    'crc32c': ('crc32c', None),
+    'etag': ('etag', None),
+    'event_based_hold': ('eventBasedHold', None),
+    'generation': ('generation', _INTEGER),
+    'id': ('id', None),
+    'kms_key_name': ('kmsKeyName', None),
+    'md5_hash': ('md5Hash', None),
+    'media_link': ('mediaLink', None),
+    'metadata': ('metadata', None),
+    'metageneration': ('metageneration', _INTEGER),
+    'name': ('name', None),
+    'retention_expiration_time': ('retentionExpirationTime', _TIMESTAMP),
+    'self_link': ('selfLink', None),
+    'size': ('size', _INTEGER),
+    'storage_class': ('storageClass', None),
+    'temporary_hold': ('temporaryHold', None),
+    'time_created': ('timeCreated', _TIMESTAMP),
+    'time_deleted': ('timeDeleted', _TIMESTAMP),
+    'updated': ('updated', _TIMESTAMP),
+}
+
+_CONVERTERS = {
+    _INTEGER: int,
+    _TIMESTAMP: _rfc3339_to_datetime,
+}
+
+_RECORD_CLASSES = {}
+
+
+class BlobRecord(object):
+    """Base class of the records of listed blobs.
+
+    Use :func:`record_class` to get the subclass holding a given set of
+    properties. Each property is an attribute named as the property of
+    :class:`~google.cloud.storage.blob.Blob`, or :data:`None` if the
+    property is not set on the blob.
+    """
+
+    __slots__ = ()
+
+    fields = ()
+    """The names of the properties held by the records."""
+
+    _converters = ()
+
+    @classmethod
+    def from_api_repr(cls, resource):
+        """Make a record from the JSON representation of a blob.
+
+        :type resource: dict
+        :param resource: The blob resource, as returned by the API.
+
+        :rtype: :class:`BlobRecord`
+        :returns: The record of the blob.
+        """
+        record = cls.__new__(cls)
+        for field, api_field, converter in cls._converters:
+            value = resource.get(api_field)
+            if value is not None and converter is not None:
+                value = converter(value)
+            setattr(record, field, value)
+        return record
+
+    def __eq__(self, other):
+        if not isinstance(other, BlobRecord):
+            return NotImplemented
+        return (self.fields == other.fields and
+                all(getattr(self, field) == getattr(other, field)
+                    for field in self.fields))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '<BlobRecord: {}>'.format(', '.join(
+            '{}={!r}'.format(field, getattr(self, field))
+            for field in self.fields))
+
+
+def record_class(fields):
+    """Get the record class holding some properties of blobs.
+
+    :type fields: sequence of str
+    :param fields: The names of the properties, as on
+                   :class:`~google.cloud.storage.blob.Blob`, such as
+                   ``('name', 'size', 'updated')``.
+
+    :rtype: type
+    :returns: A subclass of :class:`BlobRecord`.
+    :raises: :exc:`ValueError` if a property is not supported.
+    """
+    fields = tuple(fields)
+    cls = _RECORD_CLASSES.get(fields)
+    if cls is not None:
+        return cls
+
+    unknown = [field for field in fields if field not in _FIELDS]
+    if unknown or not fields:
+        raise ValueError(
+            'Unsupported record fields {!r}; choose from {}'.format(
+                unknown, ', '.join(sorted(_FIELDS))))
+    converters = tuple(
+        (field, _FIELDS[field][0], _CONVERTERS.get(_FIELDS[field][1]))
+        for field in fields)
+    cls = type('BlobRecord', (BlobRecord,), {
+        '__slots__': fields,
+        'fields': fields,
+        '_converters': converters,
+    })
+    return _RECORD_CLASSES.setdefault(fields, cls)
+
+
+def api_fields(fields):
+    """Get the partial response selector to list some properties of blobs.
+
+    :type fields: sequence of str
+    :param fields: The names of the properties, as on
+                   :class:`~google.cloud.storage.blob.Blob`.
+
+    :rtype: str
+    :returns: The ``fields`` selector of the list request.
+    """
+    return 'items({}),nextPageToken,prefixes'.format(
+        ','.join(_FIELDS[field][0] for field in fields))
+
+
+def _columns(records, fields):
+    """Collect the properties of records into columns.
+
+    :type records: iterable
+    :param records: The records, or blobs.
+
+    :type fields: sequence of str
+    :param fields: (Optional) The properties to collect. Defaults to the
+                   fields of the iterator's ``record_class``, or of the
+                   first record.
+
+    :rtype: tuple
+    :returns: The names of the properties, and the list of the values of
+              each.
+    """
+    if fields is None:
+        fields = getattr(getattr(records, 'record_class', None), 'fields',
+                         None)
+    iterator = iter(records)
+    if fields is None:
+        first = next(iterator, None)
+        if first is None:
+            return (), []
+        fields = first.fields
+        iterator = itertools.chain([first], iterator)
+
+    columns = [[] for _ in fields]
+    for record in iterator:
+        for column, field in zip(columns, fields):
+            column.append(getattr(record, field))
+    return tuple(fields), columns
+
+
+def to_dataframe(records, fields=None):
+    """Create a pandas DataFrame from listed blobs.
+
+    :type records: iterable
+    :param records: The :class:`BlobRecord` instances, such as the iterator
+                    returned by
+                    :meth:`~google.cloud.storage.bucket.Bucket.list_blobs`
+                    with ``record_fields``. Instances of
+                    :class:`~google.cloud.storage.blob.Blob` may be passed
+                    along with ``fields``.
+
+    :type fields: sequence of str
+    :param fields: (Optional) The properties to use as columns. Defaults to
+                   those of the records.
+
+    :rtype: :class:`pandas.DataFrame`
+    :returns: A frame with one row per blob.
+    :raises: :exc:`ValueError` if the :mod:`pandas` library cannot be
+             imported.
+    """
+    if pandas is None:
+        raise ValueError(_NO_PANDAS_ERROR)
+    fields, columns = _columns(records, fields)
+    return pandas.DataFrame(dict(zip(fields, columns)), columns=fields)
+
+
+def to_arrow(records, fields=None):
+    """Create a pyarrow Table from listed blobs.
+
+    Integer properties become ``int64`` columns, and timestamps become
+    ``timestamp[us, tz=UTC]`` columns.
+
+    :type records: iterable
+    :param records: The :class:`BlobRecord` instances, or blobs, as for
+                    :func:`to_dataframe`.
+
+    :type fields: sequence of str
+    :param fields: (Optional) The properties to use as columns. Defaults to
+                   those of the records.
+
+    :rtype: :class:`pyarrow.Table`
+    :returns: A table with one row per blob.
+    :raises: :exc:`ValueError` if the :mod:`pyarrow` library cannot be
+             imported.
+    """
+    if pyarrow is None:
+        raise ValueError(_NO_PYARROW_ERROR)
+    fields, columns = _columns(records, fields)
+    arrow_types = {
+        _INTEGER: pyarrow.int64(),
+        _TIMESTAMP: pyarrow.timestamp('us', tz='UTC'),
+    }
+    arrays = []
+    for field, column in zip(fields, columns):
+        kind = _FIELDS.get(field, (None, None))[1]
+        arrays.append(pyarrow.array(column, type=arrow_types.get(kind)))
+    return pyarrow.Table.from_arrays(arrays, names=list(fields))
@@ -0,0 +1,377 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transfer many files to or from Cloud Storage concurrently.
+
+.. literalinclude:: snippets.py
+    :start-after: [START transfer_manager]
+    :end-before: [END transfer_manager]
+"""
+
+import concurrent.futures
+import errno
+import os
+import threading
+import time
+
+import requests
+
+from google import resumable_media
+from google.api_core import exceptions
+from google.api_core import retry
+from google.cloud.storage._http import _ensure_pool_size
+
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of files transferred at once."""
+
+_RETRYABLE_TYPES = (
+    exceptions.TooManyRequests,
+    exceptions.InternalServerError,
+    exceptions.BadGateway,
+    exceptions.ServiceUnavailable,
+    exceptions.GatewayTimeout,
+    requests.exceptions.ConnectionError,
+    resumable_media.DataCorruption,
+)
+
+DEFAULT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(*_RETRYABLE_TYPES))
+"""The default retry object for the transfer of each file."""
+
+DEFAULT_DEADLINE = 120.0
+"""Default time, in seconds, allowed for retrying each file, before the time
+it takes to transfer."""
+
+MIN_BYTES_PER_SECOND = 256 * 1024
+"""Slowest expected transfer rate, to scale the retry deadline of a file."""
+
+UPLOAD = 'upload'
+DOWNLOAD = 'download'
+
+
+def _scale_deadline(retry_, deadline, size):
+    """Set the deadline of a retry, extended by the time a file may take.
+
+    The deadline of a :class:`~google.api_core.retry.Retry` covers all of
+    its attempts, and each attempt transfers a whole file.
+
+    :type retry_: :class:`~google.api_core.retry.Retry`
+    :param retry_: The retry object.
+
+    :type deadline: float
+    :param deadline: The deadline for a file of no size, or :data:`None` to
+                     keep the deadline of ``retry_``.
+
+    :type size: int
+    :param size: The size of the file, in bytes, if known.
+
+    :rtype: :class:`~google.api_core.retry.Retry`
+    :returns: A retry object whose deadline is ``deadline`` plus the time to
+              transfer ``size`` bytes at :data:`MIN_BYTES_PER_SECOND`.
+    """
+    if deadline is None:
+        return retry_
+    if size:
+        deadline += size / float(MIN_BYTES_PER_SECOND)
+    return retry_.with_deadline(deadline)
+
+
+def _makedirs(path):
+    """Create a directory and its parents, if they do not exist."""
+    try:
+        os.makedirs(path)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+
+
+class TransferResult(object):
+    """The outcome of the transfer of one file.
+
+    :type direction: str
+    :param direction: Either :data:`UPLOAD` or :data:`DOWNLOAD`.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob uploaded or downloaded.
+
+    :type filename: str
+    :param filename: The local file.
+    """
+
+    def __init__(self, direction, blob, filename):
+        self.direction = direction
+        self.blob = blob
+        self.filename = filename
+        self.bytes_transferred = 0
+        self.attempts = 0
+        self.elapsed = None
+        self.exception = None
+
+    def __repr__(self):
+        return '<TransferResult: {} {} {!r} ({} bytes)>'.format(
+            self.direction, self.filename, self.blob.name,
+            self.bytes_transferred)
+
+    @property
+    def succeeded(self):
+        """Whether the file was transferred.
+
+        :rtype: bool
+        :returns: True unless the last attempt raised an exception.
+        """
+        return self.exception is None
+
+
+class TransferManager(object):
+    """Transfer many files to or from Cloud Storage concurrently.
+
+    Files are transferred by a pool of worker threads, which share the
+    client's HTTP session. Each file is retried on its own when it fails
+    with a transient error; a file which still fails does not stop the
+    others, but is reported in its :class:`TransferResult`. The retry
+    deadline of each file is ``deadline``, extended by the time the file
+    takes to transfer at :data:`MIN_BYTES_PER_SECOND`.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of files transferred at once.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) How to retry the transfer of each file. Its
+                  deadline is replaced, unless ``deadline`` is
+                  :data:`None`.
+
+    :type deadline: float
+    :param deadline: (Optional) Time, in seconds, allowed for retrying a
+                     file, in addition to the time it may take to transfer.
+                     Defaults to :data:`DEFAULT_DEADLINE`. If :data:`None`,
+                     the deadline of ``retry`` is used as is.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called with the
+                              :class:`TransferResult` of each file once it
+                              is done. Progress is only reported per file,
+                              not as the bytes of a file are transferred.
+                              It is called from the worker threads.
+    """
+
+    def __init__(self, client, max_workers=DEFAULT_MAX_WORKERS,
+                 retry=DEFAULT_RETRY, progress_callback=None,
+                 deadline=DEFAULT_DEADLINE):
+        self._client = client
+        self._max_workers = max_workers
+        self._retry = retry
+        self._deadline = deadline
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._started = None
+        self._finished = None
+        self.bytes_transferred = 0
+        self.files_transferred = 0
+        self.files_failed = 0
+        _ensure_pool_size(client._http, max_workers)
+
+    @property
+    def elapsed(self):
+        """Time spent transferring files, in seconds.
+
+        :rtype: float
+        :returns: The time since the first transfer began, until the last
+                  one ended, or 0.0 if none has begun.
+        """
+        if self._started is None:
+            return 0.0
+        finished = self._finished
+        if finished is None:
+            finished = time.time()
+        return finished - self._started
+
+    @property
+    def throughput(self):
+        """Aggregate throughput of all transfers.
+
+        :rtype: float
+        :returns: Bytes transferred per second, or :data:`None` if no time
+                  has elapsed.
+        """
+        elapsed = self.elapsed
+        if not elapsed:
+            return None
+        return self.bytes_transferred / elapsed
+
+    def upload_files(self, uploads):
+        """Upload files concurrently.
+
+        :type uploads: iterable of (str, :class:`~.blob.Blob`) tuples
+        :param uploads: The path of each file, and the blob to upload it to.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: The result of each upload, in the order given.
+        """
+        results = [
+            TransferResult(UPLOAD, blob, filename)
+            for filename, blob in uploads]
+        return self._run(results)
+
+    def download_blobs(self, downloads):
+        """Download blobs concurrently.
+
+        :type downloads: iterable of (:class:`~.blob.Blob`, str) tuples
+        :param downloads: Each blob, and the path of the file to download it
+                          to. Missing directories are created.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: The result of each download, in the order given.
+        """
+        results = [
+            TransferResult(DOWNLOAD, blob, filename)
+            for blob, filename in downloads]
+        return self._run(results)
+
+    def upload_directory(self, source_directory, bucket, prefix=''):
+        """Upload every file in a directory tree.
+
+        :type source_directory: str
+        :param source_directory: The directory to upload.
+
+        :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+        :param bucket: The bucket to upload to.
+
+        :type prefix: str
+        :param prefix: (Optional) Prepended to the path of each file,
+                       relative to ``source_directory``, to name its blob.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: The result of each upload.
+        """
+        uploads = []
+        for dirpath, _, filenames in os.walk(source_directory):
+            for name in sorted(filenames):
+                filename = os.path.join(dirpath, name)
+                relative = os.path.relpath(filename, source_directory)
+                blob_name = prefix + relative.replace(os.sep, '/')
+                uploads.append((filename, bucket.blob(blob_name)))
+        return self.upload_files(uploads)
+
+    def download_prefix(self, bucket, prefix, destination_directory):
+        """Download every blob whose name starts with a prefix.
+
+        Each blob is saved under ``destination_directory`` at the path of
+        its name after ``prefix``. Blobs whose names end with ``/`` are
+        skipped.
+
+        :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+        :param bucket: The bucket to download from.
+
+        :type prefix: str
+        :param prefix: The prefix of the blobs to download.
+
+        :type destination_directory: str
+        :param destination_directory: The directory to download to.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: The result of each download.
+
+        :raises: :exc:`ValueError` if the name of a blob would lead outside
+                 of ``destination_directory``. No blob is downloaded.
+        """
+        root = os.path.abspath(destination_directory)
+        downloads = []
+        for blob in bucket.list_blobs(prefix=prefix, client=self._client):
+            relative = blob.name[len(prefix):]
+            if not relative or relative.endswith('/'):
+                continue
+            filename = os.path.abspath(
+                os.path.join(root, *relative.split('/')))
+            if not filename.startswith(os.path.join(root, '')):
+                raise ValueError(
+                    'Blob {!r} would be downloaded outside of {!r}'.format(
+                        blob.name, destination_directory))
+            downloads.append((blob, filename))
+        return self.download_blobs(downloads)
+
+    def _run(self, results):
+        """Transfer files on the worker pool.
+
+        :type results: list of :class:`TransferResult`
+        :param results: The transfers to make.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: ``results``, updated.
+        """
+        if not results:
+            return results
+        with self._lock:
+            if self._started is None:
+                self._started = time.time()
+        executor = concurrent.futures.ThreadPoolExecutor(self._max_workers)
+        with executor:
+            futures = [
+                executor.submit(self._transfer, result) for result in results]
+            for future in futures:
+                future.result()
+        with self._lock:
+            self._finished = time.time()
+        return results
+
+    def _transfer(self, result):
+        """Transfer one file, with retries.
+
+        :type result: :class:`TransferResult`
+        :param result: The transfer to make. It is updated in place.
+        """
+        def attempt():
+            result.attempts += 1
+            if result.direction == UPLOAD:
+                result.blob.upload_from_filename(
+                    result.filename, client=self._client)
+            else:
+                self._download(result.blob, result.filename)
+            return os.path.getsize(result.filename)
+
+        started = time.time()
+        try:
+            if result.direction == UPLOAD:
+                size = os.path.getsize(result.filename)
+            else:
+                size = result.blob.size
+            retry_ = _scale_deadline(self._retry, self._deadline, size)
+            result.bytes_transferred = retry_(attempt)()
+        except Exception as exc:  # pylint: disable=broad-except
+            result.exception = exc
+        result.elapsed = time.time() - started
+
+        with self._lock:
+            if result.succeeded:
+                self.files_transferred += 1
+                self.bytes_transferred += result.bytes_transferred
+            else:
+                self.files_failed += 1
+        if self._progress_callback is not None:
+            self._progress_callback(result)
+
+    def _download(self, blob, filename):
+        """Download a blob, creating the directory of the file.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob to download.
+
+        :type filename: str
+        :param filename: The path of the file to download to.
+        """
+        _makedirs(os.path.dirname(os.path.abspath(filename)))
+        blob.download_to_filename(filename, client=self._client)
@@ -38,7 +38,13 @@ def default(session):
     session.install('mock', 'pytest', 'pytest-cov')
     for local_dep in LOCAL_DEPS:
         session.install('-e', local_dep)
-    session.install('-e', '.')
+
+    # Pyarrow does not support Python 3.7
+    if session.python == '3.7':
+        dev_install = '.[pandas]'
+    else:
+        dev_install = '.[pandas, pyarrow]'
+    session.install('-e', dev_install)
 
     # Run py.test against the unit tests.
     session.run(
@@ -61,6 +67,14 @@ def unit(session):
     default(session)
 
 
+@nox.session(python='3.6')
+@nox.parametrize('urllib3', ['1.21.1', '1.24.3'])
+def unit_urllib3(session, urllib3):
+    """Run the unit test suite against the bounds of the urllib3 range."""
+    session.install('urllib3=={}'.format(urllib3))
+    default(session)
+
+
 @nox.session(python=['2.7', '3.6'])
 def system(session):
     """Run the system test suite."""
@@ -32,8 +32,19 @@ dependencies = [
     'google-cloud-core<0.29dev,>=0.28.0',
     'google-api-core<2.0.0dev,>=0.1.1',
     'google-resumable-media>=0.3.1',
+    # PooledHTTPAdapter reads the pools and counters of urllib3 1.x.
+    'urllib3<2.0.0dev,>=1.21.1',
+    # Fast CRC32C, to check downloads and uploads.
+    'google-crc32c>=0.1.0; python_version >= "3.5"',
 ]
 extras = {
+    # google-crc32c does not support Python 2.7; crcmod builds its C
+    # extension when a compiler is available.
+    'crcmod: python_version < "3.5"': 'crcmod>=1.7',
+    'pandas': 'pandas>=0.17.1',
+    # Exclude PyArrow dependency from Windows Python 2.7.
+    'pyarrow: platform_system != "Windows" or python_version >= "3.4"':
+        'pyarrow>=0.4.1',
 }
 
 
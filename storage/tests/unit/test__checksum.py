@@ -0,0 +1,243 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+
+
+class Test_crc32c(unittest.TestCase):
+
+    def _call_fut(self, *args):
+        from google.cloud.storage._checksum import crc32c
+
+        return crc32c(*args)
+
+    def test_check_value(self):
+        self.assertEqual(self._call_fut(b'123456789'), 0xE3069283)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(b''), 0)
+
+    def test_incremental(self):
+        crc = self._call_fut(b'1234')
+        self.assertEqual(self._call_fut(b'56789', crc), 0xE3069283)
+
+    def test_python_matches(self):
+        from google.cloud.storage._checksum import _crc32c_python
+
+        data = bytes(bytearray(range(256))) * 3
+        self.assertEqual(_crc32c_python(data), self._call_fut(data))
+
+
+class Test__crc32c_google(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud.storage._checksum import _crc32c_google
+
+        module = mock.Mock(spec=['extend'])
+        module.extend.return_value = 0xE3069283
+
+        with mock.patch(
+                'google.cloud.storage._checksum.google_crc32c', new=module):
+            self.assertEqual(_crc32c_google(b'56789', 1234), 0xE3069283)
+
+        module.extend.assert_called_once_with(1234, b'56789')
+
+
+class Test_update_from_file(unittest.TestCase):
+
+    @mock.patch('google.cloud.storage._checksum._FILE_CHUNK_SIZE', new=4)
+    def test_it(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage._checksum import Checksums
+        from google.cloud.storage._checksum import update_from_file
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'123456789')
+            checksums = Checksums(crc32c=True, md5=False)
+
+            result = update_from_file(checksums, temp.name)
+
+        self.assertIs(result, checksums)
+        self.assertEqual(checksums.crc32c, 0xE3069283)
+        self.assertEqual(checksums.bytes_hashed, 9)
+
+
+class Test_crc32c_combine(unittest.TestCase):
+
+    def _call_fut(self, *args):
+        from google.cloud.storage._checksum import crc32c_combine
+
+        return crc32c_combine(*args)
+
+    def test_combine(self):
+        from google.cloud.storage._checksum import crc32c
+
+        first, second = b'hello, ', b'world' * 1000
+        combined = self._call_fut(
+            crc32c(first), crc32c(second), len(second))
+        self.assertEqual(combined, crc32c(first + second))
+
+    def test_empty_second(self):
+        self.assertEqual(self._call_fut(1234, 0, 0), 1234)
+
+
+class Test_crc32c_to_b64(unittest.TestCase):
+
+    def _call_fut(self, crc):
+        from google.cloud.storage._checksum import crc32c_to_b64
+
+        return crc32c_to_b64(crc)
+
+    def test_it(self):
+        self.assertEqual(self._call_fut(0xE3069283), '4waSgw==')
+
+
+class Test_parse_hash_header(unittest.TestCase):
+
+    def _call_fut(self, header_value):
+        from google.cloud.storage._checksum import parse_hash_header
+
+        return parse_hash_header(header_value)
+
+    def test_none(self):
+        self.assertEqual(self._call_fut(None), {})
+
+    def test_both(self):
+        self.assertEqual(
+            self._call_fut('crc32c=n03x6A==, md5=Ojk9c3dhfxgoKVVHYwFbHQ=='),
+            {'crc32c': 'n03x6A==', 'md5': 'Ojk9c3dhfxgoKVVHYwFbHQ=='})
+
+
+class TestChecksums(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._checksum import Checksums
+
+        return Checksums
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_update(self):
+        import base64
+        import hashlib
+
+        checksums = self._make_one(crc32c=True)
+
+        checksums.update(b'1234')
+        checksums.update(b'56789')
+
+        self.assertEqual(checksums.crc32c, 0xE3069283)
+        self.assertEqual(checksums.crc32c_b64, '4waSgw==')
+        expected_md5 = base64.b64encode(
+            hashlib.md5(b'123456789').digest()).decode('ascii')
+        self.assertEqual(checksums.md5_b64, expected_md5)
+        self.assertEqual(checksums.bytes_hashed, 9)
+
+    def test_ctor_defaults_to_native(self):
+        with mock.patch('google.cloud.storage._checksum.NATIVE', new=False):
+            checksums = self._make_one(md5=False)
+
+        checksums.update(b'123')
+
+        self.assertIsNone(checksums.crc32c_b64)
+        self.assertIsNone(checksums.md5_b64)
+
+    def test_find_mismatch_prefers_crc32c(self):
+        checksums = self._make_one(crc32c=True)
+        checksums.update(b'123456789')
+
+        self.assertIsNone(
+            checksums.find_mismatch(crc32c='4waSgw==', md5='bad'))
+        self.assertEqual(
+            checksums.find_mismatch(crc32c='AAAAAA==', md5='bad'),
+            ('crc32c', 'AAAAAA==', '4waSgw=='))
+
+    def test_find_mismatch_md5(self):
+        checksums = self._make_one(crc32c=False)
+        checksums.update(b'123456789')
+
+        self.assertIsNone(checksums.find_mismatch(crc32c='AAAAAA=='))
+        self.assertEqual(
+            checksums.find_mismatch(md5='bad'),
+            ('md5', 'bad', checksums.md5_b64))
+
+
+class TestHashingWriter(unittest.TestCase):
+
+    def test_write(self):
+        from google.cloud.storage._checksum import Checksums
+        from google.cloud.storage._checksum import HashingWriter
+
+        file_obj = io.BytesIO()
+        writer = HashingWriter(file_obj, Checksums(crc32c=True))
+
+        writer.write(b'1234')
+        writer.write(b'56789')
+
+        self.assertEqual(file_obj.getvalue(), b'123456789')
+        self.assertEqual(writer.checksums.crc32c, 0xE3069283)
+
+
+class TestHashingReader(unittest.TestCase):
+
+    def test_read_after_seek(self):
+        from google.cloud.storage._checksum import Checksums
+        from google.cloud.storage._checksum import HashingReader
+
+        checksums = Checksums(crc32c=True)
+        reader = HashingReader(io.BytesIO(b'123456789'), checksums)
+
+        self.assertEqual(reader.read(6), b'123456')
+        reader.seek(2)
+        self.assertEqual(reader.tell(), 2)
+        self.assertEqual(reader.read(4), b'3456')
+        self.assertEqual(reader.read(), b'789')
+
+        self.assertEqual(checksums.crc32c, 0xE3069283)
+        self.assertEqual(checksums.bytes_hashed, 9)
+
+    def test_read_after_seek_forward(self):
+        from google.cloud.storage._checksum import Checksums
+        from google.cloud.storage._checksum import HashingReader
+
+        checksums = Checksums(crc32c=True)
+        reader = HashingReader(io.BytesIO(b'123456789'), checksums)
+
+        reader.seek(4)
+        reader.read()
+
+        self.assertEqual(checksums.bytes_hashed, 0)
+
+    def test_read_from_offset(self):
+        from google.cloud.storage._checksum import Checksums
+        from google.cloud.storage._checksum import HashingReader
+
+        stream = io.BytesIO(b'xyz123456789')
+        stream.seek(3)
+        checksums = Checksums(crc32c=True)
+        reader = HashingReader(stream, checksums)
+
+        self.assertEqual(reader.read(6), b'123456')
+        self.assertEqual(reader.seek(2), 2)
+        self.assertEqual(reader.tell(), 2)
+        self.assertEqual(reader.read(), b'3456789')
+
+        self.assertEqual(checksums.crc32c, 0xE3069283)
+        self.assertEqual(checksums.bytes_hashed, 9)
@@ -0,0 +1,106 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+_MB = 1024 * 1024
+
+
+class TestAdaptiveChunkSize(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._chunking import AdaptiveChunkSize
+
+        return AdaptiveChunkSize
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        chunk_size = self._make_one()
+
+        self.assertEqual(chunk_size.chunk_size, 8 * _MB)
+        self.assertEqual(chunk_size.retry_rate, 0.0)
+
+    def test_ctor_clamps_initial(self):
+        self.assertEqual(self._make_one(1000).chunk_size, _MB)
+        self.assertEqual(self._make_one(1000 * _MB).chunk_size, 100 * _MB)
+        self.assertEqual(
+            self._make_one(3 * _MB + 1000).chunk_size, 3 * _MB)
+
+    def test_record_grows_at_most_twice(self):
+        chunk_size = self._make_one(4 * _MB)
+
+        # 100 MB/s would allow 400 MB chunks.
+        self.assertEqual(chunk_size.record(4 * _MB, 0.04, 1), 8 * _MB)
+        self.assertEqual(chunk_size.record(8 * _MB, 0.08, 1), 16 * _MB)
+
+    def test_record_targets_duration(self):
+        chunk_size = self._make_one(16 * _MB)
+
+        # 3 MB/s: 12 MB in 4 seconds.
+        self.assertEqual(chunk_size.record(16 * _MB, 16.0 / 3, 1), 12 * _MB)
+
+    def test_record_shrinks_at_most_half(self):
+        chunk_size = self._make_one(16 * _MB)
+
+        self.assertEqual(chunk_size.record(16 * _MB, 1000.0, 1), 8 * _MB)
+
+    def test_record_w_retry(self):
+        chunk_size = self._make_one(16 * _MB)
+
+        self.assertEqual(chunk_size.record(16 * _MB, 0.1, 2), 8 * _MB)
+        self.assertAlmostEqual(chunk_size.retry_rate, 0.3)
+
+        # Retries recently make the target duration shorter.
+        self.assertEqual(chunk_size.record(8 * _MB, 4.0, 1), 6400 * 1024)
+        self.assertAlmostEqual(chunk_size.retry_rate, 0.21)
+
+    def test_record_wo_progress(self):
+        chunk_size = self._make_one(4 * _MB)
+
+        self.assertEqual(chunk_size.record(0, 1.0, 1), 2 * _MB)
+
+    def test_transmit_next_chunk(self):
+        chunk_size = self._make_one(2 * _MB)
+        transport = mock.Mock(spec=['request'])
+        response = mock.sentinel.response
+
+        class _Upload(object):
+            bytes_uploaded = _MB
+            _chunk_size = None
+
+            def transmit_next_chunk(self, transport):
+                # The first request fails and is retried.
+                transport.request('PUT', 'http://test.invalid')
+                transport.request('PUT', 'http://test.invalid')
+                self.bytes_uploaded += self._chunk_size
+                return response
+
+        upload = _Upload()
+        time_module = mock.Mock(spec=['time'])
+        time_module.time.side_effect = [10.0, 11.0]
+
+        with mock.patch('google.cloud.storage._chunking.time', time_module):
+            result = chunk_size.transmit_next_chunk(upload, transport)
+
+        self.assertIs(result, response)
+        self.assertEqual(upload._chunk_size, 2 * _MB)
+        self.assertEqual(upload.bytes_uploaded, 3 * _MB)
+        self.assertEqual(transport.request.call_count, 2)
+        self.assertEqual(chunk_size.chunk_size, _MB)
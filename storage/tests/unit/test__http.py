@@ -83,3 +83,148 @@ class TestConnection(unittest.TestCase):
                          '/'.join(['', 'storage', conn.API_VERSION, 'foo']))
         parms = dict(parse_qsl(qs))
         self.assertEqual(parms['bar'], 'baz')
+
+
+class Test__ensure_pool_size(unittest.TestCase):
+
+    def _call_fut(self, session, size):
+        from google.cloud.storage._http import _ensure_pool_size
+
+        return _ensure_pool_size(session, size)
+
+    def test_grows_pool(self):
+        import requests
+
+        session = requests.Session()
+
+        self._call_fut(session, 32)
+
+        self.assertEqual(session.get_adapter('https://')._pool_maxsize, 32)
+
+    def test_keeps_larger_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = session.get_adapter('https://')
+
+        self._call_fut(session, 2)
+
+        self.assertIs(session.get_adapter('https://'), adapter)
+
+    def test_resizes_pooled_adapter(self):
+        import requests
+        from google.cloud.storage._http import PooledHTTPAdapter
+
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(pool_maxsize=4, keep_alive=False)
+        session.mount('https://', adapter)
+
+        self._call_fut(session, 16)
+
+        self.assertIs(session.get_adapter('https://'), adapter)
+        self.assertEqual(adapter.pool_stats()['pool_maxsize'], 16)
+
+    def test_ignores_other_transports(self):
+        session = mock.Mock(spec=['request'])
+
+        self._call_fut(session, 32)
+
+
+class TestPooledHTTPAdapter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._http import PooledHTTPAdapter
+
+        return PooledHTTPAdapter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_request():
+        import requests
+
+        return requests.Request('GET', 'https://example.com/').prepare()
+
+    def test_ctor_defaults(self):
+        adapter = self._make_one()
+
+        self.assertEqual(adapter.pool_stats(), {
+            'pool_connections': 10,
+            'pool_maxsize': 32,
+            'pool_block': False,
+            'keep_alive': True,
+            'pools': 0,
+            'connections_opened': 0,
+            'requests': 0,
+        })
+
+    def test_send_wo_keep_alive(self):
+        import requests.adapters
+
+        adapter = self._make_one(keep_alive=False)
+        request = self._make_request()
+
+        with mock.patch.object(
+                requests.adapters.HTTPAdapter, 'send') as send:
+            adapter.send(request, timeout=5)
+
+        send.assert_called_once_with(request, timeout=5)
+        self.assertEqual(request.headers['Connection'], 'close')
+
+    def test_send_w_keep_alive(self):
+        import requests.adapters
+
+        adapter = self._make_one()
+        request = self._make_request()
+
+        with mock.patch.object(requests.adapters.HTTPAdapter, 'send'):
+            adapter.send(request)
+
+        self.assertNotIn('Connection', request.headers)
+
+    def test_pool_stats_and_resize(self):
+        adapter = self._make_one(pool_maxsize=2, pool_block=True)
+        pool = adapter.get_connection('https://example.com/')
+        pool.num_connections = 2
+        pool.num_requests = 5
+
+        stats = adapter.pool_stats()
+        self.assertEqual(stats['pools'], 1)
+        self.assertEqual(stats['connections_opened'], 2)
+        self.assertEqual(stats['requests'], 5)
+
+        adapter.resize(1)
+        self.assertIs(adapter.get_connection('https://example.com/'), pool)
+
+        adapter.resize(8)
+        new_pool = adapter.get_connection('https://example.com/')
+        self.assertIsNot(new_pool, pool)
+        self.assertEqual(new_pool.pool.maxsize, 8)
+        self.assertTrue(new_pool.block)
+        stats = adapter.pool_stats()
+        self.assertEqual(stats['pool_maxsize'], 8)
+        self.assertEqual(stats['connections_opened'], 2)
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['pools'], 1)
+
+    def test_pool_stats_w_evicted_pool(self):
+        adapter = self._make_one(pool_connections=1)
+        first = adapter.get_connection('https://one.example.com/')
+        first.num_requests = 3
+        second = adapter.get_connection('https://two.example.com/')
+        second.num_requests = 4
+
+        stats = adapter.pool_stats()
+        self.assertEqual(stats['pools'], 1)
+        self.assertEqual(stats['requests'], 4)
+
+    def test_pickle(self):
+        import pickle
+
+        adapter = self._make_one(pool_maxsize=4, keep_alive=False)
+
+        copied = pickle.loads(pickle.dumps(adapter))
+
+        self.assertEqual(copied.pool_stats(), adapter.pool_stats())
@@ -0,0 +1,139 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+
+class _Page(list):
+
+    def __init__(self, items, prefixes=()):
+        super(_Page, self).__init__(items)
+        self.prefixes = tuple(prefixes)
+
+
+def _make_bucket(names, error_prefix=None):
+    """Bucket whose ``list_blobs`` pages through ``names``, one per page."""
+
+    def list_blobs(prefix, delimiter, **kw):
+        if prefix == error_prefix:
+            raise ValueError(prefix)
+        items, prefixes = [], []
+        for name in names:
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            if delimiter in rest:
+                sub_prefix = prefix + rest[:rest.index(delimiter) + 1]
+                if sub_prefix not in prefixes:
+                    prefixes.append(sub_prefix)
+            else:
+                items.append(name)
+        pages = [_Page([item]) for item in items] or [_Page([])]
+        pages[0].prefixes = tuple(prefixes)
+        return mock.Mock(pages=iter(pages), spec=['pages'])
+
+    bucket = mock.Mock(spec=['list_blobs'])
+    bucket.list_blobs.side_effect = list_blobs
+    return bucket
+
+
+class Test__with_prefixes(unittest.TestCase):
+
+    def _call_fut(self, fields):
+        from google.cloud.storage._listing import _with_prefixes
+
+        return _with_prefixes(fields)
+
+    def test_none(self):
+        self.assertIsNone(self._call_fut(None))
+
+    def test_adds_fields(self):
+        self.assertEqual(
+            self._call_fut('items(name)'),
+            'items(name),prefixes,nextPageToken')
+
+    def test_keeps_fields(self):
+        fields = 'nextPageToken,prefixes,items/name'
+        self.assertEqual(self._call_fut(fields), fields)
+
+
+class TestParallelListing(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._listing import ParallelListing
+
+        return ParallelListing
+
+    def _make_one(self, bucket, prefix='', max_in_flight=10, **list_kwargs):
+        return self._get_target_class()(
+            bucket, prefix, '/', 4, max_in_flight, list_kwargs)
+
+    def test_lists_all_blobs(self):
+        names = [
+            'a', 'b', 'x/', 'x/1', 'x/2', 'x/y/1', 'x/y/z/1', 'z/1', 'z/2/',
+        ]
+        bucket = _make_bucket(names)
+        client = mock.sentinel.client
+
+        listing = self._make_one(
+            bucket, fields='items(name)', client=client)
+
+        self.assertEqual(sorted(listing), sorted(names))
+        prefixes = sorted(
+            call[1]['prefix'] for call in bucket.list_blobs.call_args_list)
+        self.assertEqual(
+            prefixes, ['', 'x/', 'x/y/', 'x/y/z/', 'z/', 'z/2/'])
+        for call in bucket.list_blobs.call_args_list:
+            self.assertEqual(call[1]['delimiter'], '/')
+            self.assertEqual(
+                call[1]['fields'], 'items(name),prefixes,nextPageToken')
+            self.assertIs(call[1]['client'], client)
+
+    def test_w_prefix(self):
+        bucket = _make_bucket(['a/1', 'a/b/1', 'c/1'])
+
+        listing = self._make_one(bucket, prefix='a/')
+
+        self.assertEqual(sorted(listing), ['a/1', 'a/b/1'])
+
+    def test_error(self):
+        bucket = _make_bucket(['a/1', 'b/1'], error_prefix='b/')
+
+        with self.assertRaises(ValueError):
+            list(self._make_one(bucket))
+
+    def test_close_stops_listing(self):
+        names = ['{:03d}'.format(index) for index in range(100)]
+        bucket = _make_bucket(names)
+        listing = self._make_one(bucket, max_in_flight=1)
+
+        iterator = iter(listing)
+        self.assertIn(next(iterator), names)
+        iterator.close()
+
+        self.assertTrue(listing._stopped.is_set())
+
+    def test__put_when_stopped(self):
+        from google.cloud.storage._listing import _BLOB
+
+        listing = self._make_one(_make_bucket([]), max_in_flight=1)
+
+        with mock.patch('google.cloud.storage._listing._POLL_INTERVAL', 0.0):
+            self.assertTrue(listing._put(_BLOB, 'a'))
+            threading.Timer(0.05, listing._stopped.set).start()
+            self.assertFalse(listing._put(_BLOB, 'b'))
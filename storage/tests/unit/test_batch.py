@@ -236,7 +236,7 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(request_url, url)
         self.assertIsNone(request_data)
 
-    def test__make_request_POST_too_many_requests(self):
+    def test__make_request_POST_many_requests(self):
         url = 'http://example.com/api'
         http = _make_requests_session([])
         connection = _Connection(http=http)
@@ -244,9 +244,9 @@ class TestBatch(unittest.TestCase):
 
         batch._MAX_BATCH_SIZE = 1
         batch._requests.append(('POST', url, {}, {'bar': 2}))
+        batch._make_request('POST', url, data={'foo': 1})
 
-        with self.assertRaises(ValueError):
-            batch._make_request('POST', url, data={'foo': 1})
+        self.assertEqual(len(batch._requests), 2)
 
     def test_finish_empty(self):
         http = _make_requests_session([])
@@ -414,6 +414,43 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', url, {})
         self._check_subrequest_payload(chunks[1], 'GET', url, {})
 
+    def test_finish_split_wo_raise_exception(self):
+        url = 'http://api.example.com/other_api'
+        content_type = {
+            'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        http = _make_requests_session([
+            _make_response(
+                content=_THREE_PART_MIME_RESPONSE, headers=content_type),
+            _make_response(
+                content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+                headers=content_type),
+        ])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch.API_BASE_URL = 'http://api.example.com'
+        batch._MAX_BATCH_SIZE = 3
+        # A single worker sends the groups in order.
+        batch._MAX_CONCURRENT_BATCHES = 1
+        targets = [_MockObject() for _ in range(5)]
+
+        for target in targets:
+            batch._do_request('GET', url, {}, None, target)
+        result = batch.finish(raise_exception=False)
+
+        self.assertEqual(
+            [response.status_code for response in result],
+            [200, 200, 204, 200, 404])
+        self.assertEqual(targets[3]._properties, {'foo': 1, 'bar': 2})
+        self.assertEqual(http.request.call_count, 2)
+        chunk_counts = []
+        for call in http.request.mock_calls:
+            headers = call[2]['headers']
+            boundary = headers['Content-Type'].split(';')[1].strip()
+            chunk_counts.append(
+                len(self._get_payload_chunks(boundary, call[2]['data'])))
+        self.assertEqual(chunk_counts, [3, 2])
+
     def test_finish_nonempty_non_multipart_response(self):
         url = 'http://api.example.com/other_api'
         http = _make_requests_session([_make_response()])
@@ -754,6 +754,8 @@ class Test_Blob(unittest.TestCase):
         blob._do_download(transport, file_obj, download_url, headers)
         # Make sure the download was as expected.
         self.assertEqual(file_obj.getvalue(), b'abcdef')
+        # ``Download`` checks the MD5 hash itself.
+        self.assertIsNone(blob.computed_md5_hash)
 
         transport.request.assert_called_once_with(
             'GET', download_url, data=None, headers=headers, stream=True)
@@ -845,6 +847,67 @@ class Test_Blob(unittest.TestCase):
             'GET', download_url, data=None, headers=headers)
         self.assertEqual(transport.request.mock_calls, [call, call])
 
+    def _do_download_chunked_verify_helper(self, **headers):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        transport = mock.Mock(spec=['request'])
+        responses = [
+            self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                dict(headers, **{
+                    'content-length': '3',
+                    'content-range': 'bytes {}/6'.format(content_range),
+                }),
+                content=content)
+            for content_range, content in (('0-2', b'abc'), ('3-5', b'def'))
+        ]
+        transport.request.side_effect = responses
+        file_obj = io.BytesIO()
+
+        blob._do_download(
+            transport, file_obj, 'http://test.invalid', {})
+
+        return blob, file_obj
+
+    def test__do_download_chunked_verifies_md5(self):
+        md5_hash = base64.b64encode(
+            hashlib.md5(b'abcdef').digest()).decode('ascii')
+
+        blob, file_obj = self._do_download_chunked_verify_helper(
+            **{'x-goog-hash': 'crc32c=AAAAAA==,md5=' + md5_hash})
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+        self.assertEqual(blob.computed_md5_hash, md5_hash)
+
+    def test__do_download_chunked_md5_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption):
+            self._do_download_chunked_verify_helper(
+                **{'x-goog-hash': 'md5=bad'})
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=True)
+    def test__do_download_chunked_crc32c_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        md5_hash = base64.b64encode(
+            hashlib.md5(b'abcdef').digest()).decode('ascii')
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._do_download_chunked_verify_helper(
+                **{'x-goog-hash': 'crc32c=AAAAAA==,md5=' + md5_hash})
+
+        self.assertIn('crc32c', exc_info.exception.args[0])
+
+    def test__do_download_chunked_skips_gzip(self):
+        blob, file_obj = self._do_download_chunked_verify_helper(**{
+            'x-goog-hash': 'md5=bad',
+            'x-goog-stored-content-encoding': 'gzip',
+        })
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
     def test_download_to_file_with_failure(self):
         from google.cloud import exceptions
 
@@ -1094,6 +1157,220 @@ class Test_Blob(unittest.TestCase):
         self._check_session_mocks(
             client, transport, media_link, headers=key_headers)
 
+    def _download_sliced_helper(self, data, crc32c=None, **properties):
+        from google.cloud.storage import _checksum
+
+        transport = mock.Mock(spec=['request'])
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        if crc32c is None:
+            crc32c = _checksum.crc32c_to_b64(_checksum.crc32c(data))
+        properties.update({
+            'mediaLink': 'http://example.com/media/',
+            'size': str(len(data)),
+            'crc32c': crc32c,
+        })
+        blob = self._make_one('blob-name', bucket=bucket,
+                              properties=properties)
+
+        def do_download(transport, file_obj, download_url, headers,
+                        start=None, end=None, checksums=None):
+            if start is None:
+                chunk = data
+            else:
+                chunk = data[start:end + 1]
+            file_obj.write(chunk)
+            if checksums is not None:
+                checksums.update(chunk)
+
+        patch = mock.patch.object(
+            blob, '_do_download', side_effect=do_download)
+        return blob, patch
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=True)
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdefghij'
+        blob, patch = self._download_sliced_helper(data)
+
+        with _NamedTemporaryFile() as temp:
+            with patch as do_download:
+                blob.download_to_filename(temp.name, slices=4)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, data)
+        self.assertEqual(blob.computed_crc32c, blob.crc32c)
+        self.assertIsNone(blob.computed_md5_hash)
+        ranges = sorted(
+            call[0][4:6] for call in do_download.call_args_list)
+        self.assertEqual(ranges, [(0, 2), (3, 5), (6, 8), (9, 9)])
+        for call in do_download.call_args_list:
+            self.assertEqual(call[0][2], 'http://example.com/media/')
+            self.assertEqual(call[0][3], {})
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=True)
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_corrupted(self):
+        import os
+        import tempfile
+        from google.resumable_media import DataCorruption
+
+        blob, patch = self._download_sliced_helper(
+            b'abcdefghij', crc32c='AAAAAA==')
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        with patch:
+            with self.assertRaises(DataCorruption):
+                blob.download_to_filename(filename, slices=4)
+
+        self.assertFalse(os.path.exists(filename))
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=False)
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_wo_native_crc32c(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        # The whole file is checked once downloaded.
+        data = b'abcdefghij'
+        blob, patch = self._download_sliced_helper(data)
+
+        with _NamedTemporaryFile() as temp:
+            with patch:
+                blob.download_to_filename(temp.name, slices=4)
+
+        self.assertEqual(blob.computed_crc32c, blob.crc32c)
+        self.assertIsNone(blob.computed_md5_hash)
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=False)
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_wo_native_crc32c_w_md5(self):
+        import base64
+        import hashlib
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdefghij'
+        md5_hash = base64.b64encode(hashlib.md5(data).digest())
+        blob, patch = self._download_sliced_helper(
+            data, md5Hash=md5_hash.decode('ascii'))
+
+        with _NamedTemporaryFile() as temp:
+            with patch:
+                blob.download_to_filename(temp.name, slices=4)
+
+        self.assertEqual(blob.computed_md5_hash, blob.md5_hash)
+        self.assertIsNone(blob.computed_crc32c)
+
+    @mock.patch('google.cloud.storage._checksum.NATIVE', new=False)
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_wo_native_crc32c_corrupted(self):
+        import os
+        import tempfile
+        from google.resumable_media import DataCorruption
+
+        blob, patch = self._download_sliced_helper(
+            b'abcdefghij', crc32c='AAAAAA==')
+
+        filehandle, filename = tempfile.mkstemp()
+        os.close(filehandle)
+        with patch:
+            with self.assertRaises(DataCorruption):
+                blob.download_to_filename(filename, slices=4)
+
+        self.assertFalse(os.path.exists(filename))
+
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_gzip(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdefghij'
+        blob, patch = self._download_sliced_helper(
+            data, contentEncoding='gzip')
+
+        with _NamedTemporaryFile() as temp:
+            with patch as do_download:
+                blob.download_to_filename(temp.name, slices=4)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, data)
+        do_download.assert_called_once()
+        self.assertIsNone(do_download.call_args[0][4])
+
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_reloads(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdefghij'
+        blob, patch = self._download_sliced_helper(data)
+        properties = dict(blob._properties)
+        blob._properties.clear()
+
+        def reload(client=None):
+            blob._properties.update(properties)
+
+        with _NamedTemporaryFile() as temp:
+            with patch as do_download:
+                with mock.patch.object(blob, 'reload', side_effect=reload):
+                    blob.download_to_filename(temp.name, slices=2)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, data)
+        self.assertEqual(do_download.call_count, 2)
+
+    @mock.patch('google.cloud.storage.blob._MIN_DOWNLOAD_SLICE_SIZE', new=3)
+    def test_download_to_filename_w_slices_invalid_response(self):
+        from google.cloud import exceptions
+        from google.resumable_media import InvalidResponse
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob, patch = self._download_sliced_helper(b'abcdefghij')
+        response = self._mock_requests_response(
+            http_client.NOT_FOUND, {}, content=b'Not found')
+
+        with _NamedTemporaryFile() as temp:
+            with patch as do_download:
+                do_download.side_effect = InvalidResponse(response)
+                with self.assertRaises(exceptions.NotFound):
+                    blob.download_to_filename(temp.name, slices=2)
+
+    def test_open_rb(self):
+        blob = self._make_one('blob-name', bucket=None)
+        client = mock.sentinel.client
+        patch = mock.patch('google.cloud.storage.blob.BlobReader')
+
+        with patch as reader_class:
+            reader_class.return_value = io.BytesIO(b'abc')
+            file_obj = blob.open('rb', client=client)
+
+        self.assertIsInstance(file_obj, io.BufferedReader)
+        reader_class.assert_called_once_with(
+            blob, chunk_size=10485760, client=client)
+
+    def test_open_w(self):
+        blob = self._make_one('blob-name', bucket=None, chunk_size=262144)
+        patch = mock.patch('google.cloud.storage.blob.BlobWriter')
+
+        with patch as writer_class:
+            writer_class.return_value = io.BytesIO()
+            file_obj = blob.open('w', content_type='text/csv')
+
+        self.assertIsInstance(file_obj, io.TextIOWrapper)
+        self.assertEqual(type(file_obj).__name__, '_TextBlobWriter')
+        self.assertEqual(type(file_obj.buffer).__name__, '_BufferedBlobWriter')
+        writer_class.assert_called_once_with(
+            blob, chunk_size=262144, content_type='text/csv', client=None)
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(ValueError):
+            blob.open('a')
+
     def test_download_as_string(self):
         blob_name = 'blob-name'
         transport = self._mock_download_transport()
@@ -1458,7 +1735,8 @@ class Test_Blob(unittest.TestCase):
         self._initiate_resumable_helper(predefined_acl='private')
 
     def _make_resumable_transport(self, headers1, headers2,
-                                  headers3, total_bytes):
+                                  headers3, total_bytes, md5_hash=None,
+                                  generation=None):
         from google import resumable_media
 
         fake_transport = mock.Mock(spec=['request'])
@@ -1467,7 +1745,12 @@ class Test_Blob(unittest.TestCase):
             http_client.OK, headers1)
         fake_response2 = self._mock_requests_response(
             resumable_media.PERMANENT_REDIRECT, headers2)
-        json_body = '{{"size": "{:d}"}}'.format(total_bytes)
+        resource = {'size': '{:d}'.format(total_bytes)}
+        if md5_hash is not None:
+            resource['md5Hash'] = md5_hash
+        if generation is not None:
+            resource['generation'] = '{:d}'.format(generation)
+        json_body = json.dumps(resource)
         fake_response3 = self._mock_requests_response(
             http_client.OK, headers3,
             content=json_body.encode('utf-8'))
@@ -1587,6 +1870,57 @@ class Test_Blob(unittest.TestCase):
     def test__do_resumable_upload_with_predefined_acl(self):
         self._do_resumable_helper(predefined_acl='private')
 
+    def test__do_resumable_upload_adaptive(self):
+        megabyte = 1024 * 1024
+        blob = self._make_one(u'blob-name', bucket=_Bucket(name='yesterday'))
+        blob.chunk_size = 2 * megabyte
+        blob.adaptive_chunk_size = True
+        data = b'A' * (10 * megabyte)
+        transport = mock.Mock(spec=['request'])
+        chunk_sizes = []
+
+        class _Upload(object):
+            bytes_uploaded = 0
+            finished = False
+
+            def __init__(self, stream, chunk_size):
+                self._stream = stream
+                self._chunk_size = chunk_size
+
+            def transmit_next_chunk(self, transport):
+                transport.request('PUT', 'http://test.invalid')
+                chunk = self._stream.read(self._chunk_size)
+                chunk_sizes.append((self._chunk_size, len(chunk)))
+                self.bytes_uploaded += len(chunk)
+                self.finished = self.bytes_uploaded == len(data)
+                response = mock.Mock(spec=['json'])
+                response.json.return_value = {}
+                return response
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     predefined_acl=None, chunk_size=None):
+            return _Upload(stream, chunk_size), transport
+
+        blob._initiate_resumable_upload = mock.Mock(side_effect=initiate)
+        time_module = mock.Mock(spec=['time'])
+        # Each chunk takes half a second.
+        time_module.time.side_effect = [0.0, 0.5] * 3
+
+        with mock.patch('google.cloud.storage._chunking.time', time_module):
+            blob._do_resumable_upload(
+                mock.sentinel.client, io.BytesIO(data), u'text/plain',
+                len(data), None, None)
+
+        self.assertEqual(
+            blob._initiate_resumable_upload.call_args[1]['chunk_size'],
+            2 * megabyte)
+        self.assertEqual(chunk_sizes, [
+            (2 * megabyte, 2 * megabyte),
+            (4 * megabyte, 4 * megabyte),
+            (8 * megabyte, 4 * megabyte),
+        ])
+        self.assertEqual(transport.request.call_count, 3)
+
     def _do_upload_helper(
             self, chunk_size=None, num_retries=None, predefined_acl=None,
             size=None):
@@ -1627,6 +1961,72 @@ class Test_Blob(unittest.TestCase):
                 client, stream, content_type, size, num_retries,
                 predefined_acl)
 
+    def test__do_resumable_upload_verifies_md5(self):
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        blob.chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * blob.chunk_size) + b'</html>'
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        transport, responses = self._make_resumable_transport(
+            {'location': resumable_url},
+            {'range': 'bytes=0-{:d}'.format(blob.chunk_size - 1)},
+            {}, len(data), md5_hash=md5_hash)
+        client = mock.Mock(_http=transport, spec=['_http'])
+
+        response = blob._do_resumable_upload(
+            client, io.BytesIO(data), u'text/html', None, None, None)
+
+        self.assertIs(response, responses[2])
+        self.assertEqual(blob.computed_md5_hash, md5_hash)
+
+    def test__do_resumable_upload_md5_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        blob.chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * blob.chunk_size) + b'</html>'
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        transport, _ = self._make_resumable_transport(
+            {'location': resumable_url},
+            {'range': 'bytes=0-{:d}'.format(blob.chunk_size - 1)},
+            {}, len(data), md5_hash='bad', generation=1234)
+        client = mock.Mock(_http=transport, spec=['_http'])
+        delete_patch = mock.patch(
+            'google.cloud.storage.blob._delete_if_exists')
+
+        with delete_patch as delete:
+            with self.assertRaises(DataCorruption):
+                blob._do_resumable_upload(
+                    client, io.BytesIO(data), u'text/html', None, None, None)
+
+        (uploaded, delete_client), kwargs = delete.call_args
+        self.assertEqual(uploaded.name, blob.name)
+        self.assertIs(uploaded.bucket, bucket)
+        self.assertIs(delete_client, client)
+        self.assertEqual(kwargs, {'if_generation_match': '1234'})
+
+    def test__do_resumable_upload_verifies_from_offset(self):
+        bucket = _Bucket(name='yesterday')
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        blob.chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b'<html>' + (b'A' * blob.chunk_size) + b'</html>'
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        resumable_url = 'http://test.invalid?upload_id=and-then-there-was-1'
+        transport, _ = self._make_resumable_transport(
+            {'location': resumable_url},
+            {'range': 'bytes=0-{:d}'.format(blob.chunk_size - 1)},
+            {}, len(data), md5_hash=md5_hash)
+        client = mock.Mock(_http=transport, spec=['_http'])
+        stream = io.BytesIO(b'header' + data)
+        stream.seek(6)
+
+        blob._do_resumable_upload(
+            client, stream, u'text/html', None, None, None)
+
+        self.assertEqual(blob.computed_md5_hash, md5_hash)
+
     def test__do_upload_uses_multipart(self):
         self._do_upload_helper(
             size=google.cloud.storage.blob._MAX_MULTIPART_SIZE)
@@ -1757,6 +2157,167 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _upload_composite_helper(self, data, threshold=5, component_size=3,
+                                 upload_side_effect=None,
+                                 delete_side_effect=None, error=None,
+                                 **blob_kwargs):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        client = mock.Mock(
+            parallel_composite_upload_threshold=threshold,
+            parallel_composite_upload_component_size=component_size,
+            spec=['parallel_composite_upload_threshold',
+                  'parallel_composite_upload_component_size'])
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket, **blob_kwargs)
+        target = 'google.cloud.storage.blob.Blob.'
+        upload_patch = mock.patch(
+            target + '_upload_component', autospec=True,
+            side_effect=upload_side_effect)
+        compose_patch = mock.patch(target + 'compose', autospec=True)
+        delete_patch = mock.patch(
+            target + 'delete', autospec=True, side_effect=delete_side_effect)
+        upload_from_file_patch = mock.patch(
+            target + 'upload_from_file', autospec=True)
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(data)
+            with upload_patch as upload, compose_patch as compose:
+                with delete_patch as delete:
+                    with upload_from_file_patch as upload_from_file:
+                        if error is None:
+                            blob.upload_from_filename(
+                                temp.name, content_type='text/plain')
+                        else:
+                            with self.assertRaises(error):
+                                blob.upload_from_filename(
+                                    temp.name, content_type='text/plain')
+
+        return blob, client, (upload, compose, delete, upload_from_file)
+
+    def test_upload_from_filename_composite(self):
+        data = b'abcdefghij'
+        blob, client, mocks = self._upload_composite_helper(data)
+        upload, compose, delete, upload_from_file = mocks
+
+        upload_from_file.assert_not_called()
+        parts = sorted(
+            (call[0][0].name, call[0][4], call[0][5])
+            for call in upload.call_args_list)
+        self.assertEqual([part[1:] for part in parts],
+                         [(0, 3), (3, 3), (6, 3), (9, 1)])
+        token = parts[0][0].split('/')[1]
+        self.assertEqual(
+            parts[0][0],
+            '.parallel-composite-uploads/{}/0-00000'.format(token))
+        for call in upload.call_args_list:
+            self.assertIs(call[0][1], client)
+            self.assertEqual(call[0][3], 'text/plain')
+
+        compose.assert_called_once()
+        self.assertIs(compose.call_args[0][0], blob)
+        self.assertEqual(
+            [source.name for source in compose.call_args[0][1]],
+            [part[0] for part in parts])
+        self.assertEqual(blob.content_type, 'text/plain')
+        self.assertEqual(
+            sorted(call[0][0].name for call in delete.call_args_list),
+            [part[0] for part in parts])
+
+    @mock.patch('google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS', new=2)
+    def test_upload_from_filename_composite_hierarchical(self):
+        data = b'abcdefghij'
+        blob, _, mocks = self._upload_composite_helper(
+            data, component_size=2)
+        upload, compose, delete, _ = mocks
+
+        self.assertEqual(upload.call_count, 5)
+        calls = compose.call_args_list
+        # 5 parts -> 3 intermediates -> 2 intermediates -> the blob.
+        self.assertEqual(len(calls), 6)
+        self.assertIs(calls[-1][0][0], blob)
+        intermediates = sorted(
+            (call[0][0].name.split('/')[-1], len(call[0][1]))
+            for call in calls[:-1])
+        self.assertEqual(intermediates, [
+            ('1-00000', 2), ('1-00001', 2), ('1-00002', 1),
+            ('2-00000', 2), ('2-00001', 1),
+        ])
+        self.assertEqual(len(calls[-1][0][1]), 2)
+        self.assertEqual(delete.call_count, 10)
+
+    @mock.patch('google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS', new=2)
+    def test_upload_from_filename_composite_w_encryption_key(self):
+        KEY = b'01234567890123456789012345678901'  # 32 bytes
+        _, _, mocks = self._upload_composite_helper(
+            b'abcdefghij', encryption_key=KEY)
+        upload, compose, _, upload_from_file = mocks
+
+        upload_from_file.assert_not_called()
+        temporary = [call[0][0] for call in upload.call_args_list]
+        temporary.extend(call[0][0] for call in compose.call_args_list)
+        for blob in temporary:
+            self.assertEqual(blob._encryption_key, KEY)
+
+    def test_upload_from_filename_composite_w_kms_key_name(self):
+        KMS_RESOURCE = 'projects/p/locations/us/keyRings/r/cryptoKeys/k'
+        _, _, mocks = self._upload_composite_helper(
+            b'abcdefghij', kms_key_name=KMS_RESOURCE)
+        upload, _, _, _ = mocks
+
+        self.assertEqual(upload.call_count, 4)
+        for call in upload.call_args_list:
+            self.assertEqual(call[0][0].kms_key_name, KMS_RESOURCE)
+
+    def test_upload_from_filename_composite_failure_cleans_up(self):
+        from google.cloud.exceptions import NotFound
+
+        def upload(blob, *args):
+            if blob.name.endswith('-00001'):
+                raise ValueError('upload failed')
+
+        _, _, mocks = self._upload_composite_helper(
+            b'abcdefghij', upload_side_effect=upload,
+            delete_side_effect=NotFound('gone'), error=ValueError)
+        _, compose, delete, _ = mocks
+
+        compose.assert_not_called()
+        self.assertEqual(delete.call_count, 4)
+
+    def test_upload_from_filename_composite_below_threshold(self):
+        _, _, mocks = self._upload_composite_helper(b'abcd')
+        upload, compose, _, upload_from_file = mocks
+
+        upload.assert_not_called()
+        compose.assert_not_called()
+        upload_from_file.assert_called_once()
+
+    def test__upload_component(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        client = mock.sentinel.client
+        read = []
+
+        def upload_from_file(file_obj, size, content_type, client):
+            read.append(file_obj.read())
+
+        blob.upload_from_file = mock.Mock(
+            side_effect=upload_from_file, spec=[])
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'abcdefghij')
+            blob._upload_component(client, temp.name, 'text/plain', 3, 4)
+
+        self.assertEqual(read, [b'defg'])
+        self.assertEqual(blob.upload_from_file.call_args[1], {
+            'size': 4,
+            'content_type': 'text/plain',
+            'client': client,
+        })
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -2170,6 +2731,7 @@ class Test_Blob(unittest.TestCase):
                 ],
                 'destination': {},
             },
+            'headers': {},
             '_target_object': destination,
         })
 
@@ -2209,6 +2771,7 @@ class Test_Blob(unittest.TestCase):
                     'contentType': 'text/plain',
                 },
             },
+            'headers': {},
             '_target_object': destination,
         })
 
@@ -2253,9 +2816,38 @@ class Test_Blob(unittest.TestCase):
                     }
                 },
             },
+            'headers': {},
             '_target_object': destination,
         })
 
+    def test_compose_w_encryption_key_and_kms_key_name(self):
+        from google.cloud.storage.blob import _get_encryption_headers
+
+        KEY = b'01234567890123456789012345678901'  # 32 bytes
+        KMS_RESOURCE = (
+            "projects/test-project-123/"
+            "locations/us/"
+            "keyRings/test-ring/"
+            "cryptoKeys/test-key"
+        )
+        after = ({'status': http_client.OK}, {'etag': 'DEADBEEF'})
+        connection = _Connection(after, after)
+        client = _Client(connection)
+        bucket = _Bucket(client=client)
+        sources = [self._make_one('source', bucket=bucket)]
+        csek = self._make_one('csek', bucket=bucket, encryption_key=KEY)
+        kms = self._make_one('kms', bucket=bucket, kms_key_name=KMS_RESOURCE)
+
+        csek.compose(sources=sources)
+        kms.compose(sources=sources)
+
+        csek_kw, kms_kw = connection._requested
+        self.assertEqual(csek_kw['headers'], _get_encryption_headers(KEY))
+        self.assertEqual(csek_kw['query_params'], {})
+        self.assertEqual(kms_kw['headers'], {})
+        self.assertEqual(
+            kms_kw['query_params'], {'kmsKeyName': KMS_RESOURCE})
+
     def test_rewrite_response_without_resource(self):
         SOURCE_BLOB = 'source'
         DEST_BLOB = 'dest'
@@ -3042,6 +3634,90 @@ class Test__maybe_rewind(unittest.TestCase):
         stream.seek.assert_called_once_with(0, os.SEEK_SET)
 
 
+class Test__delete_if_exists(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.blob import _delete_if_exists
+
+        return _delete_if_exists(*args, **kwargs)
+
+    def _make_blob(self, user_project=None):
+        from google.cloud.storage.blob import Blob
+
+        bucket = _Bucket(name='bucket', user_project=user_project)
+        return Blob('blob-name', bucket=bucket)
+
+    def test_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        blob = self._make_blob()
+        client = mock.Mock(spec=[])
+        blob.bucket.delete_blob = mock.Mock(side_effect=NotFound('gone'))
+
+        self._call_fut(blob, client)
+
+        blob.bucket.delete_blob.assert_called_once_with(
+            'blob-name', client=client)
+
+    def test_w_if_generation_match(self):
+        blob = self._make_blob(user_project='user-project')
+        client = mock.Mock(spec=['_connection'])
+
+        self._call_fut(blob, client, if_generation_match='1234')
+
+        client._connection.api_request.assert_called_once_with(
+            method='DELETE', path='/b/bucket/o/blob-name',
+            query_params={
+                'ifGenerationMatch': 1234, 'userProject': 'user-project'},
+            _target_object=None)
+
+    def test_w_if_generation_match_replaced(self):
+        from google.cloud.exceptions import PreconditionFailed
+
+        blob = self._make_blob()
+        client = mock.Mock(spec=['_connection'])
+        client._connection.api_request.side_effect = PreconditionFailed(
+            'replaced')
+
+        self._call_fut(blob, client, if_generation_match=1234)
+
+        self.assertEqual(client._connection.api_request.call_count, 1)
+
+
+class Test__FileSlice(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _FileSlice
+
+        return _FileSlice
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read(self):
+        file_obj = io.BytesIO(b'abcdefghij')
+        file_slice = self._make_one(file_obj, 3, 4)
+
+        self.assertEqual(file_slice.read(3), b'def')
+        self.assertEqual(file_slice.tell(), 3)
+        self.assertEqual(file_slice.read(3), b'g')
+        self.assertEqual(file_slice.read(), b'')
+
+    def test_seek(self):
+        import os
+
+        file_obj = io.BytesIO(b'abcdefghij')
+        file_slice = self._make_one(file_obj, 3, 4)
+
+        self.assertEqual(file_slice.seek(0, os.SEEK_END), 4)
+        self.assertEqual(file_slice.seek(-2, os.SEEK_CUR), 2)
+        self.assertEqual(file_slice.read(), b'fg')
+        self.assertEqual(file_slice.seek(0), 0)
+        self.assertEqual(file_slice.read(), b'defg')
+
+
 class Test__raise_from_invalid_response(unittest.TestCase):
 
     @staticmethod
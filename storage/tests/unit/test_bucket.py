@@ -700,6 +700,70 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
 
+    def test_list_blobs_w_record_fields(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.storage.records import BlobRecord
+
+        NAME = 'name'
+        connection = _Connection({'items': [
+            {'name': 'a', 'size': '3', 'updated': '2018-10-01T12:00:00.000Z'},
+            {'name': 'b'},
+        ]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        iterator = bucket.list_blobs(record_fields=('name', 'size', 'updated'))
+        records = list(iterator)
+        self.assertEqual(iterator.record_class.fields,
+                         ('name', 'size', 'updated'))
+        self.assertIsInstance(records[0], BlobRecord)
+        self.assertEqual(records[0].name, 'a')
+        self.assertEqual(records[0].size, 3)
+        self.assertEqual(
+            records[0].updated,
+            datetime.datetime(2018, 10, 1, 12, tzinfo=UTC))
+        self.assertIsNone(records[1].size)
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {
+            'projection': 'noAcl',
+            'fields': 'items(name,size,updated),nextPageToken,prefixes',
+        })
+
+    def test_list_blobs_parallel(self):
+        NAME = 'name'
+        client = _Client(None)
+        bucket = self._make_one(client=client, name=NAME)
+
+        with mock.patch(
+                'google.cloud.storage.bucket.ParallelListing') as listing:
+            listing.return_value = [mock.sentinel.blob]
+            blobs = list(bucket.list_blobs_parallel(
+                prefix='logs/', max_workers=16, fields='items(name)'))
+
+        self.assertEqual(blobs, [mock.sentinel.blob])
+        listing.assert_called_once_with(
+            bucket, 'logs/', '/', 16, 1000, {
+                'versions': None,
+                'projection': 'noAcl',
+                'fields': 'items(name)',
+                'client': client,
+                'record_fields': None,
+            })
+
+    def test_list_blobs_parallel_w_record_fields(self):
+        client = _Client(None)
+        bucket = self._make_one(client=client, name='name')
+
+        with mock.patch(
+                'google.cloud.storage.bucket.ParallelListing') as listing:
+            listing.return_value = []
+            list(bucket.list_blobs_parallel(record_fields=['name', 'size']))
+
+        list_kwargs = listing.call_args[0][-1]
+        self.assertEqual(
+            list_kwargs['fields'], 'items(name,size),nextPageToken,prefixes')
+        self.assertEqual(list_kwargs['record_fields'], ['name', 'size'])
+
     def test_list_notifications(self):
         from google.cloud.storage.notification import BucketNotification
         from google.cloud.storage.notification import _TOPIC_REF_FMT
@@ -797,14 +861,18 @@ class Test_Bucket(unittest.TestCase):
                 {'name': BLOB_NAME2},
             ],
         }
-        DELETE_BLOB1_RESP = DELETE_BLOB2_RESP = {}
-        connection = _Connection(GET_BLOBS_RESP, DELETE_BLOB1_RESP,
-                                 DELETE_BLOB2_RESP)
+        connection = _Connection(GET_BLOBS_RESP)
         connection._delete_bucket = True
         client = _Client(connection)
         bucket = self._make_one(client=client, name=NAME)
-        result = bucket.delete(force=True)
+        batch = _Batch((204, {}), (204, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            result = bucket.delete(force=True)
         self.assertIsNone(result)
+        self.assertEqual(
+            [kw['path'] for kw in batch.requested],
+            ['/b/%s/o/%s' % (NAME, BLOB_NAME1),
+             '/b/%s/o/%s' % (NAME, BLOB_NAME2)])
         expected_cw = [{
             'method': 'DELETE',
             'path': bucket.path,
@@ -910,33 +978,172 @@ class Test_Bucket(unittest.TestCase):
         NAME = 'name'
         BLOB_NAME = 'blob-name'
         NONESUCH = 'nonesuch'
-        connection = _Connection({})
+        connection = _Connection()
         client = _Client(connection)
         bucket = self._make_one(client=client, name=NAME)
-        self.assertRaises(NotFound, bucket.delete_blobs, [BLOB_NAME, NONESUCH])
-        kw = connection._requested
+        batch = _Batch((204, {}), (404, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            self.assertRaises(
+                NotFound, bucket.delete_blobs, [BLOB_NAME, NONESUCH])
+        kw = batch.requested
         self.assertEqual(len(kw), 2)
         self.assertEqual(kw[0]['method'], 'DELETE')
         self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
+        self.assertEqual(connection._requested, [])
+
+    def test_delete_blobs_miss_no_on_error_deletes_later_blobs(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        batch = _Batch((404, {}), (204, {}), (404, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            with self.assertRaises(NotFound) as raised:
+                bucket.delete_blobs(['a', 'b', 'c'])
+        self.assertIn('/b/name/o/a', raised.exception.message)
+        self.assertEqual(
+            [kw['path'] for kw in batch.requested],
+            ['/b/%s/o/%s' % (NAME, name) for name in 'abc'])
 
     def test_delete_blobs_miss_w_on_error(self):
         NAME = 'name'
         BLOB_NAME = 'blob-name'
         NONESUCH = 'nonesuch'
-        connection = _Connection({})
+        connection = _Connection()
         client = _Client(connection)
         bucket = self._make_one(client=client, name=NAME)
         errors = []
-        bucket.delete_blobs([BLOB_NAME, NONESUCH], errors.append)
+        batch = _Batch((204, {}), (404, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            bucket.delete_blobs([BLOB_NAME, NONESUCH], errors.append)
         self.assertEqual(errors, [NONESUCH])
-        kw = connection._requested
-        self.assertEqual(len(kw), 2)
-        self.assertEqual(kw[0]['method'], 'DELETE')
-        self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
-        self.assertEqual(kw[1]['method'], 'DELETE')
-        self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
+        self.assertEqual(len(batch.requested), 2)
+
+    def test_delete_blobs_w_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        NAME = 'name'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        errors = []
+        batch = _Batch((403, {}), (404, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            with self.assertRaises(Forbidden):
+                bucket.delete_blobs(['a', 'b'], errors.append)
+        self.assertEqual(errors, ['b'])
+
+    def test_delete_blobs_many_batches_w_user_project(self):
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        USER_PROJECT = 'user-project-123'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(
+            client=client, name=NAME, user_project=USER_PROJECT)
+        bucket._MAX_BATCHED_REQUESTS = 2
+        blob = Blob('c', bucket=bucket)
+        batch = _Batch((204, {}), (204, {}), (204, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            bucket.delete_blobs(['a', 'b', blob])
+        self.assertEqual(batch.batches, 2)
+        self.assertEqual(
+            [kw['path'] for kw in batch.requested],
+            ['/b/%s/o/%s' % (NAME, name) for name in 'abc'])
+        self.assertEqual(
+            batch.requested[0]['query_params'], {'userProject': USER_PROJECT})
+
+    def test_delete_blobs_many_batches_miss_in_first(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        bucket._MAX_BATCHED_REQUESTS = 2
+        errors = []
+        batch = _Batch((404, {}), (204, {}), (204, {}), (404, {}), (204, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            bucket.delete_blobs(['a', 'b', 'c', 'd', 'e'], errors.append)
+        self.assertEqual(errors, ['a', 'd'])
+        self.assertEqual(batch.batches, 3)
+
+        batch = _Batch((404, {}), (204, {}), (204, {}), (204, {}), (204, {}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            with self.assertRaises(NotFound):
+                bucket.delete_blobs(['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(batch.batches, 3)
+        self.assertEqual(len(batch.requested), 5)
+
+    def test_delete_blobs_w_current_batch(self):
+        NAME = 'name'
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        client.current_batch = object()
+        bucket = self._make_one(client=client, name=NAME)
+        batch = _Batch()
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            bucket.delete_blobs(['a', 'b'])
+        self.assertEqual(batch.batches, 0)
+        self.assertEqual(
+            [kw['path'] for kw in connection._requested],
+            ['/b/%s/o/%s' % (NAME, name) for name in 'ab'])
+
+    def test_patch_blobs(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        client = _Client(_Connection())
+        bucket = self._make_one(client=client, name=NAME)
+        blobs = [Blob(name, bucket=bucket) for name in ('a', 'b', 'c')]
+        for blob in blobs:
+            blob.metadata = {'color': 'red'}
+        batch = _Batch(
+            (200, {'name': 'a', 'metadata': {'color': 'red'}}),
+            (404, {}),
+            (200, {'name': 'c', 'metadata': {'color': 'red'}}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            with self.assertRaises(NotFound):
+                bucket.patch_blobs(blobs)
+        kw = batch.requested
+        self.assertEqual(len(kw), 3)
+        self.assertEqual(kw[0]['method'], 'PATCH')
+        self.assertEqual(kw[0]['path'], '/b/%s/o/a' % NAME)
+        self.assertEqual(kw[0]['data'], {'metadata': {'color': 'red'}})
+        self.assertEqual(kw[0]['query_params'], {'projection': 'full'})
+        self.assertEqual(blobs[0]._changes, set())
+        self.assertEqual(blobs[0].name, 'a')
+        self.assertEqual(blobs[1]._changes, set(['metadata']))
+        self.assertEqual(blobs[2]._changes, set())
+
+    def test_save_blob_acls(self):
+        from google.cloud.storage.acl import _ACLEntity
+        from google.cloud.storage.blob import Blob
+
+        NAME = 'name'
+        client = _Client(_Connection())
+        bucket = self._make_one(client=client, name=NAME)
+        blobs = [Blob(name, bucket=bucket) for name in ('a', 'b')]
+        permissive = [{'entity': 'allUsers', 'role': _ACLEntity.READER_ROLE}]
+        for blob in blobs:
+            blob.acl.loaded = True
+            blob.acl.all().grant_read()
+        batch = _Batch((200, {'acl': permissive}), (200, {'acl': []}))
+        with mock.patch('google.cloud.storage.bucket.Batch', new=batch):
+            bucket.save_blob_acls(blobs)
+        kw = batch.requested
+        self.assertEqual(kw[0]['method'], 'PATCH')
+        self.assertEqual(kw[0]['path'], '/b/%s/o/a' % NAME)
+        self.assertEqual(kw[0]['data'], {'acl': permissive})
+        self.assertEqual(kw[1]['path'], '/b/%s/o/b' % NAME)
+        self.assertEqual(list(blobs[0].acl), permissive)
+        self.assertEqual(list(blobs[1].acl), [])
 
     def test_copy_blobs_wo_name(self):
         SOURCE = 'source'
@@ -2085,9 +2292,15 @@ class Test_Bucket(unittest.TestCase):
         bucket.acl.loaded = True
         bucket.default_object_acl.loaded = True
 
+        def save_blob_acls(blobs, client=None):
+            for blob in blobs:
+                blob.save(client=client)
+
         with mock.patch('google.cloud.storage.bucket._item_to_blob',
                         new=item_to_blob):
-            bucket.make_public(recursive=True)
+            with mock.patch.object(bucket, 'save_blob_acls',
+                                   side_effect=save_blob_acls):
+                bucket.make_public(recursive=True)
         self.assertEqual(list(bucket.acl), permissive)
         self.assertEqual(list(bucket.default_object_acl), [])
         self.assertEqual(_saved, [(bucket, BLOB_NAME, True, None)])
@@ -2226,9 +2439,15 @@ class Test_Bucket(unittest.TestCase):
         bucket.acl.loaded = True
         bucket.default_object_acl.loaded = True
 
+        def save_blob_acls(blobs, client=None):
+            for blob in blobs:
+                blob.save(client=client)
+
         with mock.patch('google.cloud.storage.bucket._item_to_blob',
                         new=item_to_blob):
-            bucket.make_private(recursive=True)
+            with mock.patch.object(bucket, 'save_blob_acls',
+                                   side_effect=save_blob_acls):
+                bucket.make_private(recursive=True)
         self.assertEqual(list(bucket.acl), no_permissions)
         self.assertEqual(list(bucket.default_object_acl), [])
         self.assertEqual(_saved, [(bucket, BLOB_NAME, False, None)])
@@ -2570,8 +2789,44 @@ class _Connection(object):
             return response
 
 
+class _Batch(object):
+    """Stand-in for the ``Batch`` class, answering requests in order."""
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._pending = []
+        self.requested = []
+        self.batches = 0
+
+    def __call__(self, client):
+        self.batches += 1
+        self._pending = []
+        return self
+
+    def api_request(self, **kw):
+        self.requested.append(kw)
+        self._pending.append(kw)
+
+    def finish(self, raise_exception=True):
+        import json
+        import requests
+
+        responses = []
+        for kw in self._pending:
+            status, body = self._responses.pop(0)
+            response = requests.Response()
+            response.status_code = status
+            response._content = json.dumps(body).encode('utf-8')
+            response.request = requests.Request(
+                kw['method'], 'http://example.com' + kw['path']).prepare()
+            responses.append(response)
+        return responses
+
+
 class _Client(object):
 
+    current_batch = None
+
     def __init__(self, connection, project=None):
         self._connection = connection
         self._base_connection = connection
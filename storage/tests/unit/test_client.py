@@ -74,6 +74,60 @@ class TestClient(unittest.TestCase):
         self.assertIs(client._connection.credentials, CREDENTIALS)
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
+        self.assertIsNone(client.parallel_composite_upload_threshold)
+        self.assertEqual(
+            client.parallel_composite_upload_component_size, 52428800)
+
+    def test_ctor_w_parallel_composite_upload(self):
+        PROJECT = 'PROJECT'
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(
+            project=PROJECT, credentials=CREDENTIALS,
+            parallel_composite_upload_threshold=1024,
+            parallel_composite_upload_component_size=256)
+
+        self.assertEqual(client.parallel_composite_upload_threshold, 1024)
+        self.assertEqual(
+            client.parallel_composite_upload_component_size, 256)
+
+    def test__http_w_pool_options(self):
+        from google.cloud.storage._http import PooledHTTPAdapter
+
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            pool_connections=2, pool_maxsize=64, pool_block=True,
+            keep_alive=False)
+
+        http = client._http
+
+        self.assertIs(client._http, http)
+        adapter = http.get_adapter('https://www.googleapis.com/storage/v1')
+        self.assertIsInstance(adapter, PooledHTTPAdapter)
+        self.assertIs(http.get_adapter('http://localhost:8080'), adapter)
+        stats = client.pool_stats()
+        self.assertEqual(stats['pool_connections'], 2)
+        self.assertEqual(stats['pool_maxsize'], 64)
+        self.assertTrue(stats['pool_block'])
+        self.assertFalse(stats['keep_alive'])
+        self.assertEqual(stats['requests'], 0)
+
+    def test_pool_stats_w_custom_http(self):
+        import requests
+
+        http = requests.Session()
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(), _http=http)
+
+        self.assertIs(client._http, http)
+        self.assertIsNone(client.pool_stats())
+
+    def test_pool_stats_w_non_session_http(self):
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            _http=mock.Mock(spec=['request']))
+
+        self.assertIsNone(client.pool_stats())
 
     def test_ctor_wo_project(self):
         from google.cloud.storage._http import Connection
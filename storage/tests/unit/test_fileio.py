@@ -0,0 +1,281 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+
+
+def _make_blob(data=b'', **properties):
+    blob = mock.Mock(
+        size=len(data), media_link='http://example.com/media/',
+        content_encoding=None, _CHUNK_SIZE_MULTIPLE=1,
+        spec=['size', 'media_link', 'content_encoding', 'reload',
+              'download_to_file', '_CHUNK_SIZE_MULTIPLE',
+              '_initiate_resumable_upload', '_set_properties'])
+    for name, value in properties.items():
+        setattr(blob, name, value)
+
+    def download_to_file(file_obj, client=None, start=None, end=None):
+        file_obj.write(data[start:end + 1])
+
+    blob.download_to_file.side_effect = download_to_file
+    return blob
+
+
+class _Upload(object):
+
+    def __init__(self, stream, chunk_size):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self.chunks = []
+        self.bytes_uploaded = 0
+        self.finished = False
+
+    def transmit_next_chunk(self, transport):
+        self._stream.seek(self.bytes_uploaded)
+        chunk = self._stream.read(self._chunk_size)
+        self.chunks.append(chunk)
+        self.bytes_uploaded += len(chunk)
+        self.finished = len(chunk) < self._chunk_size
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {'size': str(self.bytes_uploaded)}
+        return response
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_reloads(self):
+        blob = _make_blob(b'abc', size=None)
+        client = mock.sentinel.client
+
+        reader = self._make_one(blob, client=client)
+
+        blob.reload.assert_called_once_with(client=client)
+        reader.close()
+
+    def test_ctor_w_gzip(self):
+        blob = _make_blob(b'abc', content_encoding='gzip')
+
+        with self.assertRaises(ValueError):
+            self._make_one(blob)
+
+    def test_read(self):
+        data = b'abcdefghij'
+        blob = _make_blob(data)
+        client = mock.sentinel.client
+
+        with self._make_one(blob, chunk_size=4, client=client) as reader:
+            self.assertTrue(reader.readable())
+            self.assertTrue(reader.seekable())
+            self.assertEqual(reader.read(3), b'abc')
+            self.assertEqual(reader.read(3), b'd')
+            self.assertEqual(reader.read(), b'efghij')
+            self.assertEqual(reader.read(), b'')
+
+        ranges = [
+            (call[1]['start'], call[1]['end'])
+            for call in blob.download_to_file.call_args_list]
+        self.assertEqual(ranges, [(0, 3), (4, 7), (8, 9)])
+        self.assertIs(blob.download_to_file.call_args[1]['client'], client)
+
+    def test_seek(self):
+        data = b'abcdefghij'
+        blob = _make_blob(data)
+
+        with self._make_one(blob, chunk_size=4) as reader:
+            self.assertEqual(reader.seek(-3, io.SEEK_END), 7)
+            self.assertEqual(reader.read(2), b'hi')
+            self.assertEqual(reader.seek(-8, io.SEEK_CUR), 1)
+            self.assertEqual(reader.read(2), b'bc')
+            self.assertEqual(reader.tell(), 3)
+            with self.assertRaises(ValueError):
+                reader.seek(0, 3)
+
+        ranges = sorted(
+            (call[1]['start'], call[1]['end'])
+            for call in blob.download_to_file.call_args_list)
+        # The range read ahead after 7-9 is not needed.
+        self.assertEqual(ranges[0], (1, 4))
+        self.assertIn((7, 9), ranges)
+
+    def test_buffered(self):
+        data = b'line 1\nline 2\n'
+        blob = _make_blob(data)
+
+        with io.BufferedReader(self._make_one(blob, chunk_size=5)) as f:
+            self.assertEqual(list(f), [b'line 1\n', b'line 2\n'])
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_blob():
+        blob = _make_blob()
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     chunk_size):
+            uploads.append(_Upload(stream, chunk_size))
+            return uploads[-1], mock.sentinel.transport
+
+        blob._initiate_resumable_upload.side_effect = initiate
+        return blob, uploads
+
+    def test_ctor_w_invalid_chunk_size(self):
+        blob = _make_blob()
+        blob._CHUNK_SIZE_MULTIPLE = 256
+
+        with self.assertRaises(ValueError):
+            self._make_one(blob, chunk_size=1000)
+
+    def test_write(self):
+        blob, uploads = self._make_blob()
+        client = mock.sentinel.client
+
+        writer = self._make_one(
+            blob, chunk_size=4, content_type='text/plain', client=client)
+        self.assertTrue(writer.writable())
+        self.assertEqual(writer.write(b'abc'), 3)
+        blob._initiate_resumable_upload.assert_not_called()
+        writer.write(b'defghij')
+        self.assertEqual(uploads[0].chunks, [b'abcd', b'efgh'])
+        writer.close()
+
+        self.assertEqual(uploads[0].chunks, [b'abcd', b'efgh', b'ij'])
+        blob._initiate_resumable_upload.assert_called_once_with(
+            client, mock.ANY, 'text/plain', None, None, chunk_size=4)
+        blob._set_properties.assert_called_once_with({'size': '10'})
+        with self.assertRaises(ValueError):
+            writer.write(b'more')
+
+    def test_write_chunk_multiple(self):
+        blob, uploads = self._make_blob()
+
+        with self._make_one(blob, chunk_size=4) as writer:
+            writer.write(b'abcdefgh')
+
+        self.assertEqual(uploads[0].chunks, [b'abcd', b'efgh', b''])
+
+    def test_exit_w_exception_abandons_upload(self):
+        blob, uploads = self._make_blob()
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(blob, chunk_size=4) as writer:
+                writer.write(b'abcdef')
+                raise RuntimeError('stop')
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(uploads[0].chunks, [b'abcd'])
+        self.assertFalse(uploads[0].finished)
+        blob._set_properties.assert_not_called()
+        with self.assertRaises(ValueError):
+            writer.write(b'more')
+
+    def test_buffered_exit_w_exception_abandons_upload(self):
+        from google.cloud.storage.fileio import _BufferedBlobWriter
+        from google.cloud.storage.fileio import _TextBlobWriter
+
+        for text in (False, True):
+            blob, uploads = self._make_blob()
+            writer = self._make_one(blob, chunk_size=4)
+            file_obj = _BufferedBlobWriter(writer)
+            if text:
+                file_obj = _TextBlobWriter(file_obj, encoding='ascii')
+
+            with self.assertRaises(RuntimeError):
+                with file_obj:
+                    file_obj.write(b'abcdef' if not text else u'abcdef')
+                    file_obj.flush()
+                    raise RuntimeError('stop')
+
+            self.assertTrue(writer.closed)
+            self.assertTrue(file_obj.closed)
+            self.assertEqual(uploads[0].chunks, [b'abcd'])
+            blob._set_properties.assert_not_called()
+
+    def test_buffered_exit_completes_upload(self):
+        from google.cloud.storage.fileio import _BufferedBlobWriter
+
+        blob, uploads = self._make_blob()
+
+        with _BufferedBlobWriter(self._make_one(blob, chunk_size=4)) as f:
+            f.write(b'abcdef')
+
+        self.assertEqual(uploads[0].chunks, [b'abcd', b'ef'])
+        blob._set_properties.assert_called_once_with({'size': '6'})
+
+    def test_close_empty(self):
+        blob, uploads = self._make_blob()
+
+        self._make_one(blob, chunk_size=4).close()
+
+        self.assertEqual(uploads[0].chunks, [b''])
+        blob._set_properties.assert_called_once_with({'size': '0'})
+
+    def test_write_failure(self):
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.resumable_media import InvalidResponse
+
+        blob, uploads = self._make_blob()
+        response = mock.Mock(status_code=503, spec=['status_code', 'request'])
+        writer = self._make_one(blob, chunk_size=4)
+        writer.write(b'ab')
+        writer._initiate_upload()
+        uploads[0].transmit_next_chunk = mock.Mock(
+            side_effect=InvalidResponse(response, 'unavailable'))
+
+        with self.assertRaises(ServiceUnavailable):
+            writer.write(b'cd')
+
+
+class Test_SlidingBuffer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _SlidingBuffer
+
+        return _SlidingBuffer()
+
+    def test_read_and_discard(self):
+        buffer_ = self._make_one()
+        buffer_.write(b'abcdef')
+
+        self.assertEqual(buffer_.read(4), b'abcd')
+        self.assertEqual(len(buffer_), 2)
+        buffer_.discard(3)
+        buffer_.seek(3)
+        self.assertEqual(buffer_.read(), b'def')
+        self.assertEqual(buffer_.tell(), 6)
+        with self.assertRaises(ValueError):
+            buffer_.seek(2)
@@ -0,0 +1,184 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+
+_RESOURCES = [
+    {'name': 'a', 'size': '3', 'updated': '2018-10-01T12:00:00.000Z'},
+    {'name': 'b', 'size': '5'},
+]
+
+
+class Test_record_class(unittest.TestCase):
+
+    def _call_fut(self, fields):
+        from google.cloud.storage.records import record_class
+
+        return record_class(fields)
+
+    def test_cached(self):
+        from google.cloud.storage.records import BlobRecord
+
+        cls = self._call_fut(['name', 'size'])
+
+        self.assertTrue(issubclass(cls, BlobRecord))
+        self.assertEqual(cls.fields, ('name', 'size'))
+        self.assertIs(self._call_fut(('name', 'size')), cls)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(['name', 'acl'])
+
+    def test_no_fields(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([])
+
+
+class TestBlobRecord(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class(fields=('name', 'size', 'updated')):
+        from google.cloud.storage.records import record_class
+
+        return record_class(fields)
+
+    def test_from_api_repr(self):
+        from google.cloud._helpers import UTC
+
+        record = self._get_target_class().from_api_repr(_RESOURCES[0])
+
+        self.assertEqual(record.name, 'a')
+        self.assertEqual(record.size, 3)
+        self.assertEqual(
+            record.updated, datetime.datetime(2018, 10, 1, 12, tzinfo=UTC))
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.content_type = 'text/plain'
+
+    def test_missing_properties(self):
+        record = self._get_target_class().from_api_repr({'name': 'a'})
+
+        self.assertIsNone(record.size)
+        self.assertIsNone(record.updated)
+
+    def test_eq_and_repr(self):
+        klass = self._get_target_class(('name', 'size'))
+        record = klass.from_api_repr(_RESOURCES[1])
+
+        self.assertEqual(record, klass.from_api_repr(_RESOURCES[1]))
+        self.assertNotEqual(record, klass.from_api_repr(_RESOURCES[0]))
+        self.assertNotEqual(record, object())
+        self.assertEqual(repr(record), "<BlobRecord: name='b', size=5>")
+
+
+class Test_api_fields(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud.storage.records import api_fields
+
+        self.assertEqual(
+            api_fields(['name', 'time_created']),
+            'items(name,timeCreated),nextPageToken,prefixes')
+
+
+def _make_iterator(fields):
+    from google.cloud.storage.records import record_class
+
+    klass = record_class(fields)
+    iterator = mock.MagicMock(record_class=klass)
+    iterator.__iter__.return_value = iter(
+        [klass.from_api_repr(resource) for resource in _RESOURCES])
+    return iterator
+
+
+@unittest.skipIf(pandas is None, 'Requires `pandas`')
+class Test_to_dataframe(unittest.TestCase):
+
+    def _call_fut(self, records, fields=None):
+        from google.cloud.storage.records import to_dataframe
+
+        return to_dataframe(records, fields=fields)
+
+    def test_from_iterator(self):
+        frame = self._call_fut(_make_iterator(('name', 'size', 'updated')))
+
+        self.assertEqual(list(frame.columns), ['name', 'size', 'updated'])
+        self.assertEqual(list(frame['name']), ['a', 'b'])
+        self.assertEqual(list(frame['size']), [3, 5])
+        self.assertTrue(pandas.isnull(frame['updated'][1]))
+
+    def test_from_records(self):
+        records = list(_make_iterator(('name', 'size')))
+
+        frame = self._call_fut(records)
+
+        self.assertEqual(list(frame.columns), ['name', 'size'])
+        self.assertEqual(len(frame), 2)
+
+    def test_from_blobs_w_fields(self):
+        from google.cloud.storage.blob import Blob
+
+        blobs = [Blob(name, bucket=None) for name in ('a', 'b')]
+
+        frame = self._call_fut(blobs, fields=['name'])
+
+        self.assertEqual(list(frame['name']), ['a', 'b'])
+
+    def test_empty(self):
+        frame = self._call_fut([])
+
+        self.assertEqual(len(frame), 0)
+
+    def test_without_pandas(self):
+        with mock.patch('google.cloud.storage.records.pandas', new=None):
+            with self.assertRaises(ValueError):
+                self._call_fut([])
+
+
+@unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+class Test_to_arrow(unittest.TestCase):
+
+    def _call_fut(self, records, fields=None):
+        from google.cloud.storage.records import to_arrow
+
+        return to_arrow(records, fields=fields)
+
+    def test_from_iterator(self):
+        table = self._call_fut(_make_iterator(('name', 'size', 'updated')))
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.names, ['name', 'size', 'updated'])
+        self.assertEqual(table.schema.field_by_name('size').type,
+                         pyarrow.int64())
+        self.assertEqual(table.schema.field_by_name('updated').type,
+                         pyarrow.timestamp('us', tz='UTC'))
+        self.assertEqual(table.column(1).to_pylist(), [3, 5])
+
+    def test_without_pyarrow(self):
+        with mock.patch('google.cloud.storage.records.pyarrow', new=None):
+            with self.assertRaises(ValueError):
+                self._call_fut([])
@@ -0,0 +1,262 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_retry():
+    from google.api_core import retry
+    from google.cloud.storage.transfer_manager import _RETRYABLE_TYPES
+
+    return retry.Retry(
+        predicate=retry.if_exception_type(*_RETRYABLE_TYPES),
+        initial=0.0, maximum=0.0)
+
+
+class Test__scale_deadline(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(retry_, deadline, size):
+        from google.cloud.storage.transfer_manager import _scale_deadline
+
+        return _scale_deadline(retry_, deadline, size)
+
+    def test_w_size(self):
+        from google.api_core import retry
+        from google.cloud.storage.transfer_manager import MIN_BYTES_PER_SECOND
+
+        retry_ = mock.Mock(spec=['with_deadline'])
+
+        scaled = self._call_fut(retry_, 120.0, 10 * MIN_BYTES_PER_SECOND)
+
+        self.assertIs(scaled, retry_.with_deadline.return_value)
+        retry_.with_deadline.assert_called_once_with(130.0)
+        self.assertIsInstance(
+            self._call_fut(retry.Retry(), 1.0, 1), retry.Retry)
+
+    def test_wo_size(self):
+        retry_ = mock.Mock(spec=['with_deadline'])
+
+        self._call_fut(retry_, 120.0, None)
+
+        retry_.with_deadline.assert_called_once_with(120.0)
+
+    def test_wo_deadline(self):
+        retry_ = mock.Mock(spec=['with_deadline'])
+
+        self.assertIs(self._call_fut(retry_, None, 1024), retry_)
+        retry_.with_deadline.assert_not_called()
+
+
+class TestTransferManager(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import TransferManager
+
+        return TransferManager
+
+    def _make_one(self, *args, **kw):
+        kw.setdefault('retry', _make_retry())
+        return self._get_target_class()(*args, **kw)
+
+    def _make_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
+    @staticmethod
+    def _make_client():
+        return mock.Mock(_http=mock.Mock(spec=['request']), spec=['_http'])
+
+    @staticmethod
+    def _make_blob(name, data=b'', side_effect=()):
+        side_effect = list(side_effect)
+
+        def download_to_filename(filename, client=None):
+            if side_effect:
+                raise side_effect.pop(0)
+            with open(filename, 'wb') as file_obj:
+                file_obj.write(data)
+
+        def upload_from_filename(filename, client=None):
+            if side_effect:
+                raise side_effect.pop(0)
+
+        blob = mock.Mock(spec=['name', 'size', 'download_to_filename',
+                               'upload_from_filename'])
+        blob.name = name
+        blob.size = len(data)
+        blob.download_to_filename.side_effect = download_to_filename
+        blob.upload_from_filename.side_effect = upload_from_filename
+        return blob
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.transfer_manager import DEFAULT_DEADLINE
+        from google.cloud.storage.transfer_manager import DEFAULT_RETRY
+
+        manager = self._get_target_class()(self._make_client())
+
+        self.assertIs(manager._retry, DEFAULT_RETRY)
+        self.assertEqual(manager._deadline, DEFAULT_DEADLINE)
+        self.assertEqual(manager._max_workers, 8)
+        self.assertEqual(manager.bytes_transferred, 0)
+        self.assertEqual(manager.elapsed, 0.0)
+        self.assertIsNone(manager.throughput)
+
+    def test_upload_directory(self):
+        source = self._make_directory()
+        os.mkdir(os.path.join(source, 'sub'))
+        for name, data in (('a.txt', b'abc'), ('sub/b.txt', b'de')):
+            with open(os.path.join(source, *name.split('/')), 'wb') as f:
+                f.write(data)
+        client = self._make_client()
+        blobs = {}
+
+        def blob(name):
+            return blobs.setdefault(name, self._make_blob(name))
+
+        bucket = mock.Mock(spec=['blob'])
+        bucket.blob.side_effect = blob
+        progress = []
+        manager = self._make_one(client, progress_callback=progress.append)
+
+        with mock.patch('time.time', side_effect=[10.0] + [15.0] * 8):
+            results = manager.upload_directory(source, bucket, 'backup/')
+
+        self.assertEqual(
+            [result.blob.name for result in results],
+            ['backup/a.txt', 'backup/sub/b.txt'])
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(
+            [result.bytes_transferred for result in results], [3, 2])
+        blobs['backup/a.txt'].upload_from_filename.assert_called_once_with(
+            os.path.join(source, 'a.txt'), client=client)
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(manager.files_transferred, 2)
+        self.assertEqual(manager.bytes_transferred, 5)
+        self.assertEqual(manager.elapsed, 5.0)
+        self.assertEqual(manager.throughput, 1.0)
+
+    def test_download_prefix(self):
+        destination = self._make_directory()
+        blobs = [
+            self._make_blob('logs/', b''),
+            self._make_blob('logs/a.txt', b'abc'),
+            self._make_blob('logs/2018/b.txt', b'de'),
+        ]
+        bucket = mock.Mock(spec=['list_blobs'])
+        bucket.list_blobs.return_value = iter(blobs)
+        client = self._make_client()
+        manager = self._make_one(client)
+
+        results = manager.download_prefix(bucket, 'logs/', destination)
+
+        bucket.list_blobs.assert_called_once_with(
+            prefix='logs/', client=client)
+        self.assertEqual(
+            [result.filename for result in results],
+            [os.path.join(destination, 'a.txt'),
+             os.path.join(destination, '2018', 'b.txt')])
+        with open(os.path.join(destination, '2018', 'b.txt'), 'rb') as f:
+            self.assertEqual(f.read(), b'de')
+        blobs[0].download_to_filename.assert_not_called()
+        self.assertEqual(manager.bytes_transferred, 5)
+
+    def test_download_prefix_outside_destination(self):
+        destination = self._make_directory()
+        blobs = [
+            self._make_blob('logs/a.txt', b'abc'),
+            self._make_blob('logs/../../etc/passwd', b'root'),
+        ]
+        bucket = mock.Mock(spec=['list_blobs'])
+        bucket.list_blobs.return_value = iter(blobs)
+        manager = self._make_one(self._make_client())
+
+        with self.assertRaises(ValueError):
+            manager.download_prefix(bucket, 'logs/', destination)
+
+        blobs[0].download_to_filename.assert_not_called()
+
+    def test_download_blobs_retries(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        destination = self._make_directory()
+        filename = os.path.join(destination, 'a.txt')
+        blob = self._make_blob(
+            'a.txt', b'abc', side_effect=[ServiceUnavailable('busy')])
+        manager = self._make_one(self._make_client())
+
+        result, = manager.download_blobs([(blob, filename)])
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.attempts, 2)
+        self.assertEqual(result.bytes_transferred, 3)
+
+    def test_transfer_scales_deadline(self):
+        from google.api_core import retry
+
+        source = self._make_directory()
+        filename = os.path.join(source, 'a.txt')
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(b'abc')
+        retry_ = retry.Retry()
+        manager = self._make_one(
+            self._make_client(), retry=retry_, deadline=30.0)
+        scale = mock.patch(
+            'google.cloud.storage.transfer_manager._scale_deadline',
+            wraps=lambda retry_, deadline, size: retry_)
+
+        with scale as scale_deadline:
+            manager.upload_files([(filename, self._make_blob('a.txt'))])
+
+        scale_deadline.assert_called_once_with(retry_, 30.0, 3)
+
+    def test_upload_files_failure(self):
+        from google.cloud.exceptions import Forbidden
+
+        source = self._make_directory()
+        filenames = []
+        for name in ('a.txt', 'b.txt'):
+            filename = os.path.join(source, name)
+            with open(filename, 'wb') as file_obj:
+                file_obj.write(b'abc')
+            filenames.append(filename)
+        error = Forbidden('no')
+        blobs = [
+            self._make_blob('a.txt', side_effect=[error]),
+            self._make_blob('b.txt'),
+        ]
+        manager = self._make_one(self._make_client())
+
+        results = manager.upload_files(zip(filenames, blobs))
+
+        self.assertFalse(results[0].succeeded)
+        self.assertIs(results[0].exception, error)
+        self.assertEqual(results[0].attempts, 1)
+        self.assertTrue(results[1].succeeded)
+        self.assertEqual(manager.files_failed, 1)
+        self.assertEqual(manager.files_transferred, 1)
+        self.assertEqual(manager.bytes_transferred, 3)
+
+    def test_upload_files_empty(self):
+        manager = self._make_one(self._make_client())
+
+        self.assertEqual(manager.upload_files([]), [])
+        self.assertEqual(manager.elapsed, 0.0)